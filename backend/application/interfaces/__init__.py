@@ -1,10 +1,22 @@
 from backend.application.interfaces.banner import BannerDeleter, BannerReader, BannerSaver, BannerUpdater
+from backend.application.interfaces.catalog import CatalogChangeFeed, CatalogVersionBumper, CatalogVersionReader
 from backend.application.interfaces.category import CategoryDeleter, CategoryReader, CategorySaver, CategoryUpdater
 from backend.application.interfaces.city import CityDeleter, CityReader, CitySaver
 from backend.application.interfaces.db_connection import AsyncConnection, AsyncTransaction
+from backend.application.interfaces.job import JobQueue
 from backend.application.interfaces.keyboard import Keyboard, KeyboardBuilder
+from backend.application.interfaces.media import (
+    MediaObjectDeleter,
+    MediaObjectReader,
+    MediaObjectSaver,
+    MediaReferenceDeleter,
+    MediaReferenceSaver,
+    MediaStorage,
+    MediaUrlSigner,
+)
+from backend.application.interfaces.reference_data import ReferenceDataCache
 from backend.application.interfaces.s3client import S3Client
-from backend.application.interfaces.store import StoreDeleter, StoreReader, StoreSaver, StoreUpdater
+from backend.application.interfaces.store import StoreDeleter, StoreDetailsCache, StoreReader, StoreSaver, StoreUpdater
 from backend.application.interfaces.store_category import StoreCategoryDeleter, StoreCategoryReader, StoreCategorySaver
 from backend.application.interfaces.store_city import StoreCityDeleter, StoreCityReader, StoreCitySaver
 from backend.application.interfaces.store_resource import StoreRecourceDeleter, StoreRecourceSaver, StoreResourceReader
@@ -17,6 +29,9 @@ __all__ = [
     'BannerReader',
     'BannerSaver',
     'BannerUpdater',
+    'CatalogChangeFeed',
+    'CatalogVersionBumper',
+    'CatalogVersionReader',
     'CategoryDeleter',
     'CategoryReader',
     'CategorySaver',
@@ -25,6 +40,15 @@ __all__ = [
     'CityReader',
     'CitySaver',
     'CityUpdater',
+    'JobQueue',
+    'MediaObjectDeleter',
+    'MediaObjectReader',
+    'MediaObjectSaver',
+    'MediaReferenceDeleter',
+    'MediaReferenceSaver',
+    'MediaStorage',
+    'MediaUrlSigner',
+    'ReferenceDataCache',
     'StoreCategoryDeleter',
     'StoreCategoryReader',
     'StoreCategorySaver',
@@ -32,6 +56,7 @@ __all__ = [
     'StoreCityReader',
     'StoreCitySaver',
     'StoreDeleter',
+    'StoreDetailsCache',
     'StoreReader',
     'StoreRecourceDeleter',
     'StoreRecourceSaver',
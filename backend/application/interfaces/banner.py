@@ -4,7 +4,6 @@ from typing import Protocol
 from uuid import UUID
 
 from backend.domain.entities.banner import Banner
-from backend.domain.entities.media import BannerMediaName, Media
 
 
 class BannerReader(Protocol):
@@ -14,19 +13,19 @@ class BannerReader(Protocol):
     @abstractmethod
     async def get_all(self) -> Collection[Banner]: ...
 
+    @abstractmethod
+    async def get_feed_json(self) -> bytes: ...
+
 
 class BannerSaver(Protocol):
     @abstractmethod
-    async def save(self, banner: Banner, pc_media: Media, mobile_media: Media, bucket: str) -> None: ...
+    async def save(self, banner: Banner) -> None: ...
 
 
 class BannerUpdater(Protocol):
     @abstractmethod
     async def update(self, banner: Banner) -> None: ...
 
-    @abstractmethod
-    async def update_media(self, banner: Banner, media: Media, media_name: BannerMediaName, bucket: str) -> None: ...
-
 
 class BannerDeleter(Protocol):
     @abstractmethod
@@ -0,0 +1,29 @@
+from abc import abstractmethod
+from collections.abc import Awaitable, Callable, Collection, Mapping
+from typing import Protocol
+from uuid import UUID
+
+from backend.domain.entities.catalog import CatalogChange, CatalogEntity
+
+
+class CatalogVersionBumper(Protocol):
+    @abstractmethod
+    async def bump(
+        self,
+        entities: Collection[CatalogEntity],
+        store_id: UUID | None = None,
+        store_deleted: bool = False,
+    ) -> CatalogChange | None: ...
+
+
+class CatalogVersionReader(Protocol):
+    @abstractmethod
+    def get_versions(self) -> Mapping[CatalogEntity, int] | None: ...
+
+    @abstractmethod
+    def get_store_version(self, store_id: UUID) -> int: ...
+
+
+class CatalogChangeFeed(Protocol):
+    @abstractmethod
+    def add_listener(self, listener: Callable[[CatalogChange], Awaitable[None]]) -> None: ...
@@ -0,0 +1,8 @@
+from abc import abstractmethod
+from collections.abc import Mapping
+from typing import Any, Protocol
+
+
+class JobQueue(Protocol):
+    @abstractmethod
+    async def enqueue(self, name: str, payload: Mapping[str, Any]) -> None: ...
@@ -0,0 +1,55 @@
+from abc import abstractmethod
+from collections.abc import Collection, Mapping
+from datetime import datetime
+from typing import Protocol
+from uuid import UUID
+
+from backend.domain.entities.cache import CacheStats
+from backend.domain.entities.media import Media
+
+
+class MediaStorage(Protocol):
+    @abstractmethod
+    async def get_staged_before(self, created_before: datetime) -> Collection[str]: ...
+
+    @abstractmethod
+    async def discard(self, file_names: Collection[str]) -> None: ...
+
+
+class MediaObjectReader(Protocol):
+    @abstractmethod
+    async def get_by_digest(self, digest: str) -> Media | None: ...
+
+    @abstractmethod
+    async def get_by_source(self, source_id: str) -> Media | None: ...
+
+
+class MediaObjectSaver(Protocol):
+    @abstractmethod
+    async def save(self, media: Media, source_id: str) -> None: ...
+
+
+class MediaObjectDeleter(Protocol):
+    @abstractmethod
+    async def delete_unreferenced(self, used_before: datetime) -> Collection[Media]: ...
+
+
+class MediaReferenceSaver(Protocol):
+    @abstractmethod
+    async def save_many(self, owner_id: UUID, media: Mapping[str, Media]) -> None: ...
+
+
+class MediaReferenceDeleter(Protocol):
+    @abstractmethod
+    async def delete_by_owner(self, owner_id: UUID) -> None: ...
+
+
+class MediaUrlSigner(Protocol):
+    @abstractmethod
+    def get_window(self) -> int: ...
+
+    @abstractmethod
+    async def sign_many(self, file_names: Collection[str]) -> Mapping[str, str]: ...
+
+    @abstractmethod
+    def get_stats(self) -> CacheStats: ...
@@ -0,0 +1,14 @@
+from abc import abstractmethod
+from collections.abc import Collection
+from typing import Protocol
+
+from backend.domain.entities.cache import CacheStats
+from backend.domain.entities.catalog import CatalogEntity
+
+
+class ReferenceDataCache(Protocol):
+    @abstractmethod
+    def invalidate(self, entity: CatalogEntity) -> None: ...
+
+    @abstractmethod
+    def get_stats(self) -> Collection[CacheStats]: ...
@@ -1,4 +1,6 @@
 from abc import abstractmethod
+from collections.abc import AsyncIterable, Collection
+from datetime import datetime
 from io import BytesIO
 from pathlib import Path
 from typing import Protocol
@@ -8,7 +10,25 @@ class S3Client(Protocol):
     base_path: Path
 
     @abstractmethod
-    async def save(self, bucket: str, file_name: str, data: BytesIO) -> None: ...
+    async def save(self, bucket: str, file_name: str, data: BytesIO, cache_control: str | None = None) -> None: ...
+
+    @abstractmethod
+    async def save_stream(
+        self,
+        bucket: str,
+        file_name: str,
+        stream: AsyncIterable[bytes],
+        cache_control: str | None = None,
+    ) -> int: ...
+
+    @abstractmethod
+    async def move(self, bucket: str, source_file_name: str, file_name: str) -> bool: ...
+
+    @abstractmethod
+    async def get_modified_before(self, bucket: str, prefix: str, modified_before: datetime) -> Collection[str]: ...
+
+    @abstractmethod
+    async def delete_many(self, bucket: str, file_names: Collection[str]) -> None: ...
 
     @abstractmethod
     async def get_temporary_url(self, bucket: str, file_name: str) -> str: ...
@@ -1,10 +1,11 @@
 from abc import abstractmethod
-from collections.abc import Collection
+from collections.abc import Collection, Mapping
 from typing import Protocol
 from uuid import UUID
 
-from backend.domain.entities.media import Media, StoreMediaName
-from backend.domain.entities.store import Store, StoreDetails
+from backend.domain.entities.cache import CacheStats
+from backend.domain.entities.pagination import Pagination
+from backend.domain.entities.store import Store, StoreCursor, StoreDetails, StoreSearchMode
 
 
 class StoreReader(Protocol):
@@ -14,39 +15,68 @@ class StoreReader(Protocol):
     @abstractmethod
     async def get_with_relations(self, store_id: UUID) -> StoreDetails: ...
 
+    @abstractmethod
+    async def get_many_with_relations(self, store_ids: Collection[UUID]) -> Collection[StoreDetails]: ...
+
     @abstractmethod
     async def get_all(self) -> Collection[Store]: ...
 
+    @abstractmethod
+    async def get_page(
+        self,
+        page_size: int,
+        offset: int = 0,
+        after: StoreCursor | None = None,
+    ) -> Pagination[Store]: ...
+
     @abstractmethod
     async def get_by_filter(
         self,
         store_title: str | None,
         city_title: str | None,
         categories_title: Collection[str] | None,
-    ) -> Collection[Store]: ...
+        page_size: int,
+        offset: int = 0,
+        search_mode: StoreSearchMode = StoreSearchMode.SUBSTRING,
+    ) -> Pagination[Store]: ...
 
 
 class StoreSaver(Protocol):
     @abstractmethod
-    async def save(
-        self,
-        store: Store,
-        preview_media_pc: Media,
-        preview_media_mobile: Media,
-        main_media_pc: Media,
-        main_media_mobile: Media,
-        bucket: str,
-    ) -> None: ...
+    async def save(self, store: Store) -> bool: ...
 
 
 class StoreUpdater(Protocol):
     @abstractmethod
     async def update(self, store: Store) -> None: ...
 
-    @abstractmethod
-    async def update_media(self, store: Store, media: Media, media_name: StoreMediaName, bucket: str) -> None: ...
-
 
 class StoreDeleter(Protocol):
     @abstractmethod
     async def delete(self, store: Store) -> None: ...
+
+
+class StoreDetailsCache(Protocol):
+    @abstractmethod
+    async def get(self, store_id: UUID) -> StoreDetails | None: ...
+
+    @abstractmethod
+    async def get_many(self, store_ids: Collection[UUID]) -> dict[UUID, StoreDetails]: ...
+
+    @abstractmethod
+    async def get_generations(self, store_ids: Collection[UUID]) -> Mapping[UUID, str]: ...
+
+    @abstractmethod
+    async def set(self, details: StoreDetails, generation: str) -> None: ...
+
+    @abstractmethod
+    async def set_many(self, details: Collection[StoreDetails], generations: Mapping[UUID, str]) -> None: ...
+
+    @abstractmethod
+    async def invalidate(self, store_id: UUID) -> None: ...
+
+    @abstractmethod
+    async def invalidate_all(self) -> None: ...
+
+    @abstractmethod
+    async def get_stats(self) -> CacheStats: ...
@@ -7,9 +7,6 @@ from backend.domain.entities.store_category import StoreCategory
 
 
 class StoreCategoryReader(Protocol):
-    @abstractmethod
-    async def relationship_exists(self, store_id: UUID, category_id: UUID) -> bool: ...
-
     @abstractmethod
     async def get_by_store_category_ids(self, store_id: UUID, category_id: UUID) -> StoreCategory: ...
 
@@ -27,4 +24,4 @@ class StoreCategorySaver(Protocol):
 
 class StoreCategoryDeleter(Protocol):
     @abstractmethod
-    async def delete(self, store_category: StoreCategory) -> None: ...
+    async def delete(self, store_id: UUID, category_id: UUID) -> bool: ...
@@ -7,9 +7,6 @@ from backend.domain.entities.store_city import StoreCity
 
 
 class StoreCityReader(Protocol):
-    @abstractmethod
-    async def relationship_exists(self, store_id: UUID, city_id: UUID) -> bool: ...
-
     @abstractmethod
     async def get_by_store_city_ids(self, store_id: UUID, city_id: UUID) -> StoreCity: ...
 
@@ -27,4 +24,4 @@ class StoreCitySaver(Protocol):
 
 class StoreCityDeleter(Protocol):
     @abstractmethod
-    async def delete(self, store_city: StoreCity) -> None: ...
+    async def delete(self, store_id: UUID, city_id: UUID) -> bool: ...
@@ -0,0 +1,145 @@
+import json
+from collections.abc import Collection, Mapping
+from typing import Any
+from uuid import UUID
+
+from backend.application import interfaces
+from backend.domain.entities.banner import Banner
+from backend.domain.entities.media import (
+    BannerMediaName,
+    MediaAsset,
+    MediaType,
+    MediaVariant,
+    StoreMediaName,
+    get_derivative_file_name,
+    get_media_file_name,
+    parse_derivative_suffix,
+)
+from backend.domain.entities.store import Store
+
+
+class MediaUrlService:
+    def __init__(
+        self,
+        signer: interfaces.MediaUrlSigner,
+    ):
+        self._signer = signer
+        self._signed_feed: tuple[int, bytes, bytes] | None = None
+
+    def get_store_assets(self, store: Store) -> list[MediaAsset]:
+        return self.get_assets(
+            owner_id=store.id,
+            media={
+                StoreMediaName.PC_PREVIEW: store.preview_media_type,
+                StoreMediaName.MOBILE_PREVIEW: store.preview_media_type,
+                StoreMediaName.PC_MAIN: store.main_media_type,
+                StoreMediaName.MOBILE_MAIN: store.main_media_type,
+            },
+            media_files=store.media_files,
+            media_derivatives=store.media_derivatives,
+        )
+
+    def get_banner_assets(self, banner: Banner) -> list[MediaAsset]:
+        return self.get_assets(
+            owner_id=banner.id,
+            media={
+                BannerMediaName.PC: banner.media_type,
+                BannerMediaName.MOBILE: banner.media_type,
+            },
+            media_files=banner.media_files,
+            media_derivatives=banner.media_derivatives,
+        )
+
+    def get_assets(
+        self,
+        owner_id: UUID,
+        media: Mapping[StoreMediaName | BannerMediaName, MediaType],
+        media_files: Mapping[str, str],
+        media_derivatives: Mapping[str, Collection[str]],
+    ) -> list[MediaAsset]:
+        return [
+            self._get_asset(
+                file_name=get_media_file_name(
+                    owner_id=owner_id,
+                    media_name=media_name,
+                    extension=media_type,
+                    media_files=media_files,
+                ),
+                media_name=media_name,
+                derivatives=media_derivatives.get(media_name, ()),
+            )
+            for media_name, media_type in media.items()
+        ]
+
+    async def sign(self, assets: Collection[MediaAsset]) -> None:
+        urls = await self._signer.sign_many(
+            file_names=[
+                file_name
+                for asset in assets
+                for file_name in (asset.file_name, *(variant.file_name for variant in asset.variants))
+            ],
+        )
+        for asset in assets:
+            asset.url = urls[asset.file_name]
+            for variant in asset.variants:
+                variant.url = urls[variant.file_name]
+
+    async def get_links(self, assets: Collection[MediaAsset]) -> dict[str, str]:
+        urls = await self._signer.sign_many(file_names=[asset.file_name for asset in assets])
+        return {asset.name: urls[asset.file_name] for asset in assets}
+
+    async def sign_banners_feed(self, feed: bytes) -> bytes:
+        window = self._signer.get_window()
+        if self._signed_feed is not None and self._signed_feed[:2] == (window, feed):
+            return self._signed_feed[2]
+
+        banners = json.loads(feed)['banners']
+        media = [item for banner in banners for item in banner.get('media', ()) if 'file_name' in item]
+        urls = await self._signer.sign_many(
+            file_names=[
+                file_name
+                for item in media
+                for file_name in (item['file_name'], *(variant['file_name'] for variant in item['variants']))
+            ],
+        )
+
+        signed = json.dumps({'banners': [self._get_public_banner(banner, urls) for banner in banners]}).encode()
+        self._signed_feed = (window, feed, signed)
+        return signed
+
+    @staticmethod
+    def _get_public_banner(banner: Mapping[str, Any], urls: Mapping[str, str]) -> dict[str, Any]:
+        return {
+            'id': banner['id'],
+            'media_type': banner['media_type'],
+            'target_url': banner['target_url'],
+            'display_priority': banner['display_priority'],
+            'media': [
+                {
+                    'name': item['name'],
+                    'url': urls[item['file_name']],
+                    'variants': [
+                        {'width': variant['width'], 'format': variant['format'], 'url': urls[variant['file_name']]}
+                        for variant in item['variants']
+                    ],
+                }
+                for item in banner.get('media', ())
+                if 'file_name' in item
+            ],
+        }
+
+    @staticmethod
+    def _get_asset(file_name: str, media_name: str, derivatives: Collection[str]) -> MediaAsset:
+        variants = []
+        for suffix in derivatives:
+            width, image_format = parse_derivative_suffix(suffix)
+            variants.append(
+                MediaVariant(
+                    width=width,
+                    format=image_format,
+                    file_name=get_derivative_file_name(file_name, suffix),
+                ),
+            )
+        variants.sort(key=lambda variant: variant.width)
+
+        return MediaAsset(name=media_name, file_name=file_name, variants=variants)
@@ -1,18 +1,35 @@
-from collections.abc import Collection
-from typing import TypeVar
+import binascii
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from uuid import UUID
 
-from backend.domain.entities.pagination import Pagination
+from backend.domain import exceptions as domain_exceptions
+from backend.domain.entities.store import Store, StoreCursor
 
-T = TypeVar('T')
+# stores.display_priority is a Postgres int.
+MIN_DISPLAY_PRIORITY = -(2**31)
+MAX_DISPLAY_PRIORITY = 2**31 - 1
 
 
 class PaginationService:
     @staticmethod
-    def create_page(page: int, page_size: int, items: Collection[T]) -> Pagination[T]:
-        offset = (page - 1) * page_size
+    def get_offset(page: int, page_size: int) -> int:
+        return (page - 1) * page_size
 
-        return Pagination[T](
-            total=len(items),
-            size=page_size,
-            items=items[offset : offset + page_size],
-        )
+    @staticmethod
+    def encode_store_cursor(store: Store) -> str:
+        payload = json.dumps([store.display_priority, str(store.id)], separators=(',', ':'))
+        return urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    @staticmethod
+    def decode_store_cursor(cursor: str) -> StoreCursor:
+        try:
+            payload = urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            display_priority, store_id = json.loads(payload)
+            if type(display_priority) is not int or not isinstance(store_id, str):
+                raise domain_exceptions.InvalidPaginationCursorError
+            if not MIN_DISPLAY_PRIORITY <= display_priority <= MAX_DISPLAY_PRIORITY:
+                raise domain_exceptions.InvalidPaginationCursorError
+            return StoreCursor(display_priority=display_priority, id=UUID(store_id))
+        except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as exc:
+            raise domain_exceptions.InvalidPaginationCursorError from exc
@@ -3,8 +3,9 @@ from typing import Protocol
 from uuid import UUID
 
 from backend.application import interfaces
-from backend.config import Config
+from backend.application.services.media import MediaUrlService
 from backend.domain.entities.banner import Banner
+from backend.domain.entities.catalog import CatalogEntity
 from backend.domain.entities.media import BannerMediaName, Media
 
 
@@ -30,31 +31,59 @@ class GetBannersInteractor:
         return await self._reader.get_all()
 
 
+class GetBannersFeedInteractor:
+    def __init__(
+            self,
+            reader: interfaces.BannerReader,
+            media_urls: MediaUrlService,
+    ):
+        self._reader = reader
+        self._media_urls = media_urls
+
+    async def __call__(self) -> bytes:
+        feed = await self._reader.get_feed_json()
+        return await self._media_urls.sign_banners_feed(feed=feed)
+
+
 class SaveBannerInteractor:
     def __init__(
             self,
             saver: interfaces.BannerSaver,
-            uuid_generator: interfaces.UUIDGenerator,
-            config: Config,
+            conn: interfaces.AsyncConnection,
+            media_references: interfaces.MediaReferenceSaver,
+            versions: interfaces.CatalogVersionBumper,
     ):
         self._saver = saver
-        self._uuid_generator = uuid_generator
-        self._config = config
+        self._conn = conn
+        self._media_references = media_references
+        self._versions = versions
 
-    async def __call__(self, target_url: str, pc_media: Media, mobile_media: Media, display_priority: int) -> None:
+    async def __call__(
+            self,
+            banner_id: UUID,
+            target_url: str,
+            pc_media: Media,
+            mobile_media: Media,
+            display_priority: int,
+    ) -> None:
         banner = Banner(
-            id=self._uuid_generator(),
+            id=banner_id,
             target_url=target_url,
             media_type=pc_media.extension,
             display_priority=display_priority
         )
 
-        await self._saver.save(
-            banner=banner,
-            pc_media=pc_media,
-            mobile_media=mobile_media,
-            bucket=self._config.minio.bucket,
-        )
+        media = {
+            BannerMediaName.PC: pc_media,
+            BannerMediaName.MOBILE: mobile_media,
+        }
+        async with self._conn.transaction():
+            await self._media_references.save_many(owner_id=banner.id, media=media)
+
+        banner.media_files = {media_name: item.content_name for media_name, item in media.items()}
+        banner.media_derivatives = {media_name: list(item.derivatives) for media_name, item in media.items()}
+        await self._saver.save(banner=banner)
+        await self._versions.bump(entities=[CatalogEntity.BANNER])
 
 
 class UpdateBannerManager(interfaces.BannerReader, interfaces.BannerUpdater, Protocol): ...
@@ -64,13 +93,16 @@ class UpdateBannerUrlInteractor:
     def __init__(
             self,
             updater: UpdateBannerManager,
+            versions: interfaces.CatalogVersionBumper,
     ):
         self._updater = updater
+        self._versions = versions
 
     async def __call__(self, banner_id: UUID, target_url: str) -> Banner:
         banner = await self._updater.get_by_id(banner_id=banner_id)
         banner.target_url = target_url
         await self._updater.update(banner=banner)
+        await self._versions.bump(entities=[CatalogEntity.BANNER])
 
         return banner
 
@@ -79,13 +111,16 @@ class UpdateBannerDisplayPriorityInteractor:
     def __init__(
             self,
             updater: UpdateBannerManager,
+            versions: interfaces.CatalogVersionBumper,
     ):
         self._updater = updater
+        self._versions = versions
 
     async def __call__(self, banner_id: UUID, display_priority: int) -> Banner:
         banner = await self._updater.get_by_id(banner_id=banner_id)
         banner.display_priority = display_priority
         await self._updater.update(banner=banner)
+        await self._versions.bump(entities=[CatalogEntity.BANNER])
 
         return banner
 
@@ -94,20 +129,25 @@ class UpdatePcBannerInteractor:
     def __init__(
             self,
             updater: UpdateBannerManager,
-            config: Config,
+            conn: interfaces.AsyncConnection,
+            media_references: interfaces.MediaReferenceSaver,
+            versions: interfaces.CatalogVersionBumper,
     ):
         self._updater = updater
-        self._config = config
+        self._conn = conn
+        self._media_references = media_references
+        self._versions = versions
 
     async def __call__(self, banner_id: UUID, media: Media) -> Banner:
         banner = await self._updater.get_by_id(banner_id=banner_id)
         banner.media_type = media.extension
-        await self._updater.update_media(
-            banner=banner,
-            media=media,
-            media_name=BannerMediaName.PC,
-            bucket=self._config.minio.bucket,
-        )
+        async with self._conn.transaction():
+            await self._media_references.save_many(owner_id=banner.id, media={BannerMediaName.PC: media})
+
+        banner.media_files[BannerMediaName.PC] = media.content_name
+        banner.media_derivatives[BannerMediaName.PC] = list(media.derivatives)
+        await self._updater.update(banner=banner)
+        await self._versions.bump(entities=[CatalogEntity.BANNER])
         return banner
 
 
@@ -115,20 +155,25 @@ class UpdateMobileBannerInteractor:
     def __init__(
             self,
             updater: UpdateBannerManager,
-            config: Config,
+            conn: interfaces.AsyncConnection,
+            media_references: interfaces.MediaReferenceSaver,
+            versions: interfaces.CatalogVersionBumper,
     ):
         self._updater = updater
-        self._config = config
+        self._conn = conn
+        self._media_references = media_references
+        self._versions = versions
 
     async def __call__(self, banner_id: UUID, media: Media) -> Banner:
         banner = await self._updater.get_by_id(banner_id=banner_id)
         banner.media_type = media.extension
-        await self._updater.update_media(
-            banner=banner,
-            media=media,
-            media_name=BannerMediaName.MOBILE,
-            bucket=self._config.minio.bucket,
-        )
+        async with self._conn.transaction():
+            await self._media_references.save_many(owner_id=banner.id, media={BannerMediaName.MOBILE: media})
+
+        banner.media_files[BannerMediaName.MOBILE] = media.content_name
+        banner.media_derivatives[BannerMediaName.MOBILE] = list(media.derivatives)
+        await self._updater.update(banner=banner)
+        await self._versions.bump(entities=[CatalogEntity.BANNER])
         return banner
 
 
@@ -139,10 +184,19 @@ class DeleteBannerInteractor:
     def __init__(
             self,
             deleter: DeleteBannerManager,
+            conn: interfaces.AsyncConnection,
+            media_references: interfaces.MediaReferenceDeleter,
+            versions: interfaces.CatalogVersionBumper,
     ):
         self._deleter = deleter
+        self._conn = conn
+        self._media_references = media_references
+        self._versions = versions
 
     async def __call__(self, banner_id: UUID) -> Collection[Banner]:
         banner = await self._deleter.get_by_id(banner_id=banner_id)
+        async with self._conn.transaction():
+            await self._media_references.delete_by_owner(owner_id=banner.id)
         await self._deleter.delete(banner=banner)
+        await self._versions.bump(entities=[CatalogEntity.BANNER])
         return await self._deleter.get_all()
@@ -0,0 +1,23 @@
+from collections.abc import Collection
+
+from backend.application import interfaces
+from backend.domain.entities.cache import CacheStats
+
+
+class GetCacheStatsInteractor:
+    def __init__(
+        self,
+        store_details_cache: interfaces.StoreDetailsCache,
+        reference_cache: interfaces.ReferenceDataCache,
+        url_signer: interfaces.MediaUrlSigner,
+    ):
+        self._store_details_cache = store_details_cache
+        self._reference_cache = reference_cache
+        self._url_signer = url_signer
+
+    async def __call__(self) -> Collection[CacheStats]:
+        return [
+            await self._store_details_cache.get_stats(),
+            *self._reference_cache.get_stats(),
+            self._url_signer.get_stats(),
+        ]
@@ -3,6 +3,7 @@ from typing import Protocol
 from uuid import UUID
 
 from backend.application import interfaces
+from backend.domain.entities.catalog import CatalogEntity
 from backend.domain.entities.category import Category, CategorySelection
 
 
@@ -44,14 +45,20 @@ class SaveCategoriesInteractor:
         self,
         saver: interfaces.CategorySaver,
         uuid_generator: interfaces.UUIDGenerator,
+        versions: interfaces.CatalogVersionBumper,
+        reference_cache: interfaces.ReferenceDataCache,
     ):
         self._saver = saver
         self._uuid_generator = uuid_generator
+        self._versions = versions
+        self._reference_cache = reference_cache
 
     async def __call__(self, titles: str) -> None:
         categories = [Category(id=self._uuid_generator(), title=title.strip()) for title in titles.split('\n')]
 
         await self._saver.save(categories=categories)
+        self._reference_cache.invalidate(CatalogEntity.CATEGORY)
+        await self._versions.bump(entities=[CatalogEntity.CATEGORY])
 
 
 class DeleteCategoryManager(interfaces.CategoryReader, interfaces.CategoryDeleter, Protocol): ...
@@ -61,11 +68,20 @@ class DeleteCategoryInteractor:
     def __init__(
         self,
         deleter: DeleteCategoryManager,
+        store_details_cache: interfaces.StoreDetailsCache,
+        versions: interfaces.CatalogVersionBumper,
+        reference_cache: interfaces.ReferenceDataCache,
     ):
         self._deleter = deleter
+        self._store_details_cache = store_details_cache
+        self._versions = versions
+        self._reference_cache = reference_cache
 
     async def __call__(self, category_id: UUID) -> None:
         category = await self._deleter.get_by_id(category_id=category_id)
         await self._deleter.delete(category=category)
+        await self._store_details_cache.invalidate_all()
+        self._reference_cache.invalidate(CatalogEntity.CATEGORY)
+        await self._versions.bump(entities=[CatalogEntity.CATEGORY, CatalogEntity.STORE])
 
         return await self._deleter.get_all()
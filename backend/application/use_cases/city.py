@@ -3,6 +3,7 @@ from typing import Protocol
 from uuid import UUID
 
 from backend.application import interfaces
+from backend.domain.entities.catalog import CatalogEntity
 from backend.domain.entities.city import City, CitySelection
 
 
@@ -44,14 +45,20 @@ class SaveCitiesInteractor:
         self,
         saver: interfaces.CitySaver,
         uuid_generator: interfaces.UUIDGenerator,
+        versions: interfaces.CatalogVersionBumper,
+        reference_cache: interfaces.ReferenceDataCache,
     ):
         self._saver = saver
         self._uuid_generator = uuid_generator
+        self._versions = versions
+        self._reference_cache = reference_cache
 
     async def __call__(self, titles: str) -> None:
         cities = [City(id=self._uuid_generator(), title=title.strip()) for title in titles.split('\n')]
 
         await self._saver.save(cities=cities)
+        self._reference_cache.invalidate(CatalogEntity.CITY)
+        await self._versions.bump(entities=[CatalogEntity.CITY])
 
 
 class DeleteCityManager(interfaces.CityReader, interfaces.CityDeleter, Protocol): ...
@@ -61,11 +68,20 @@ class DeleteCityInteractor:
     def __init__(
         self,
         deleter: DeleteCityManager,
+        store_details_cache: interfaces.StoreDetailsCache,
+        versions: interfaces.CatalogVersionBumper,
+        reference_cache: interfaces.ReferenceDataCache,
     ):
         self._deleter = deleter
+        self._store_details_cache = store_details_cache
+        self._versions = versions
+        self._reference_cache = reference_cache
 
     async def __call__(self, city_id: UUID) -> Collection[City]:
         city = await self._deleter.get_by_id(city_id=city_id)
         await self._deleter.delete(city=city)
+        await self._store_details_cache.invalidate_all()
+        self._reference_cache.invalidate(CatalogEntity.CITY)
+        await self._versions.bump(entities=[CatalogEntity.CITY, CatalogEntity.STORE])
 
         return await self._deleter.get_all()
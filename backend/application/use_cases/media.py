@@ -0,0 +1,33 @@
+from datetime import UTC, datetime, timedelta
+
+from backend.application import interfaces
+from backend.config import Config
+
+
+class SweepMediaInteractor:
+    def __init__(
+        self,
+        media_storage: interfaces.MediaStorage,
+        media_objects: interfaces.MediaObjectDeleter,
+        conn: interfaces.AsyncConnection,
+        config: Config,
+    ):
+        self._media_storage = media_storage
+        self._media_objects = media_objects
+        self._conn = conn
+        self._config = config
+
+    async def __call__(self) -> None:
+        expired_before = datetime.now(tz=UTC) - timedelta(seconds=self._config.media.staging_ttl)
+
+        # The rows stay locked until the files are gone, so a concurrent dedup lookup waits and then re-uploads.
+        async with self._conn.transaction():
+            released = await self._media_objects.delete_unreferenced(used_before=expired_before)
+            await self._media_storage.discard(
+                file_names=[
+                    file_name for media in released for file_name in (media.file_name, *media.derivative_file_names)
+                ],
+            )
+
+        staged = await self._media_storage.get_staged_before(created_before=expired_before)
+        await self._media_storage.discard(file_names=staged)
@@ -5,10 +5,10 @@ from uuid import UUID
 
 from backend.application import interfaces
 from backend.application.services.pagination import PaginationService
-from backend.config import Config
+from backend.domain.entities.catalog import CatalogEntity
 from backend.domain.entities.media import Media, StoreMediaName
 from backend.domain.entities.pagination import Pagination
-from backend.domain.entities.store import Store, StoreDetails
+from backend.domain.entities.store import Store, StoreDetails, StoreSearchMode
 from backend.domain.entities.store_category import StoreCategory
 from backend.domain.entities.store_city import StoreCity
 from backend.domain.entities.store_resource import StoreResource
@@ -29,11 +29,42 @@ class GetStoreDetailsInteractor:
     def __init__(
         self,
         reader: interfaces.StoreReader,
+        cache: interfaces.StoreDetailsCache,
     ):
         self._reader = reader
+        self._cache = cache
 
     async def __call__(self, store_id: UUID) -> StoreDetails:
-        return await self._reader.get_with_relations(store_id=store_id)
+        details = await self._cache.get(store_id=store_id)
+        if details is None:
+            generations = await self._cache.get_generations(store_ids=[store_id])
+            details = await self._reader.get_with_relations(store_id=store_id)
+            await self._cache.set(details=details, generation=generations[store_id])
+
+        return details
+
+
+class GetStoresDetailsInteractor:
+    def __init__(
+        self,
+        reader: interfaces.StoreReader,
+        cache: interfaces.StoreDetailsCache,
+    ):
+        self._reader = reader
+        self._cache = cache
+
+    async def __call__(self, store_ids: Iterable[UUID]) -> list[StoreDetails]:
+        store_ids = list(dict.fromkeys(store_ids))
+
+        details = await self._cache.get_many(store_ids=store_ids)
+        missing_ids = [store_id for store_id in store_ids if store_id not in details]
+        if missing_ids:
+            generations = await self._cache.get_generations(store_ids=missing_ids)
+            loaded = await self._reader.get_many_with_relations(store_ids=missing_ids)
+            await self._cache.set_many(details=loaded, generations=generations)
+            details.update((item.store.id, item) for item in loaded)
+
+        return [details[store_id] for store_id in store_ids if store_id in details]
 
 
 class GetAllStoresInteractor:
@@ -45,9 +76,15 @@ class GetAllStoresInteractor:
         self._reader = reader
         self._pagination = pagination
 
-    async def __call__(self, page: int, page_size: int) -> Pagination[Store]:
-        stores = await self._reader.get_all()
-        return self._pagination.create_page(page=page, page_size=page_size, items=stores)
+    async def __call__(self, page: int, page_size: int, cursor: str | None = None) -> Pagination[Store]:
+        after = self._pagination.decode_store_cursor(cursor) if cursor else None
+        offset = 0 if after else self._pagination.get_offset(page=page, page_size=page_size)
+
+        stores = await self._reader.get_page(page_size=page_size, offset=offset, after=after)
+        if len(stores.items) == page_size:
+            stores.next_cursor = self._pagination.encode_store_cursor(store=stores.items[-1])
+
+        return stores
 
 
 class GetStoresByFilterInteractor:
@@ -66,16 +103,18 @@ class GetStoresByFilterInteractor:
         store_title: str | None,
         city_title: str | None,
         categories_title: str | None,
+        search_mode: StoreSearchMode = StoreSearchMode.SUBSTRING,
     ) -> Pagination[Store]:
         categories_title = categories_title.split(',') if categories_title else None
-        stores = await self._reader.get_by_filter(
+        return await self._reader.get_by_filter(
             store_title=store_title,
             city_title=city_title,
             categories_title=categories_title,
+            page_size=page_size,
+            offset=self._pagination.get_offset(page=page, page_size=page_size),
+            search_mode=search_mode,
         )
 
-        return self._pagination.create_page(page=page, page_size=page_size, items=stores)
-
 
 class CanAddStoreInteractor:
     def __init__(
@@ -99,19 +138,22 @@ class SaveStoreInteractor:
         store_category_saver: interfaces.StoreCategorySaver,
         recources_saver: interfaces.StoreRecourceSaver,
         uuid_generator: interfaces.UUIDGenerator,
-        config: Config,
         conn: interfaces.AsyncConnection,
+        versions: interfaces.CatalogVersionBumper,
+        media_references: interfaces.MediaReferenceSaver,
     ):
         self._store_saver = store_saver
         self._store_city_saver = store_city_saver
         self._store_category_saver = store_category_saver
         self.recources_saver = recources_saver
         self._uuid_generator = uuid_generator
-        self._config = config
         self.conn = conn
+        self._versions = versions
+        self._media_references = media_references
 
     async def __call__(
         self,
+        store_id: UUID,
         title: str,
         description: str,
         cities: Iterable[UUID],
@@ -124,7 +166,6 @@ class SaveStoreInteractor:
         main_media_mobile: Media,
         display_priority: int,
     ) -> None:
-        store_id = self._uuid_generator()
         store = Store(
             id=store_id,
             title=title,
@@ -135,14 +176,10 @@ class SaveStoreInteractor:
             display_priority=display_priority,
         )
         async with self.conn.transaction():
-            await self._store_saver.save(
-                store=store,
-                preview_media_pc=preview_media_pc,
-                preview_media_mobile=preview_media_mobile,
-                main_media_pc=main_media_pc,
-                main_media_mobile=main_media_mobile,
-                bucket=self._config.minio.bucket,
-            )
+            if not await self._store_saver.save(store=store):
+                # The job was already applied by an earlier delivery, which may have died before bumping.
+                await self._versions.bump(entities=[CatalogEntity.STORE], store_id=store_id)
+                return
 
             store_cities = [
                 (StoreCity(id=self._uuid_generator(), store_id=store_id, city_id=city_id)) for city_id in cities
@@ -165,8 +202,18 @@ class SaveStoreInteractor:
                 self._store_city_saver.save_many(store_cities=store_cities),
                 self._store_category_saver.save_many(store_categories=store_categories),
                 self.recources_saver.save(store_resources=store_resources),
+                self._media_references.save_many(
+                    owner_id=store_id,
+                    media={
+                        StoreMediaName.PC_PREVIEW: preview_media_pc,
+                        StoreMediaName.MOBILE_PREVIEW: preview_media_mobile,
+                        StoreMediaName.PC_MAIN: main_media_pc,
+                        StoreMediaName.MOBILE_MAIN: main_media_mobile,
+                    },
+                ),
             ]
             await asyncio.gather(*tasks)
+        await self._versions.bump(entities=[CatalogEntity.STORE], store_id=store_id)
 
 
 class UpdateStoreManager(interfaces.StoreReader, interfaces.StoreUpdater, Protocol): ...
@@ -176,13 +223,19 @@ class UpdateStoreTitleInteractor:
     def __init__(
         self,
         updater: UpdateStoreManager,
+        cache: interfaces.StoreDetailsCache,
+        versions: interfaces.CatalogVersionBumper,
     ):
         self._updater = updater
+        self._cache = cache
+        self._versions = versions
 
     async def __call__(self, store_id: UUID, title: str) -> StoreDetails:
         store = await self._updater.get_by_id(store_id=store_id)
         store.title = title
         await self._updater.update(store=store)
+        await self._cache.invalidate(store_id=store_id)
+        await self._versions.bump(entities=[CatalogEntity.STORE], store_id=store_id)
 
         return await self._updater.get_with_relations(store_id=store_id)
 
@@ -191,13 +244,19 @@ class UpdateStoreDescriptionInteractor:
     def __init__(
         self,
         updater: UpdateStoreManager,
+        cache: interfaces.StoreDetailsCache,
+        versions: interfaces.CatalogVersionBumper,
     ):
         self._updater = updater
+        self._cache = cache
+        self._versions = versions
 
     async def __call__(self, store_id: UUID, description: str) -> StoreDetails:
         store = await self._updater.get_by_id(store_id=store_id)
         store.description = description
         await self._updater.update(store=store)
+        await self._cache.invalidate(store_id=store_id)
+        await self._versions.bump(entities=[CatalogEntity.STORE], store_id=store_id)
 
         return await self._updater.get_with_relations(store_id=store_id)
 
@@ -206,20 +265,22 @@ class UpdateStorePrevieMediaPcInteractor:
     def __init__(
         self,
         updater: UpdateStoreManager,
-        config: Config,
+        cache: interfaces.StoreDetailsCache,
+        media_references: interfaces.MediaReferenceSaver,
+        versions: interfaces.CatalogVersionBumper,
     ):
         self._updater = updater
-        self._config = config
+        self._cache = cache
+        self._media_references = media_references
+        self._versions = versions
 
     async def __call__(self, store_id: UUID, media: Media) -> StoreDetails:
         store = await self._updater.get_by_id(store_id=store_id)
         store.preview_media_type = media.extension
-        await self._updater.update_media(
-            store=store,
-            media=media,
-            media_name=StoreMediaName.PC_PREVIEW,
-            bucket=self._config.minio.bucket,
-        )
+        await self._media_references.save_many(owner_id=store.id, media={StoreMediaName.PC_PREVIEW: media})
+        await self._updater.update(store=store)
+        await self._cache.invalidate(store_id=store_id)
+        await self._versions.bump(entities=[CatalogEntity.STORE], store_id=store_id)
 
         return await self._updater.get_with_relations(store_id=store_id)
 
@@ -228,20 +289,22 @@ class UpdateStorePrevieMediaMobileInteractor:
     def __init__(
         self,
         updater: UpdateStoreManager,
-        config: Config,
+        cache: interfaces.StoreDetailsCache,
+        media_references: interfaces.MediaReferenceSaver,
+        versions: interfaces.CatalogVersionBumper,
     ):
         self._updater = updater
-        self._config = config
+        self._cache = cache
+        self._media_references = media_references
+        self._versions = versions
 
     async def __call__(self, store_id: UUID, media: Media) -> StoreDetails:
         store = await self._updater.get_by_id(store_id=store_id)
         store.preview_media_type = media.extension
-        await self._updater.update_media(
-            store=store,
-            media=media,
-            media_name=StoreMediaName.MOBILE_PREVIEW,
-            bucket=self._config.minio.bucket,
-        )
+        await self._media_references.save_many(owner_id=store.id, media={StoreMediaName.MOBILE_PREVIEW: media})
+        await self._updater.update(store=store)
+        await self._cache.invalidate(store_id=store_id)
+        await self._versions.bump(entities=[CatalogEntity.STORE], store_id=store_id)
 
         return await self._updater.get_with_relations(store_id=store_id)
 
@@ -250,20 +313,22 @@ class UpdateStoreMainMediaPcInteractor:
     def __init__(
         self,
         updater: UpdateStoreManager,
-        config: Config,
+        cache: interfaces.StoreDetailsCache,
+        media_references: interfaces.MediaReferenceSaver,
+        versions: interfaces.CatalogVersionBumper,
     ):
         self._updater = updater
-        self._config = config
+        self._cache = cache
+        self._media_references = media_references
+        self._versions = versions
 
     async def __call__(self, store_id: UUID, media: Media) -> StoreDetails:
         store = await self._updater.get_by_id(store_id=store_id)
         store.preview_media_type = media.extension
-        await self._updater.update_media(
-            store=store,
-            media=media,
-            media_name=StoreMediaName.PC_MAIN,
-            bucket=self._config.minio.bucket,
-        )
+        await self._media_references.save_many(owner_id=store.id, media={StoreMediaName.PC_MAIN: media})
+        await self._updater.update(store=store)
+        await self._cache.invalidate(store_id=store_id)
+        await self._versions.bump(entities=[CatalogEntity.STORE], store_id=store_id)
 
         return await self._updater.get_with_relations(store_id=store_id)
 
@@ -272,20 +337,22 @@ class UpdateStoreMainMediaMobileInteractor:
     def __init__(
         self,
         updater: UpdateStoreManager,
-        config: Config,
+        cache: interfaces.StoreDetailsCache,
+        media_references: interfaces.MediaReferenceSaver,
+        versions: interfaces.CatalogVersionBumper,
     ):
         self._updater = updater
-        self._config = config
+        self._cache = cache
+        self._media_references = media_references
+        self._versions = versions
 
     async def __call__(self, store_id: UUID, media: Media) -> StoreDetails:
         store = await self._updater.get_by_id(store_id=store_id)
         store.preview_media_type = media.extension
-        await self._updater.update_media(
-            store=store,
-            media=media,
-            media_name=StoreMediaName.MOBILE_MAIN,
-            bucket=self._config.minio.bucket,
-        )
+        await self._media_references.save_many(owner_id=store.id, media={StoreMediaName.MOBILE_MAIN: media})
+        await self._updater.update(store=store)
+        await self._cache.invalidate(store_id=store_id)
+        await self._versions.bump(entities=[CatalogEntity.STORE], store_id=store_id)
 
         return await self._updater.get_with_relations(store_id=store_id)
 
@@ -294,13 +361,19 @@ class UpdateStoreMainPageUrlInteractor:
     def __init__(
         self,
         updater: UpdateStoreManager,
+        cache: interfaces.StoreDetailsCache,
+        versions: interfaces.CatalogVersionBumper,
     ):
         self._updater = updater
+        self._cache = cache
+        self._versions = versions
 
     async def __call__(self, store_id: UUID, main_page_url: str) -> StoreDetails:
         store = await self._updater.get_by_id(store_id=store_id)
         store.main_page_url = main_page_url
         await self._updater.update(store=store)
+        await self._cache.invalidate(store_id=store_id)
+        await self._versions.bump(entities=[CatalogEntity.STORE], store_id=store_id)
 
         return await self._updater.get_with_relations(store_id=store_id)
 
@@ -309,13 +382,19 @@ class UpdateStoreDisplayPriorityInteractor:
     def __init__(
         self,
         updater: UpdateStoreManager,
+        cache: interfaces.StoreDetailsCache,
+        versions: interfaces.CatalogVersionBumper,
     ):
         self._updater = updater
+        self._cache = cache
+        self._versions = versions
 
     async def __call__(self, store_id: UUID, display_priority: int) -> StoreDetails:
         store = await self._updater.get_by_id(store_id=store_id)
         store.display_priority = display_priority
         await self._updater.update(store=store)
+        await self._cache.invalidate(store_id=store_id)
+        await self._versions.bump(entities=[CatalogEntity.STORE], store_id=store_id)
 
         return await self._updater.get_with_relations(store_id=store_id)
 
@@ -327,14 +406,25 @@ class DeleteStoreInteractor:
     def __init__(
         self,
         deleter: DeleteStoreManager,
+        cache: interfaces.StoreDetailsCache,
         pagination: PaginationService,
+        versions: interfaces.CatalogVersionBumper,
+        media_references: interfaces.MediaReferenceDeleter,
     ):
         self._deleter = deleter
+        self._cache = cache
         self._pagination = pagination
+        self._versions = versions
+        self._media_references = media_references
 
     async def __call__(self, store_id: UUID, page: int, page_size: int) -> Pagination[Store]:
         store = await self._deleter.get_by_id(store_id=store_id)
+        await self._media_references.delete_by_owner(owner_id=store.id)
         await self._deleter.delete(store=store)
-        stores = await self._deleter.get_all()
+        await self._cache.invalidate(store_id=store.id)
+        await self._versions.bump(entities=[CatalogEntity.STORE], store_id=store.id, store_deleted=True)
 
-        return self._pagination.create_page(page=page, page_size=page_size, items=stores)
+        return await self._deleter.get_page(
+            page_size=page_size,
+            offset=self._pagination.get_offset(page=page, page_size=page_size),
+        )
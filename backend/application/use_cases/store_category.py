@@ -3,6 +3,7 @@ from typing import Protocol
 from uuid import UUID
 
 from backend.application import interfaces
+from backend.domain.entities.catalog import CatalogEntity
 from backend.domain.entities.category import CategorySelection
 from backend.domain.entities.store_category import StoreCategory
 
@@ -15,11 +16,15 @@ class AddStoreCategoryInteractor:
         self,
         saver: AddStoreCategoryManager,
         category_reader: interfaces.CategoryReader,
+        cache: interfaces.StoreDetailsCache,
         uuid_generator: interfaces.UUIDGenerator,
+        versions: interfaces.CatalogVersionBumper,
     ):
         self._saver = saver
         self._category_reader = category_reader
+        self._cache = cache
         self._uuid_generator = uuid_generator
+        self._versions = versions
 
     async def __call__(self, store_id: UUID, category_id: UUID) -> Collection[CategorySelection]:
         store_category = StoreCategory(
@@ -28,22 +33,26 @@ class AddStoreCategoryInteractor:
             category_id=category_id,
         )
         await self._saver.save(store_category=store_category)
+        await self._cache.invalidate(store_id=store_id)
+        await self._versions.bump(entities=[CatalogEntity.STORE], store_id=store_id)
         return await self._category_reader.get_store_category_selection(store_id=store_id)
 
 
-class DeleteStoreCategoryManager(interfaces.StoreCategoryReader, interfaces.StoreCategoryDeleter, Protocol): ...
-
-
 class DeleteStoreCategoryInteractor:
     def __init__(
         self,
-        deleter: DeleteStoreCategoryManager,
+        deleter: interfaces.StoreCategoryDeleter,
         category_reader: interfaces.CategoryReader,
+        cache: interfaces.StoreDetailsCache,
+        versions: interfaces.CatalogVersionBumper,
     ):
         self._deleter = deleter
         self._category_reader = category_reader
+        self._cache = cache
+        self._versions = versions
 
     async def __call__(self, store_id: UUID, category_id: UUID) -> Collection[CategorySelection]:
-        store_category = await self._deleter.get_by_store_category_ids(store_id=store_id, category_id=category_id)
-        await self._deleter.delete(store_category=store_category)
+        if await self._deleter.delete(store_id=store_id, category_id=category_id):
+            await self._cache.invalidate(store_id=store_id)
+            await self._versions.bump(entities=[CatalogEntity.STORE], store_id=store_id)
         return await self._category_reader.get_store_category_selection(store_id=store_id)
@@ -3,6 +3,7 @@ from typing import Protocol
 from uuid import UUID
 
 from backend.application import interfaces
+from backend.domain.entities.catalog import CatalogEntity
 from backend.domain.entities.city import CitySelection
 from backend.domain.entities.store_city import StoreCity
 
@@ -15,11 +16,15 @@ class AddStoreCityInteractor:
         self,
         saver: AddStoreCityManager,
         city_reader: interfaces.CityReader,
+        cache: interfaces.StoreDetailsCache,
         uuid_generator: interfaces.UUIDGenerator,
+        versions: interfaces.CatalogVersionBumper,
     ):
         self._saver = saver
         self._city_reader = city_reader
+        self._cache = cache
         self._uuid_generator = uuid_generator
+        self._versions = versions
 
     async def __call__(self, store_id: UUID, city_id: UUID) -> Collection[CitySelection]:
         store_city = StoreCity(
@@ -28,22 +33,26 @@ class AddStoreCityInteractor:
             city_id=city_id,
         )
         await self._saver.save(store_city=store_city)
+        await self._cache.invalidate(store_id=store_id)
+        await self._versions.bump(entities=[CatalogEntity.STORE], store_id=store_id)
         return await self._city_reader.get_store_city_selection(store_id=store_id)
 
 
-class DeleteStoreCityManager(interfaces.StoreCityReader, interfaces.StoreCityDeleter, Protocol): ...
-
-
 class DeleteStoreCityInteractor:
     def __init__(
         self,
         city_reader: interfaces.CityReader,
-        deleter: DeleteStoreCityManager,
+        deleter: interfaces.StoreCityDeleter,
+        cache: interfaces.StoreDetailsCache,
+        versions: interfaces.CatalogVersionBumper,
     ):
         self._city_reader = city_reader
         self._deleter = deleter
+        self._cache = cache
+        self._versions = versions
 
     async def __call__(self, store_id: UUID, city_id: UUID) -> Collection[CitySelection]:
-        store_city = await self._deleter.get_by_store_city_ids(store_id=store_id, city_id=city_id)
-        await self._deleter.delete(store_city=store_city)
+        if await self._deleter.delete(store_id=store_id, city_id=city_id):
+            await self._cache.invalidate(store_id=store_id)
+            await self._versions.bump(entities=[CatalogEntity.STORE], store_id=store_id)
         return await self._city_reader.get_store_city_selection(store_id=store_id)
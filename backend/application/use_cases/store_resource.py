@@ -3,6 +3,7 @@ from typing import Protocol
 from uuid import UUID
 
 from backend.application import interfaces
+from backend.domain.entities.catalog import CatalogEntity
 from backend.domain.entities.store_resource import StoreResource
 
 
@@ -24,10 +25,14 @@ class AddStoreResourcesInteractor:
     def __init__(
         self,
         saver: AddStoreResourceManager,
+        cache: interfaces.StoreDetailsCache,
         uuid_generator: interfaces.UUIDGenerator,
+        versions: interfaces.CatalogVersionBumper,
     ):
         self._saver = saver
+        self._cache = cache
         self._uuid_generator = uuid_generator
+        self._versions = versions
 
     async def __call__(self, resources_url: str, store_id: UUID) -> Collection[StoreResource]:
         store_resources = [
@@ -41,6 +46,8 @@ class AddStoreResourcesInteractor:
         ]
 
         await self._saver.save(store_resources=store_resources)
+        await self._cache.invalidate(store_id=store_id)
+        await self._versions.bump(entities=[CatalogEntity.STORE], store_id=store_id)
         return await self._saver.get_all_by_store_id(store_id=store_id)
 
 
@@ -51,11 +58,17 @@ class DeleteStoreResourceInteractor:
     def __init__(
         self,
         deleter: DeleteStoreResourcesManager,
+        cache: interfaces.StoreDetailsCache,
+        versions: interfaces.CatalogVersionBumper,
     ):
         self._deleter = deleter
+        self._cache = cache
+        self._versions = versions
 
     async def __call__(self, resource_id: UUID) -> Collection[StoreResource]:
         store_resource = await self._deleter.get_by_id(recource_id=resource_id)
         await self._deleter.delete(store_resource=store_resource)
+        await self._cache.invalidate(store_id=store_resource.store_id)
+        await self._versions.bump(entities=[CatalogEntity.STORE], store_id=store_resource.store_id)
 
         return await self._deleter.get_all_by_store_id(store_id=store_resource.store_id)
@@ -1,4 +1,4 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from os import environ as env
 
 
@@ -9,16 +9,33 @@ class PgConfig:
     port: int = field(default_factory=lambda: int(env.get('POSTGRES_PORT').strip()))
     user: str = field(default_factory=lambda: env.get('POSTGRES_USER').strip())
     password: str = field(default_factory=lambda: env.get('POSTGRES_PASSWORD').strip())
+    pool_min_size: int = field(default_factory=lambda: int(env.get('PG_POOL_MIN_SIZE', '40').strip()))
+    pool_max_size: int = field(default_factory=lambda: int(env.get('PG_POOL_MAX_SIZE', '80').strip()))
 
     def create_connection_string(self) -> str:
         return f'postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.db}'
 
+    def split_pool(self, processes: int) -> 'PgConfig':
+        return replace(
+            self,
+            pool_min_size=max(1, self.pool_min_size // processes),
+            pool_max_size=max(1, self.pool_max_size // processes),
+        )
+
 
 @dataclass(slots=True)
 class RedisConfig:
     host: str = field(default_factory=lambda: env.get('REDIS_HOST').strip())
     port: int = field(default_factory=lambda: int(env.get('REDIS_PORT').strip()))
     db: str = field(default_factory=lambda: env.get('REDIS_DB').strip())
+    max_connections: int = field(default_factory=lambda: int(env.get('REDIS_MAX_CONNECTIONS', '64').strip()))
+    pool_timeout: float = field(default_factory=lambda: float(env.get('REDIS_POOL_TIMEOUT', '5').strip()))
+    health_check_interval: int = field(
+        default_factory=lambda: int(env.get('REDIS_HEALTH_CHECK_INTERVAL', '30').strip()),
+    )
+    socket_keepalive: bool = field(
+        default_factory=lambda: env.get('REDIS_SOCKET_KEEPALIVE', 'true').strip().lower() == 'true',
+    )
 
     def create_connection_string(self) -> str:
         return f'redis://{self.host}:{self.port}/{self.db}'
@@ -30,12 +47,18 @@ class MinioConfig:
     password: str = field(default_factory=lambda: env.get('MINIO_ROOT_PASSWORD').strip())
     url: str = field(default_factory=lambda: env.get('MINIO_URL').strip())
     bucket: str = field(default_factory=lambda: env.get('MINIO_BUCKET').strip())
+    region: str | None = field(default_factory=lambda: env.get('MINIO_REGION', '').strip() or None)
+    max_connections: int = field(default_factory=lambda: int(env.get('MINIO_MAX_CONNECTIONS', '32').strip()))
+    keepalive_timeout: float = field(default_factory=lambda: float(env.get('MINIO_KEEPALIVE_TIMEOUT', '60').strip()))
 
 
 @dataclass
 class TgBotConfig:
     token: str = field(default_factory=lambda: env.get('TG_BOT_TOKEN').strip())
     admins: list[int] = field(default_factory=lambda: list(map(int, env.get('ADMINS').strip().split(','))))
+    fsm_ttl: int = field(default_factory=lambda: int(env.get('BOT_FSM_TTL', '86400').strip()))
+    keyboard_cache_size: int = field(default_factory=lambda: int(env.get('BOT_KEYBOARD_CACHE_SIZE', '2048').strip()))
+    keyboard_cache_ttl: int = field(default_factory=lambda: int(env.get('BOT_KEYBOARD_CACHE_TTL', '3600').strip()))
 
 
 @dataclass
@@ -44,12 +67,15 @@ class WebHookConfig:
     port: int = field(default_factory=lambda: int(env.get('WEBHOOK_PORT').strip()))
     url: str = field(default_factory=lambda: env.get('WEBHOOK_URL').strip())
     path: str = field(default_factory=lambda: env.get('WEBHOOK_PATH').strip())
+    workers: int = field(default_factory=lambda: int(env.get('WEBHOOK_WORKERS', '1').strip()))
+    chat_lock_timeout: float = field(default_factory=lambda: float(env.get('WEBHOOK_CHAT_LOCK_TIMEOUT', '120').strip()))
 
 
 @dataclass
 class ApiConfig:
     host: str = field(default_factory=lambda: env.get('API_HOST').strip())
     port: int = field(default_factory=lambda: int(env.get('API_PORT').strip()))
+    admin_token: str = field(default_factory=lambda: env.get('API_ADMIN_TOKEN', '').strip())
 
 
 @dataclass
@@ -57,6 +83,56 @@ class BannerConfig:
     file_path: str = field(default_factory=lambda: env.get('BANNER_PATH').strip())
 
 
+@dataclass
+class CacheConfig:
+    store_details_ttl: int = field(default_factory=lambda: int(env.get('CACHE_STORE_DETAILS_TTL', '3600').strip()))
+    reference_data_ttl: int = field(default_factory=lambda: int(env.get('CACHE_REFERENCE_DATA_TTL', '300').strip()))
+    reference_data_max_size: int = field(
+        default_factory=lambda: int(env.get('CACHE_REFERENCE_DATA_MAX_SIZE', '1024').strip()),
+    )
+
+
+@dataclass
+class HttpCacheConfig:
+    max_age: int = field(default_factory=lambda: int(env.get('HTTP_CACHE_MAX_AGE', '30').strip()))
+
+
+@dataclass
+class CatalogConfig:
+    resync_interval: float = field(default_factory=lambda: float(env.get('CATALOG_RESYNC_INTERVAL', '30').strip()))
+    store_tombstone_ttl: int = field(
+        default_factory=lambda: int(env.get('CATALOG_STORE_TOMBSTONE_TTL', '2592000').strip()),
+    )
+
+
+@dataclass
+class JobsConfig:
+    stream_max_len: int = field(default_factory=lambda: int(env.get('JOBS_STREAM_MAX_LEN', '10000').strip()))
+    batch_size: int = field(default_factory=lambda: int(env.get('JOBS_BATCH_SIZE', '8').strip()))
+    block_timeout: float = field(default_factory=lambda: float(env.get('JOBS_BLOCK_TIMEOUT', '5').strip()))
+    claim_idle: float = field(default_factory=lambda: float(env.get('JOBS_CLAIM_IDLE', '300').strip()))
+    shards: int = field(default_factory=lambda: int(env.get('JOBS_SHARDS', '16').strip()))
+
+
+@dataclass
+class MediaConfig:
+    staging_ttl: int = field(default_factory=lambda: int(env.get('MEDIA_STAGING_TTL', '86400').strip()))
+    sweep_interval: float = field(default_factory=lambda: float(env.get('MEDIA_SWEEP_INTERVAL', '600').strip()))
+    derivative_widths: list[int] = field(
+        default_factory=lambda: [
+            int(width) for width in env.get('MEDIA_DERIVATIVE_WIDTHS', '320,640,1024,1600').strip().split(',')
+        ],
+    )
+    derivative_formats: list[str] = field(
+        default_factory=lambda: env.get('MEDIA_DERIVATIVE_FORMATS', 'avif,webp').strip().split(','),
+    )
+    derivative_quality: int = field(default_factory=lambda: int(env.get('MEDIA_DERIVATIVE_QUALITY', '80').strip()))
+    processing_workers: int = field(default_factory=lambda: int(env.get('MEDIA_PROCESSING_WORKERS', '2').strip()))
+    url_expiry: int = field(default_factory=lambda: int(env.get('MEDIA_URL_EXPIRY', '43200').strip()))
+    url_refresh_before: int = field(default_factory=lambda: int(env.get('MEDIA_URL_REFRESH_BEFORE', '3600').strip()))
+    url_cache_size: int = field(default_factory=lambda: int(env.get('MEDIA_URL_CACHE_SIZE', '10000').strip()))
+
+
 @dataclass(slots=True)
 class Config:
     pg: PgConfig = field(default_factory=PgConfig)
@@ -66,3 +142,8 @@ class Config:
     webhook: WebHookConfig = field(default_factory=WebHookConfig)
     api: ApiConfig = field(default_factory=ApiConfig)
     banner: BannerConfig = field(default_factory=BannerConfig)
+    cache: CacheConfig = field(default_factory=CacheConfig)
+    http_cache: HttpCacheConfig = field(default_factory=HttpCacheConfig)
+    catalog: CatalogConfig = field(default_factory=CatalogConfig)
+    media: MediaConfig = field(default_factory=MediaConfig)
+    jobs: JobsConfig = field(default_factory=JobsConfig)
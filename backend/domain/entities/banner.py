@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from uuid import UUID
 
 from backend.domain.entities.media import MediaType
@@ -10,3 +10,5 @@ class Banner:
     media_type: MediaType
     target_url: str
     display_priority: int
+    media_files: dict[str, str] = field(default_factory=dict)
+    media_derivatives: dict[str, list[str]] = field(default_factory=dict)
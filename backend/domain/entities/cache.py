@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class CacheStats:
+    name: str
+    hits: int
+    misses: int
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from enum import StrEnum
+from uuid import UUID
+
+
+class CatalogEntity(StrEnum):
+    STORE = 'store'
+    CITY = 'city'
+    CATEGORY = 'category'
+    BANNER = 'banner'
+
+
+@dataclass(slots=True)
+class CatalogChange:
+    versions: dict[CatalogEntity, int]
+    store_id: UUID | None = None
+    store_version: int | None = None
+    store_deleted: bool = False
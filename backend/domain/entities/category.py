@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from uuid import UUID
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class Category:
     id: UUID
     title: str
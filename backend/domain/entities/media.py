@@ -1,6 +1,10 @@
+from collections.abc import Collection, Mapping
 from dataclasses import dataclass
 from enum import StrEnum
-from io import BytesIO
+from uuid import UUID
+
+STAGING_PREFIX = 'staging/'
+CONTENT_PREFIX = 'media/'
 
 
 class MediaType(StrEnum):
@@ -20,7 +24,69 @@ class BannerMediaName(StrEnum):
     MOBILE = 'mobile-banner'
 
 
+@dataclass(slots=True)
+class MediaVariant:
+    width: int
+    format: str
+    file_name: str
+    url: str = ''
+
+
+@dataclass(slots=True)
+class MediaAsset:
+    name: str
+    file_name: str
+    variants: list[MediaVariant]
+    url: str = ''
+
+
+@dataclass(slots=True)
+class MediaSource:
+    file_id: str
+    source_id: str
+    extension: MediaType
+
+
 @dataclass(slots=True)
 class Media:
-    media_obj: BytesIO
+    digest: str
     extension: MediaType
+    size: int
+    derivatives: Collection[str] = ()
+
+    @property
+    def content_name(self) -> str:
+        return f'{self.digest}.{self.extension}'
+
+    @property
+    def file_name(self) -> str:
+        return f'{CONTENT_PREFIX}{self.content_name}'
+
+    @property
+    def derivative_file_names(self) -> list[str]:
+        return [get_derivative_file_name(self.file_name, suffix) for suffix in self.derivatives]
+
+
+def get_derivative_suffix(width: int, image_format: str) -> str:
+    return f'{width}w.{image_format}'
+
+
+def parse_derivative_suffix(suffix: str) -> tuple[int, str]:
+    width, image_format = suffix.split('.', 1)
+    return int(width.removesuffix('w')), image_format
+
+
+def get_derivative_file_name(file_name: str, suffix: str) -> str:
+    return f'{file_name.rsplit(".", 1)[0]}-{suffix}'
+
+
+def get_media_file_name(
+    owner_id: UUID,
+    media_name: StoreMediaName | BannerMediaName,
+    extension: MediaType,
+    media_files: Mapping[str, str],
+) -> str:
+    content_name = media_files.get(media_name)
+    if content_name:
+        return f'{CONTENT_PREFIX}{content_name}'
+    return f'{owner_id}-{media_name}.{extension}'
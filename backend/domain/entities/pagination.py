@@ -10,3 +10,4 @@ class Pagination(Generic[T]):
     total: int
     size: int
     items: Collection[T]
+    next_cursor: str | None = None
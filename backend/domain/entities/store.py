@@ -1,5 +1,6 @@
 from collections.abc import Collection
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from enum import StrEnum
 from uuid import UUID
 
 from backend.domain.entities.category import Category
@@ -17,6 +18,8 @@ class Store:
     main_media_type: MediaType
     main_page_url: str
     display_priority: int
+    media_files: dict[str, str] = field(default_factory=dict)
+    media_derivatives: dict[str, list[str]] = field(default_factory=dict)
 
 
 @dataclass(slots=True)
@@ -25,3 +28,14 @@ class StoreDetails:
     cities: Collection[City]
     categories: Collection[Category]
     resources: Collection[StoreResource]
+
+
+@dataclass(slots=True, frozen=True)
+class StoreCursor:
+    display_priority: int
+    id: UUID
+
+
+class StoreSearchMode(StrEnum):
+    SUBSTRING = 'substring'
+    FUZZY = 'fuzzy'
@@ -1,6 +1,7 @@
 from backend.domain.exceptions.banner import BannerNotFoundByIdError, BannersNotFoundError
 from backend.domain.exceptions.category import CategoriesNotFoundError, CategoryNotFoundByIdError
 from backend.domain.exceptions.city import CitiesNotFoundError, CityNotFoundByIdError
+from backend.domain.exceptions.pagination import InvalidPaginationCursorError
 from backend.domain.exceptions.store import StoreNotFoundByIdError, StoresNotFoundByFiltersError, StoresNotFoundError
 from backend.domain.exceptions.store_recource import StoreResourceNotFoundById, StoreResourcesNotFoundError
 
@@ -11,6 +12,7 @@ __all__ = [
     'CategoryNotFoundByIdError',
     'CitiesNotFoundError',
     'CityNotFoundByIdError',
+    'InvalidPaginationCursorError',
     'StoreNotFoundByIdError',
     'StoreResourceNotFoundById',
     'StoreResourcesNotFoundError',
@@ -0,0 +1,6 @@
+from backend.domain.exceptions.base import BaseDomainError
+
+
+class InvalidPaginationCursorError(BaseDomainError):
+    def __init__(self):
+        super().__init__('Invalid pagination cursor')
@@ -36,3 +36,15 @@ def no_baners_for_edit_error_text() -> str:
 
 def pagination_error_text() -> str:
     return '⚠️ Ошибка: Вернитесь в главное меню.'
+
+
+def store_save_failed_error_text() -> str:
+    return '⚠️ Ошибка: Сохранить магазин не удалось, попробуйте снова.'
+
+
+def banner_save_failed_error_text() -> str:
+    return '⚠️ Ошибка: Сохранить баннер не удалось, попробуйте снова.'
+
+
+def media_upload_failed_error_text() -> str:
+    return '⚠️ Ошибка: Загрузить медиа не удалось, попробуйте снова.'
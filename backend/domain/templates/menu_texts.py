@@ -1,7 +1,8 @@
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
+from html import escape
 
 from backend.domain.entities.banner import Banner
-from backend.domain.entities.media import BannerMediaName, Media, StoreMediaName
+from backend.domain.entities.media import BannerMediaName, MediaSource, StoreMediaName
 from backend.domain.entities.store import StoreDetails
 
 
@@ -42,10 +43,10 @@ def add_store_menu_text(
         categories: Iterable[str] | None = None,
         main_url: str | None = None,
         resources_url: str | None = None,
-        preview_media_pc: Media | None = None,
-        preview_media_mobile: Media | None = None,
-        main_media_pc: Media | None = None,
-        main_media_mobile: Media | None = None,
+        preview_media_pc: MediaSource | None = None,
+        preview_media_mobile: MediaSource | None = None,
+        main_media_pc: MediaSource | None = None,
+        main_media_mobile: MediaSource | None = None,
         display_priority: int = 1,
         step_iteration: int = 1,
 ):
@@ -85,12 +86,17 @@ def success_store_save_text() -> str:
     return '✅ Стор усшно сохранен:'
 
 
+def store_save_pending_text() -> str:
+    return '⏳ Сохраняем стор...'
+
+
 def choice_store_for_edit_menu_text() -> str:
     return '📲 <b>Выберите магазин для изменения:</b>'
 
 
-def store_details_menu_text(details: StoreDetails, minio_url: str, bucket: str) -> str:
+def store_details_menu_text(details: StoreDetails, media_links: Mapping[str, str]) -> str:
     resources_text = ''.join(f"• <a href='{res.target_url}'>{res.title}</a>\n" for res in details.resources) or '—'
+    links = {media_name: escape(url) for media_name, url in media_links.items()}
 
     return (
         f'📌 <b>Название:</b> {details.store.title}\n'
@@ -100,11 +106,11 @@ def store_details_menu_text(details: StoreDetails, minio_url: str, bucket: str)
         f"🌐 <b>Основной ресурс:</b> <a href='{details.store.main_page_url}'>{details.store.main_page_url}</a>\n"
         f'📎 <b>Доп. ресурсы:</b>\n{resources_text}\n'
         f'🖼 <i>Превью медиа:</i>\n'
-        f"• PC: <a href='https://{minio_url}/{bucket}/{details.store.id}-{StoreMediaName.PC_PREVIEW}.{details.store.preview_media_type}'>глянуть</a>\n"
-        f"• Mobile: <a href='https://{minio_url}/{bucket}/{details.store.id}-{StoreMediaName.MOBILE_PREVIEW}.{details.store.preview_media_type}'>глянуть</a>\n\n"
+        f"• PC: <a href='{links[StoreMediaName.PC_PREVIEW]}'>глянуть</a>\n"
+        f"• Mobile: <a href='{links[StoreMediaName.MOBILE_PREVIEW]}'>глянуть</a>\n\n"
         f'🏞 <i>Основное медиа:</i>\n'
-        f"• PC: <a href='https://{minio_url}/{bucket}/{details.store.id}-{StoreMediaName.PC_MAIN}.{details.store.main_media_type}'>глянуть</a>\n"
-        f"• Mobile: <a href='https://{minio_url}/{bucket}/{details.store.id}-{StoreMediaName.MOBILE_MAIN}.{details.store.main_media_type}'>глянуть</a>\n"
+        f"• PC: <a href='{links[StoreMediaName.PC_MAIN]}'>глянуть</a>\n"
+        f"• Mobile: <a href='{links[StoreMediaName.MOBILE_MAIN]}'>глянуть</a>\n"
     )
 
 
@@ -135,8 +141,8 @@ def get_store_edit_menu_text(action: str) -> str:
 
 def add_banner_menu_text(
         targer_url: str | None = None,
-        pc_media: Media | None = None,
-        mobile_media: Media | None = None,
+        pc_media: MediaSource | None = None,
+        mobile_media: MediaSource | None = None,
         display_priority: int = 1,
         step_iteration: int = 1,
 ):
@@ -161,16 +167,25 @@ def success_banner_save_text() -> str:
     return '✅ Баннер усшно сохранен:'
 
 
+def banner_save_pending_text() -> str:
+    return '⏳ Сохраняем баннер...'
+
+
+def media_upload_pending_text() -> str:
+    return '⏳ Загружаем медиа...'
+
+
 def choice_banner_for_edit_menu_text() -> str:
     return '📲 <b>Выберите баннер для изменения:</b>'
 
 
-def banner_details_text(banner: Banner, minio_url: str, bucket: str) -> str:
+def banner_details_text(banner: Banner, media_links: Mapping[str, str]) -> str:
+    links = {media_name: escape(url) for media_name, url in media_links.items()}
     return (
         f"🌐 <b>Ресурс:</b> <a href='{banner.target_url}'>{banner.target_url}</a>\n\n"
         f'🖼 <i>Баннер:</i>\n'
-        f"• PC: <a href='https://{minio_url}/{bucket}/{banner.id}-{BannerMediaName.PC}.{banner.media_type}'>глянуть</a>\n"
-        f"• Mobile: <a href='https://{minio_url}/{bucket}/{banner.id}-{BannerMediaName.MOBILE}.{banner.media_type}'>глянуть</a>\n\n"
+        f"• PC: <a href='{links[BannerMediaName.PC]}'>глянуть</a>\n"
+        f"• Mobile: <a href='{links[BannerMediaName.MOBILE]}'>глянуть</a>\n\n"
     )
 
 
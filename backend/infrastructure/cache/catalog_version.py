@@ -0,0 +1,196 @@
+import asyncio
+import json
+import logging
+from collections.abc import Awaitable, Callable, Collection, Mapping
+from uuid import UUID
+
+import redis.asyncio as redis
+from redis.commands.core import AsyncScript
+from redis.exceptions import RedisError
+
+from backend.application import interfaces
+from backend.config import Config
+from backend.domain.entities.catalog import CatalogChange, CatalogEntity
+
+VERSIONS_KEY = 'catalog:versions'
+STORE_VERSIONS_KEY = 'catalog:store_versions'
+STORE_TOMBSTONES_KEY = 'catalog:store_tombstones'
+CHANGES_CHANNEL = 'catalog:changes'
+
+BUMP_SCRIPT = """
+local now = tonumber(redis.call('TIME')[1])
+local expired_before = now - tonumber(ARGV[4])
+for _, id in ipairs(redis.call('ZRANGEBYSCORE', KEYS[3], '-inf', expired_before)) do
+    redis.call('HDEL', KEYS[2], id)
+end
+redis.call('ZREMRANGEBYSCORE', KEYS[3], '-inf', expired_before)
+
+local versions = {}
+for i = 5, #ARGV do
+    versions[ARGV[i]] = redis.call('HINCRBY', KEYS[1], ARGV[i], 1)
+end
+local change = {versions = versions}
+if ARGV[2] ~= '' then
+    change['store_id'] = ARGV[2]
+    change['store_version'] = redis.call('HINCRBY', KEYS[2], ARGV[2], 1)
+    if ARGV[3] == '1' then
+        redis.call('ZADD', KEYS[3], now, ARGV[2])
+        change['store_deleted'] = true
+    end
+end
+local payload = cjson.encode(change)
+redis.call('PUBLISH', ARGV[1], payload)
+return payload
+"""
+
+logger = logging.getLogger(__name__)
+
+
+def json_to_catalog_change(data: str | bytes) -> CatalogChange:
+    payload = json.loads(data)
+    store_id = payload.get('store_id')
+    return CatalogChange(
+        versions={CatalogEntity(entity): version for entity, version in payload['versions'].items()},
+        store_id=UUID(store_id) if store_id else None,
+        store_version=payload.get('store_version'),
+        store_deleted=payload.get('store_deleted', False),
+    )
+
+
+async def run_bump_script(
+    script: AsyncScript,
+    entities: Collection[CatalogEntity],
+    store_id: UUID | None,
+    store_deleted: bool,
+    tombstone_ttl: int,
+) -> CatalogChange:
+    payload = await script(
+        keys=[VERSIONS_KEY, STORE_VERSIONS_KEY, STORE_TOMBSTONES_KEY],
+        args=[
+            CHANGES_CHANNEL,
+            str(store_id) if store_id else '',
+            '1' if store_deleted else '',
+            tombstone_ttl,
+            *entities,
+        ],
+    )
+    return json_to_catalog_change(payload)
+
+
+class CatalogVersionTracker(interfaces.CatalogVersionReader, interfaces.CatalogChangeFeed):
+    def __init__(
+        self,
+        client: redis.Redis,
+        config: Config,
+    ):
+        self._client = client
+        self._tombstone_ttl = config.catalog.store_tombstone_ttl
+        self._bump = client.register_script(BUMP_SCRIPT)
+        self._versions: dict[CatalogEntity, int] | None = None
+        self._store_versions: dict[UUID, int] = {}
+        self._pending_bumps: list[tuple[tuple[CatalogEntity, ...], UUID | None, bool]] = []
+        self._listeners: list[Callable[[CatalogChange], Awaitable[None]]] = []
+
+    def get_versions(self) -> Mapping[CatalogEntity, int] | None:
+        return self._versions
+
+    def get_store_version(self, store_id: UUID) -> int:
+        return self._store_versions.get(store_id, 0)
+
+    def add_listener(self, listener: Callable[[CatalogChange], Awaitable[None]]) -> None:
+        self._listeners.append(listener)
+
+    def defer_bump(self, entities: Collection[CatalogEntity], store_id: UUID | None, store_deleted: bool) -> None:
+        self._pending_bumps.append((tuple(entities), store_id, store_deleted))
+        # Without the bump the versions are stale, so stop answering with 304 until the resync applies it.
+        self._versions = None
+
+    async def refresh(self) -> None:
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.hgetall(VERSIONS_KEY)
+            pipe.hgetall(STORE_VERSIONS_KEY)
+            versions, store_versions = await pipe.execute()
+
+        self._versions = {entity: int(versions.get(entity.encode(), 0)) for entity in CatalogEntity}
+        self._store_versions = {UUID(store_id.decode()): int(version) for store_id, version in store_versions.items()}
+
+    async def run(self, resync_interval: float) -> None:
+        while True:
+            try:
+                async with self._client.pubsub() as pubsub:
+                    await pubsub.subscribe(CHANGES_CHANNEL)
+                    await self._resync()
+
+                    while True:
+                        if self._pending_bumps:
+                            await self._resync()
+
+                        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=resync_interval)
+                        if message is None:
+                            await self._resync()
+                        else:
+                            await self._apply(json_to_catalog_change(message['data']))
+            except RedisError:
+                logger.exception('Catalog change feed is unavailable, retrying in %s seconds', resync_interval)
+                self._versions = None
+                await asyncio.sleep(resync_interval)
+
+    async def _resync(self) -> None:
+        while self._pending_bumps:
+            entities, store_id, store_deleted = self._pending_bumps[0]
+            await run_bump_script(self._bump, entities, store_id, store_deleted, self._tombstone_ttl)
+            self._pending_bumps.pop(0)
+
+        previous = self._versions
+        await self.refresh()
+
+        changed = {
+            entity: version
+            for entity, version in self._versions.items()
+            if previous is None or previous.get(entity) != version
+        }
+        if changed:
+            await self._notify(CatalogChange(versions=changed))
+
+    async def _apply(self, change: CatalogChange) -> None:
+        if self._versions is not None:
+            for entity, version in change.versions.items():
+                self._versions[entity] = max(self._versions.get(entity, 0), version)
+
+        if change.store_id is not None and change.store_version is not None:
+            self._store_versions[change.store_id] = max(self.get_store_version(change.store_id), change.store_version)
+
+        await self._notify(change)
+
+    async def _notify(self, change: CatalogChange) -> None:
+        for listener in self._listeners:
+            try:
+                await listener(change)
+            except Exception:
+                logger.exception('Catalog change listener %r failed', listener)
+
+
+class RedisCatalogVersionBumper(interfaces.CatalogVersionBumper):
+    def __init__(
+        self,
+        client: redis.Redis,
+        tracker: CatalogVersionTracker,
+        config: Config,
+    ):
+        self._client = client
+        self._tracker = tracker
+        self._tombstone_ttl = config.catalog.store_tombstone_ttl
+        self._bump = client.register_script(BUMP_SCRIPT)
+
+    async def bump(
+        self,
+        entities: Collection[CatalogEntity],
+        store_id: UUID | None = None,
+        store_deleted: bool = False,
+    ) -> CatalogChange | None:
+        try:
+            return await run_bump_script(self._bump, entities, store_id, store_deleted, self._tombstone_ttl)
+        except RedisError:
+            logger.exception('Failed to bump catalog versions for %s, deferring to the next resync', list(entities))
+            self._tracker.defer_bump(entities=entities, store_id=store_id, store_deleted=store_deleted)
+            return None
@@ -0,0 +1,52 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+class TTLCache(Generic[K, V]):
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self._items: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+
+    def get(self, key: K) -> V | None:
+        item = self._items.get(key)
+        if item is None or item[0] <= self._clock():
+            if item is not None:
+                del self._items[key]
+            self.misses += 1
+            return None
+
+        self._items.move_to_end(key)
+        self.hits += 1
+        return item[1]
+
+    def set(self, key: K, value: V) -> None:
+        self._items[key] = (self._clock() + self._ttl, value)
+        self._items.move_to_end(key)
+        while len(self._items) > self._max_size:
+            self._items.popitem(last=False)
+
+    def set_if_generation(self, key: K, value: V, generation: int) -> None:
+        if generation == self.generation:
+            self.set(key, value)
+
+    def clear(self) -> None:
+        self._items.clear()
+        self.generation += 1
+
+    def __len__(self) -> int:
+        return len(self._items)
@@ -0,0 +1,118 @@
+from collections.abc import Collection
+from uuid import UUID
+
+from psycopg_pool import AsyncConnectionPool
+
+from backend.application import interfaces
+from backend.config import Config
+from backend.domain.entities.cache import CacheStats
+from backend.domain.entities.catalog import CatalogChange, CatalogEntity
+from backend.domain.entities.category import Category, CategorySelection
+from backend.domain.entities.city import City, CitySelection
+from backend.infrastructure.cache.memory import TTLCache
+from backend.infrastructure.repository.category import CategoryRepository
+from backend.infrastructure.repository.city import CityRepository
+
+ALL_KEY = 'all'
+
+
+class InMemoryReferenceDataCache(interfaces.ReferenceDataCache):
+    def __init__(
+        self,
+        config: Config,
+    ):
+        self.cities: TTLCache[str | UUID, Collection[City] | City] = TTLCache(
+            max_size=config.cache.reference_data_max_size,
+            ttl=config.cache.reference_data_ttl,
+        )
+        self.categories: TTLCache[str | UUID, Collection[Category] | Category] = TTLCache(
+            max_size=config.cache.reference_data_max_size,
+            ttl=config.cache.reference_data_ttl,
+        )
+        self._caches = {
+            CatalogEntity.CITY: self.cities,
+            CatalogEntity.CATEGORY: self.categories,
+        }
+
+    def invalidate(self, entity: CatalogEntity) -> None:
+        cache = self._caches.get(entity)
+        if cache is not None:
+            cache.clear()
+
+    def get_stats(self) -> Collection[CacheStats]:
+        return [
+            CacheStats(name=f'reference_data:{entity}', hits=cache.hits, misses=cache.misses)
+            for entity, cache in self._caches.items()
+        ]
+
+    async def on_catalog_change(self, change: CatalogChange) -> None:
+        for entity in change.versions:
+            self.invalidate(entity)
+
+
+class CachedCityReader(interfaces.CityReader):
+    def __init__(
+        self,
+        pool: AsyncConnectionPool,
+        cache: InMemoryReferenceDataCache,
+    ):
+        self._pool = pool
+        self._cache = cache.cities
+
+    async def get_by_id(self, city_id: UUID) -> City:
+        city = self._cache.get(city_id)
+        if city is None:
+            generation = self._cache.generation
+            async with self._pool.connection() as conn:
+                city = await CityRepository(conn=conn).get_by_id(city_id=city_id)
+            self._cache.set_if_generation(city_id, city, generation=generation)
+
+        return city
+
+    async def get_all(self) -> Collection[City]:
+        cities = self._cache.get(ALL_KEY)
+        if cities is None:
+            generation = self._cache.generation
+            async with self._pool.connection() as conn:
+                cities = tuple(await CityRepository(conn=conn).get_all())
+            self._cache.set_if_generation(ALL_KEY, cities, generation=generation)
+
+        return cities
+
+    async def get_store_city_selection(self, store_id: UUID) -> Collection[CitySelection]:
+        async with self._pool.connection() as conn:
+            return await CityRepository(conn=conn).get_store_city_selection(store_id=store_id)
+
+
+class CachedCategoryReader(interfaces.CategoryReader):
+    def __init__(
+        self,
+        pool: AsyncConnectionPool,
+        cache: InMemoryReferenceDataCache,
+    ):
+        self._pool = pool
+        self._cache = cache.categories
+
+    async def get_by_id(self, category_id: UUID) -> Category:
+        category = self._cache.get(category_id)
+        if category is None:
+            generation = self._cache.generation
+            async with self._pool.connection() as conn:
+                category = await CategoryRepository(conn=conn).get_by_id(category_id=category_id)
+            self._cache.set_if_generation(category_id, category, generation=generation)
+
+        return category
+
+    async def get_all(self) -> Collection[Category]:
+        categories = self._cache.get(ALL_KEY)
+        if categories is None:
+            generation = self._cache.generation
+            async with self._pool.connection() as conn:
+                categories = tuple(await CategoryRepository(conn=conn).get_all())
+            self._cache.set_if_generation(ALL_KEY, categories, generation=generation)
+
+        return categories
+
+    async def get_store_category_selection(self, store_id: UUID) -> Collection[CategorySelection]:
+        async with self._pool.connection() as conn:
+            return await CategoryRepository(conn=conn).get_store_category_selection(store_id=store_id)
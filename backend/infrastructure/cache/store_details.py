@@ -0,0 +1,157 @@
+from collections.abc import Collection, Mapping
+from uuid import UUID
+
+import redis.asyncio as redis
+
+from backend.application import interfaces
+from backend.config import Config
+from backend.domain.entities.cache import CacheStats
+from backend.domain.entities.store import StoreDetails
+from backend.infrastructure.mapper.store import StoreMapper
+
+GET_AND_COUNT_SCRIPT = """
+local value = redis.call('GET', KEYS[1])
+if value then
+    redis.call('HINCRBY', KEYS[2], 'hits', 1)
+else
+    redis.call('HINCRBY', KEYS[2], 'misses', 1)
+end
+return value
+"""
+
+# Lua's unpack() is bounded by the C stack (LUAI_MAXCSTACK, 8000 by default), so large pages are read in chunks.
+MGET_CHUNK_SIZE = 1000
+
+MGET_AND_COUNT_SCRIPT = """
+local stats_key = KEYS[#KEYS]
+local chunk_size = tonumber(ARGV[1])
+local values = {}
+local hits = 0
+for first = 1, #KEYS - 1, chunk_size do
+    local last = math.min(first + chunk_size - 1, #KEYS - 1)
+    local chunk = redis.call('MGET', unpack(KEYS, first, last))
+    for i = 1, #chunk do
+        values[first + i - 1] = chunk[i]
+        if chunk[i] then
+            hits = hits + 1
+        end
+    end
+end
+if hits > 0 then
+    redis.call('HINCRBY', stats_key, 'hits', hits)
+end
+if #values > hits then
+    redis.call('HINCRBY', stats_key, 'misses', #values - hits)
+end
+return values
+"""
+
+GLOBAL_GENERATION_KEY = 'store:generation'
+
+# KEYS: global generation key, then (details key, generation key) pairs.
+# ARGV: ttl, then (expected generation, details json) pairs.
+SET_IF_GENERATION_SCRIPT = """
+local global_generation = redis.call('GET', KEYS[1]) or '0'
+local stored = 0
+for i = 2, #KEYS, 2 do
+    local n = i / 2
+    local generation = global_generation .. ':' .. (redis.call('GET', KEYS[i + 1]) or '0')
+    if generation == ARGV[n * 2] then
+        redis.call('SET', KEYS[i], ARGV[n * 2 + 1], 'EX', ARGV[1])
+        stored = stored + 1
+    end
+end
+return stored
+"""
+
+
+class RedisStoreDetailsCache(interfaces.StoreDetailsCache):
+    def __init__(
+        self,
+        client: redis.Redis,
+        mapper: StoreMapper,
+        config: Config,
+    ):
+        self._client = client
+        self._mapper = mapper
+        self._ttl = config.cache.store_details_ttl
+        self._stats_key = 'cache:stats:store_details'
+        self._get_and_count = client.register_script(GET_AND_COUNT_SCRIPT)
+        self._mget_and_count = client.register_script(MGET_AND_COUNT_SCRIPT)
+        self._set_if_generation = client.register_script(SET_IF_GENERATION_SCRIPT)
+
+    async def get(self, store_id: UUID) -> StoreDetails | None:
+        data = await self._get_and_count(keys=[self._details_key(store_id), self._stats_key])
+        if data is None:
+            return None
+        return self._mapper.json_to_store_details(data)
+
+    async def get_many(self, store_ids: Collection[UUID]) -> dict[UUID, StoreDetails]:
+        store_ids = list(store_ids)
+        if not store_ids:
+            return {}
+
+        keys = [self._details_key(store_id) for store_id in store_ids]
+        values = await self._mget_and_count(keys=[*keys, self._stats_key], args=[MGET_CHUNK_SIZE])
+        return {
+            store_id: self._mapper.json_to_store_details(data)
+            for store_id, data in zip(store_ids, values, strict=True)
+            if data is not None
+        }
+
+    async def get_generations(self, store_ids: Collection[UUID]) -> dict[UUID, str]:
+        store_ids = list(store_ids)
+        if not store_ids:
+            return {}
+
+        global_generation, *generations = await self._client.mget(
+            GLOBAL_GENERATION_KEY,
+            *(self._generation_key(store_id) for store_id in store_ids),
+        )
+        return {
+            store_id: f'{int(global_generation or 0)}:{int(generation or 0)}'
+            for store_id, generation in zip(store_ids, generations, strict=True)
+        }
+
+    async def set(self, details: StoreDetails, generation: str) -> None:
+        await self.set_many(details=[details], generations={details.store.id: generation})
+
+    async def set_many(self, details: Collection[StoreDetails], generations: Mapping[UUID, str]) -> None:
+        if not details:
+            return
+
+        keys = [GLOBAL_GENERATION_KEY]
+        args = [self._ttl]
+        for item in details:
+            keys += [self._details_key(item.store.id), self._generation_key(item.store.id)]
+            args += [generations[item.store.id], self._mapper.store_details_to_json(item)]
+        await self._set_if_generation(keys=keys, args=args)
+
+    async def invalidate(self, store_id: UUID) -> None:
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.incr(self._generation_key(store_id))
+            pipe.expire(self._generation_key(store_id), self._ttl)
+            pipe.delete(self._details_key(store_id))
+            await pipe.execute()
+
+    async def invalidate_all(self) -> None:
+        await self._client.incr(GLOBAL_GENERATION_KEY)
+        keys = [key async for key in self._client.scan_iter(match='store:details:*', count=500)]
+        if keys:
+            await self._client.unlink(*keys)
+
+    async def get_stats(self) -> CacheStats:
+        stats = await self._client.hgetall(self._stats_key)
+        return CacheStats(
+            name='store_details',
+            hits=int(stats.get(b'hits', 0)),
+            misses=int(stats.get(b'misses', 0)),
+        )
+
+    @staticmethod
+    def _details_key(store_id: UUID) -> str:
+        return f'store:details:{store_id}'
+
+    @staticmethod
+    def _generation_key(store_id: UUID) -> str:
+        return f'store:generation:{store_id}'
@@ -0,0 +1,254 @@
+import asyncio
+import itertools
+import logging
+import os
+import socket
+import zlib
+from collections.abc import Awaitable, Callable, Collection, Mapping
+from contextlib import suppress
+from typing import Any
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError, ResponseError
+
+from backend.application import interfaces
+from backend.config import Config
+from backend.infrastructure import serialization
+
+JOBS_STREAM = 'jobs'
+JOBS_GROUP = 'jobs:workers'
+JOBS_CONSUMERS_KEY = 'jobs:consumers'
+JOBS_LEASE_KEY = 'jobs:lease'
+ORDERING_KEY = 'chat_id'
+
+# Every shard stream is leased to a single worker, so jobs with the same ordering key never run in two processes.
+# On rebalance a worker keeps or takes up to ceil(shards / live workers) leases and releases the rest.
+LEASE_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local consumer = ARGV[1]
+local ttl = tonumber(ARGV[2])
+local rebalance = ARGV[3] == '1'
+
+redis.call('ZADD', KEYS[1], now, consumer)
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - ttl)
+local target = math.ceil((#KEYS - 1) / redis.call('ZCARD', KEYS[1]))
+
+local owned = {}
+local free = {}
+for i = 2, #KEYS do
+    local owner = redis.call('GET', KEYS[i])
+    if owner == consumer then
+        if rebalance and #owned >= target then
+            redis.call('DEL', KEYS[i])
+        else
+            redis.call('PEXPIRE', KEYS[i], ttl)
+            table.insert(owned, i - 2)
+        end
+    elseif not owner then
+        table.insert(free, i)
+    end
+end
+
+if rebalance then
+    for _, i in ipairs(free) do
+        if #owned >= target then
+            break
+        end
+        redis.call('SET', KEYS[i], consumer, 'PX', ttl)
+        table.insert(owned, i - 2)
+    end
+end
+return owned
+"""
+
+JobHandler = Callable[[Mapping[str, Any]], Awaitable[None]]
+JobEntry = tuple[str, bytes, dict[bytes, bytes]]
+
+logger = logging.getLogger(__name__)
+
+
+def shard_stream(shard: int) -> str:
+    return f'{JOBS_STREAM}:{shard}'
+
+
+class RedisJobQueue(interfaces.JobQueue):
+    def __init__(
+        self,
+        client: redis.Redis,
+        config: Config,
+    ):
+        self._client = client
+        self._max_len = config.jobs.stream_max_len
+        self._shards = config.jobs.shards
+        self._round_robin = itertools.count()
+
+    async def enqueue(self, name: str, payload: Mapping[str, Any]) -> None:
+        fields = {'name': name, 'payload': serialization.dumps(payload)}
+        if ORDERING_KEY in payload:
+            fields['key'] = str(payload[ORDERING_KEY])
+            shard = zlib.crc32(fields['key'].encode()) % self._shards
+        else:
+            shard = next(self._round_robin) % self._shards
+
+        await self._client.xadd(
+            shard_stream(shard),
+            fields,
+            maxlen=self._max_len,
+            approximate=True,
+        )
+
+
+class RedisJobWorker:
+    def __init__(
+        self,
+        client: redis.Redis,
+        config: Config,
+    ):
+        self._client = client
+        self._config = config.jobs
+        self._consumer = f'{socket.gethostname()}:{os.getpid()}'
+        self._lease = client.register_script(LEASE_SCRIPT)
+        self._owned: set[int] = set()
+        self._recovering: dict[int, bytes] = {}
+
+    async def run(self, handlers: Mapping[str, JobHandler]) -> None:
+        while True:
+            try:
+                await self._create_groups()
+                while True:
+                    await self._rebalance()
+                    entries = await self._claim_pending() or await self._read_new()
+                    if entries:
+                        await self._handle_batch(handlers, entries)
+            except RedisError:
+                logger.exception('Job stream is unavailable, retrying in %s seconds', self._config.block_timeout)
+                self._owned = set()
+                self._recovering = {}
+                await asyncio.sleep(self._config.block_timeout)
+
+    async def _create_groups(self) -> None:
+        for shard in range(self._config.shards):
+            try:
+                await self._client.xgroup_create(shard_stream(shard), JOBS_GROUP, id='0', mkstream=True)
+            except ResponseError as exc:
+                if 'BUSYGROUP' not in str(exc):
+                    raise
+
+    async def _renew_leases(self, rebalance: bool) -> set[int]:
+        owned = await self._lease(
+            keys=[JOBS_CONSUMERS_KEY, *(f'{JOBS_LEASE_KEY}:{shard}' for shard in range(self._config.shards))],
+            args=[self._consumer, int(self._config.claim_idle * 1000), '1' if rebalance else ''],
+        )
+        return {int(shard) for shard in owned}
+
+    async def _rebalance(self) -> None:
+        owned = await self._renew_leases(rebalance=True)
+        # A newly leased shard may hold entries the previous owner read but never acked. They go first, before
+        # anything newer from that shard, and the lease guarantees the previous owner is no longer running them.
+        for shard in owned - self._owned:
+            self._recovering[shard] = b'0-0'
+        for shard in self._owned - owned:
+            self._recovering.pop(shard, None)
+        self._owned = owned
+
+    async def _claim_pending(self) -> list[JobEntry]:
+        for shard, cursor in list(self._recovering.items()):
+            stream = shard_stream(shard)
+            next_cursor, entries, *_ = await self._client.xautoclaim(
+                stream,
+                JOBS_GROUP,
+                self._consumer,
+                min_idle_time=0,
+                start_id=cursor,
+                count=self._config.batch_size,
+            )
+            if next_cursor == b'0-0':
+                del self._recovering[shard]
+            else:
+                self._recovering[shard] = next_cursor
+
+            claimed = [(stream, entry_id, fields) for entry_id, fields in entries if fields]
+            if claimed:
+                return claimed
+        return []
+
+    async def _read_new(self) -> list[JobEntry]:
+        streams = {shard_stream(shard): '>' for shard in self._owned if shard not in self._recovering}
+        if not streams:
+            await asyncio.sleep(self._config.block_timeout)
+            return []
+
+        response = await self._client.xreadgroup(
+            JOBS_GROUP,
+            self._consumer,
+            streams,
+            count=self._config.batch_size,
+            block=int(self._config.block_timeout * 1000),
+        )
+        return [(stream.decode(), entry_id, fields) for stream, entries in response for entry_id, fields in entries]
+
+    async def _handle_batch(self, handlers: Mapping[str, JobHandler], entries: list[JobEntry]) -> None:
+        groups: dict[bytes, list[JobEntry]] = {}
+        for entry in entries:
+            _, entry_id, fields = entry
+            groups.setdefault(fields.get(b'key', entry_id), []).append(entry)
+
+        in_flight = {(stream, entry_id) for stream, entry_id, _ in entries}
+        heartbeat = asyncio.create_task(self._keep_claimed(in_flight))
+        try:
+            await asyncio.gather(*(self._handle_group(handlers, group, in_flight) for group in groups.values()))
+        finally:
+            heartbeat.cancel()
+            with suppress(asyncio.CancelledError):
+                await heartbeat
+
+    async def _handle_group(
+        self,
+        handlers: Mapping[str, JobHandler],
+        group: list[JobEntry],
+        in_flight: set[tuple[str, bytes]],
+    ) -> None:
+        for stream, entry_id, fields in group:
+            await self._handle(handlers, stream, entry_id, fields)
+            in_flight.discard((stream, entry_id))
+
+    async def _keep_claimed(self, entries: Collection[tuple[str, bytes]]) -> None:
+        while True:
+            await asyncio.sleep(self._config.claim_idle / 3)
+            try:
+                await self._renew_leases(rebalance=False)
+
+                by_stream: dict[str, list[bytes]] = {}
+                for stream, entry_id in list(entries):
+                    by_stream.setdefault(stream, []).append(entry_id)
+                for stream, entry_ids in by_stream.items():
+                    await self._client.xclaim(
+                        stream,
+                        JOBS_GROUP,
+                        self._consumer,
+                        min_idle_time=0,
+                        message_ids=entry_ids,
+                        justid=True,
+                    )
+            except RedisError:
+                logger.exception('Failed to extend the claim on running jobs')
+
+    async def _handle(
+        self,
+        handlers: Mapping[str, JobHandler],
+        stream: str,
+        entry_id: bytes,
+        fields: dict[bytes, bytes],
+    ) -> None:
+        name = fields[b'name'].decode()
+        handler = handlers.get(name)
+        if handler is None:
+            logger.error('No handler for job %s (%s)', name, entry_id)
+        else:
+            try:
+                await handler(serialization.loads(fields[b'payload']))
+            except Exception:
+                logger.exception('Job %s (%s) failed', name, entry_id)
+
+        await self._client.xack(stream, JOBS_GROUP, entry_id)
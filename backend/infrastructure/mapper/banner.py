@@ -1,18 +1,29 @@
 import json
+from dataclasses import asdict
 from uuid import UUID
 
+from backend.application.services.media import MediaUrlService
 from backend.domain.entities.banner import Banner
 
 
 class BannerMapper:
-    @staticmethod
-    def entity_to_json(banner: Banner) -> str:
+    def __init__(
+        self,
+        media_urls: MediaUrlService,
+    ):
+        self._media_urls = media_urls
+
+    def entity_to_json(self, banner: Banner) -> str:
+        assets = self._media_urls.get_banner_assets(banner=banner)
         return json.dumps(
             {
                 'id': str(banner.id),
                 'media_type': banner.media_type,
                 'target_url': banner.target_url,
-                'display_priority': banner.display_priority
+                'display_priority': banner.display_priority,
+                'media_files': banner.media_files,
+                'media_derivatives': banner.media_derivatives,
+                'media': [asdict(asset) for asset in assets],
             },
         )
 
@@ -23,5 +34,7 @@ class BannerMapper:
             id=UUID(parsed_dict['id']),
             media_type=parsed_dict['media_type'],
             target_url=parsed_dict['target_url'],
-            display_priority=parsed_dict['display_priority']
+            display_priority=parsed_dict['display_priority'],
+            media_files=parsed_dict.get('media_files', {}),
+            media_derivatives=parsed_dict.get('media_derivatives', {}),
         )
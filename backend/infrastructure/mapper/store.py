@@ -1,3 +1,6 @@
+import json
+from uuid import UUID
+
 from backend.domain.entities.category import Category
 from backend.domain.entities.city import City
 from backend.domain.entities.store import Store, StoreDetails
@@ -16,6 +19,8 @@ class StoreMapper:
                 main_media_type=result['main_media_type'],
                 main_page_url=result['main_page_url'],
                 display_priority=result['display_priority'],
+                media_files=result['media_files'],
+                media_derivatives=result['media_derivatives'],
             ),
             cities=[
                 City(
@@ -41,3 +46,63 @@ class StoreMapper:
                 for resource in result['resources']
             ],
         )
+
+    @staticmethod
+    def store_details_to_json(details: StoreDetails) -> str:
+        return json.dumps(
+            {
+                'store': {
+                    'id': str(details.store.id),
+                    'title': details.store.title,
+                    'description': details.store.description,
+                    'preview_media_type': details.store.preview_media_type,
+                    'main_media_type': details.store.main_media_type,
+                    'main_page_url': details.store.main_page_url,
+                    'display_priority': details.store.display_priority,
+                    'media_files': details.store.media_files,
+                    'media_derivatives': details.store.media_derivatives,
+                },
+                'cities': [{'id': str(city.id), 'title': city.title} for city in details.cities],
+                'categories': [{'id': str(category.id), 'title': category.title} for category in details.categories],
+                'resources': [
+                    {
+                        'id': str(resource.id),
+                        'title': resource.title,
+                        'target_url': resource.target_url,
+                        'store_id': str(resource.store_id),
+                    }
+                    for resource in details.resources
+                ],
+            },
+        )
+
+    @staticmethod
+    def json_to_store_details(json_str: str | bytes) -> StoreDetails:
+        parsed_dict = json.loads(json_str)
+        store = parsed_dict['store']
+        return StoreDetails(
+            store=Store(
+                id=UUID(store['id']),
+                title=store['title'],
+                description=store['description'],
+                preview_media_type=store['preview_media_type'],
+                main_media_type=store['main_media_type'],
+                main_page_url=store['main_page_url'],
+                display_priority=store['display_priority'],
+                media_files=store.get('media_files', {}),
+                media_derivatives=store.get('media_derivatives', {}),
+            ),
+            cities=[City(id=UUID(city['id']), title=city['title']) for city in parsed_dict['cities']],
+            categories=[
+                Category(id=UUID(category['id']), title=category['title']) for category in parsed_dict['categories']
+            ],
+            resources=[
+                StoreResource(
+                    id=UUID(resource['id']),
+                    title=resource['title'],
+                    target_url=resource['target_url'],
+                    store_id=UUID(resource['store_id']),
+                )
+                for resource in parsed_dict['resources']
+            ],
+        )
@@ -1,4 +1,3 @@
-import asyncio
 from collections.abc import Collection
 from uuid import UUID
 
@@ -7,9 +6,56 @@ import redis.asyncio as redis
 from backend.application import interfaces
 from backend.domain import exceptions as domain_exceptions
 from backend.domain.entities.banner import Banner
-from backend.domain.entities.media import BannerMediaName, Media
 from backend.infrastructure.mapper.banner import BannerMapper
 
+BANNER_KEY_PREFIX = 'banner:'
+
+BACKFILL_FEED_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    for _, id in ipairs(redis.call('SMEMBERS', KEYS[3])) do
+        local data = redis.call('GET', ARGV[1] .. id)
+        if data then
+            redis.call('ZADD', KEYS[1], cjson.decode(data)['display_priority'], id)
+        end
+    end
+    redis.call('DEL', KEYS[3])
+end
+"""
+
+COLLECT_FEED_SCRIPT = """
+local items = {}
+for _, id in ipairs(redis.call('ZREVRANGE', KEYS[1], 0, -1)) do
+    local data = redis.call('GET', ARGV[1] .. id)
+    if data then
+        items[#items + 1] = data
+    end
+end
+"""
+
+READ_FEED_SCRIPT = """
+return items
+"""
+
+REBUILD_FEED_SCRIPT = """
+if #items == 0 then
+    redis.call('DEL', KEYS[2])
+    return false
+end
+local feed = '{"banners": [' .. table.concat(items, ', ') .. ']}'
+redis.call('SET', KEYS[2], feed)
+return feed
+"""
+
+UPSERT_BANNER_SCRIPT = """
+redis.call('SET', ARGV[1] .. ARGV[2], ARGV[3])
+redis.call('ZADD', KEYS[1], ARGV[4], ARGV[2])
+"""
+
+DELETE_BANNER_SCRIPT = """
+redis.call('DEL', ARGV[1] .. ARGV[2])
+redis.call('ZREM', KEYS[1], ARGV[2])
+"""
+
 
 class BannerRepository(
     interfaces.BannerReader,
@@ -21,12 +67,20 @@ class BannerRepository(
         self,
         client: redis.Redis,
         mapper: BannerMapper,
-        s3_client: interfaces.S3Client,
     ):
         self._client = client
         self._mapper = mapper
-        self._s3_client = s3_client
-        self._ids_key = 'banner:ids'
+        self._feed_key = 'banner:feed'
+        self._feed_json_key = 'banner:feed:json'
+        self._legacy_ids_key = 'banner:ids'
+        self._read_feed = client.register_script(BACKFILL_FEED_SCRIPT + COLLECT_FEED_SCRIPT + READ_FEED_SCRIPT)
+        self._rebuild_feed = client.register_script(BACKFILL_FEED_SCRIPT + COLLECT_FEED_SCRIPT + REBUILD_FEED_SCRIPT)
+        self._upsert_banner = client.register_script(
+            BACKFILL_FEED_SCRIPT + UPSERT_BANNER_SCRIPT + COLLECT_FEED_SCRIPT + REBUILD_FEED_SCRIPT,
+        )
+        self._delete_banner = client.register_script(
+            BACKFILL_FEED_SCRIPT + DELETE_BANNER_SCRIPT + COLLECT_FEED_SCRIPT + REBUILD_FEED_SCRIPT,
+        )
 
     async def get_by_id(self, banner_id: UUID) -> Banner:
         redis_key = self._banner_key(banner_id)
@@ -36,61 +90,39 @@ class BannerRepository(
         return self._mapper.json_to_entity(data)
 
     async def get_all(self) -> Collection[Banner]:
-        id_strs = await self._client.smembers(self._ids_key)
-        if not id_strs:
+        data_list = await self._read_feed(keys=self._feed_keys, args=[BANNER_KEY_PREFIX])
+        if not data_list:
             raise domain_exceptions.BannersNotFoundError
 
-        keys = [self._banner_key(UUID(id_str.decode())) for id_str in id_strs]
-        data_list = await self._client.mget(*keys)
+        return [self._mapper.json_to_entity(data) for data in data_list]
 
-        banners = [self._mapper.json_to_entity(data) for data in data_list if data is not None]
-        return banners
-
-    async def save(self, banner: Banner, pc_media: Media, mobile_media: Media, bucket: str) -> None:
-        redis_key = self._banner_key(banner.id)
-        json_data = self._mapper.entity_to_json(banner)
-        await self._client.set(redis_key, json_data)
-        await self._client.sadd(self._ids_key, str(banner.id))
+    async def get_feed_json(self) -> bytes:
+        feed = await self._client.get(self._feed_json_key)
+        if feed is None:
+            feed = await self._rebuild_feed(keys=self._feed_keys, args=[BANNER_KEY_PREFIX])
+        if not feed:
+            raise domain_exceptions.BannersNotFoundError
+        return feed
 
-        media_items = [
-            (BannerMediaName.PC, pc_media),
-            (BannerMediaName.MOBILE, mobile_media),
-        ]
+    async def save(self, banner: Banner) -> None:
+        await self._write(banner)
 
-        tasks = [
-            self._s3_client.save(
-                bucket=bucket,
-                file_name=f'{banner.id}-{media_name}.{media.extension}',
-                data=media.media_obj,
-            )
-            for media_name, media in media_items
-        ]
+    async def update(self, banner: Banner) -> None:
+        await self._write(banner)
 
-        await asyncio.gather(*tasks)
+    async def delete(self, banner: Banner) -> None:
+        await self._delete_banner(keys=self._feed_keys, args=[BANNER_KEY_PREFIX, str(banner.id)])
 
-    async def update(self, banner: Banner) -> None:
-        redis_key = self._banner_key(banner.id)
-        json_data = self._mapper.entity_to_json(banner)
-        await self._client.set(redis_key, json_data)
-        await self._client.sadd(self._ids_key, str(banner.id))
-
-    async def update_media(self, banner: Banner, media: Media, media_name: BannerMediaName, bucket: str) -> None:
-        redis_key = self._banner_key(banner.id)
-        json_data = self._mapper.entity_to_json(banner)
-        await self._client.set(redis_key, json_data)
-        await self._client.sadd(self._ids_key, str(banner.id))
-
-        await self._s3_client.save(
-            bucket=bucket,
-            file_name=f'{banner.id}-{media_name}.{media.extension}',
-            data=media.media_obj,
+    async def _write(self, banner: Banner) -> None:
+        await self._upsert_banner(
+            keys=self._feed_keys,
+            args=[BANNER_KEY_PREFIX, str(banner.id), self._mapper.entity_to_json(banner), banner.display_priority],
         )
 
-    async def delete(self, banner: Banner) -> None:
-        redis_key = self._banner_key(banner.id)
-        await self._client.delete(redis_key)
-        await self._client.srem(self._ids_key, str(banner.id))
+    @property
+    def _feed_keys(self) -> list[str]:
+        return [self._feed_key, self._feed_json_key, self._legacy_ids_key]
 
     @staticmethod
     def _banner_key(banner_id: UUID) -> str:
-        return f'banner:{banner_id}'
+        return f'{BANNER_KEY_PREFIX}{banner_id}'
@@ -0,0 +1,95 @@
+from collections.abc import Collection, Mapping
+from datetime import datetime
+from itertools import chain
+from uuid import UUID
+
+from psycopg import AsyncConnection
+from psycopg.rows import class_row
+
+from backend.application import interfaces
+from backend.domain.entities.media import Media
+
+
+class MediaRepository(
+    interfaces.MediaObjectReader,
+    interfaces.MediaObjectSaver,
+    interfaces.MediaObjectDeleter,
+    interfaces.MediaReferenceSaver,
+    interfaces.MediaReferenceDeleter,
+):
+    def __init__(
+        self,
+        conn: AsyncConnection,
+    ):
+        self._conn = conn
+
+    async def get_by_digest(self, digest: str) -> Media | None:
+        async with self._conn.cursor(row_factory=class_row(Media)) as cursor:
+            query = (
+                'UPDATE media_objects SET last_used_at = now() '
+                'WHERE digest = %s '
+                'RETURNING digest, extension, size, derivatives'
+            )
+            await cursor.execute(query, (digest,))
+            result = await cursor.fetchone()
+            await self._conn.commit()
+            return result
+
+    async def get_by_source(self, source_id: str) -> Media | None:
+        async with self._conn.cursor(row_factory=class_row(Media)) as cursor:
+            query = (
+                'UPDATE media_objects AS mo SET last_used_at = now() '
+                'FROM media_sources AS ms '
+                'WHERE ms.source_id = %s AND mo.digest = ms.digest '
+                'RETURNING mo.digest, mo.extension, mo.size, mo.derivatives'
+            )
+            await cursor.execute(query, (source_id,))
+            result = await cursor.fetchone()
+            await self._conn.commit()
+            return result
+
+    async def save(self, media: Media, source_id: str) -> None:
+        async with self._conn.cursor() as cursor:
+            await cursor.execute(
+                'INSERT INTO media_objects (digest, extension, size, derivatives) VALUES (%s, %s, %s, %s) '
+                'ON CONFLICT (digest) DO UPDATE SET last_used_at = now()',
+                (media.digest, media.extension, media.size, list(media.derivatives)),
+            )
+            await cursor.execute(
+                'INSERT INTO media_sources (source_id, digest) VALUES (%s, %s) '
+                'ON CONFLICT (source_id) DO UPDATE SET digest = EXCLUDED.digest',
+                (source_id, media.digest),
+            )
+            await self._conn.commit()
+
+    async def delete_unreferenced(self, used_before: datetime) -> Collection[Media]:
+        async with self._conn.cursor(row_factory=class_row(Media)) as cursor:
+            query = (
+                'DELETE FROM media_objects '
+                'WHERE digest IN ( '
+                '    SELECT mo.digest FROM media_objects AS mo '
+                '    WHERE mo.last_used_at < %s '
+                '    AND NOT EXISTS (SELECT 1 FROM media_references AS mr WHERE mr.digest = mo.digest) '
+                '    FOR UPDATE SKIP LOCKED '
+                ') '
+                'RETURNING digest, extension, size, derivatives'
+            )
+            await cursor.execute(query, (used_before,))
+            return await cursor.fetchall()
+
+    async def save_many(self, owner_id: UUID, media: Mapping[str, Media]) -> None:
+        values_sql = ', '.join(['(%s, %s, %s)'] * len(media))
+
+        query = (
+            f'INSERT INTO media_references (owner_id, media_name, digest) VALUES {values_sql} '
+            'ON CONFLICT (owner_id, media_name) DO UPDATE SET digest = EXCLUDED.digest'
+        )
+
+        params = list(chain.from_iterable((owner_id, media_name, item.digest) for media_name, item in media.items()))
+
+        async with self._conn.cursor() as cursor:
+            await cursor.execute(query, params)
+
+    async def delete_by_owner(self, owner_id: UUID) -> None:
+        async with self._conn.cursor() as cursor:
+            await cursor.execute('DELETE FROM media_references WHERE owner_id = %s', (owner_id,))
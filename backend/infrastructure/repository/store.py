@@ -1,4 +1,3 @@
-import asyncio
 from collections.abc import Collection
 from uuid import UUID
 
@@ -7,10 +6,74 @@ from psycopg.rows import class_row, dict_row
 
 from backend.application import interfaces
 from backend.domain import exceptions as domain_exceptions
-from backend.domain.entities.media import Media, StoreMediaName
-from backend.domain.entities.store import Store, StoreDetails
+from backend.domain.entities.pagination import Pagination
+from backend.domain.entities.store import Store, StoreCursor, StoreDetails, StoreSearchMode
 from backend.infrastructure.mapper.store import StoreMapper
 
+MEDIA_FILES_COLUMN = (
+    'COALESCE( '
+    "    (SELECT json_object_agg(mr.media_name, mo.digest || '.' || mo.extension) "
+    '     FROM media_references AS mr '
+    '     JOIN media_objects AS mo ON mo.digest = mr.digest '
+    '     WHERE mr.owner_id = s.id), '
+    "    '{}' "
+    ') AS media_files'
+)
+
+MEDIA_DERIVATIVES_COLUMN = (
+    'COALESCE( '
+    '    (SELECT json_object_agg(mr.media_name, mo.derivatives) '
+    '     FROM media_references AS mr '
+    '     JOIN media_objects AS mo ON mo.digest = mr.digest '
+    '     WHERE mr.owner_id = s.id), '
+    "    '{}' "
+    ') AS media_derivatives'
+)
+
+STORE_COLUMNS = (
+    's.id, s.title, s.description, s.preview_media_type, s.main_media_type, s.main_page_url, s.display_priority, '
+    f'{MEDIA_FILES_COLUMN}, {MEDIA_DERIVATIVES_COLUMN}'
+)
+
+STORE_DETAILS_QUERY = (
+    'SELECT '
+    '    s.id AS store_id, '
+    '    s.title AS store_title, '
+    '    s.description, '
+    '    s.preview_media_type, '
+    '    s.main_media_type, '
+    '    s.main_page_url, '
+    '    s.display_priority, '
+    '    COALESCE( '
+    "        (SELECT json_agg(json_build_object('id', c.id, 'title', c.title) ORDER BY c.title) "
+    '         FROM stores_cities AS sc '
+    '         JOIN cities AS c ON c.id = sc.city_id '
+    '         WHERE sc.store_id = s.id), '
+    "        '[]' "
+    '    ) AS cities, '
+    '    COALESCE( '
+    "        (SELECT json_agg(json_build_object('id', cat.id, 'title', cat.title) ORDER BY cat.title) "
+    '         FROM stores_categories AS sc2 '
+    '         JOIN categories AS cat ON cat.id = sc2.category_id '
+    '         WHERE sc2.store_id = s.id), '
+    "        '[]' "
+    '    ) AS categories, '
+    '    COALESCE( '
+    '        (SELECT json_agg( '
+    '             json_build_object( '
+    "                 'id', sr.id, 'title', sr.title, 'target_url', sr.target_url, 'store_id', sr.store_id "
+    '             ) '
+    '             ORDER BY sr.title '
+    '         ) '
+    '         FROM store_resources AS sr '
+    '         WHERE sr.store_id = s.id), '
+    "        '[]' "
+    '    ) AS resources, '
+    f'    {MEDIA_FILES_COLUMN}, '
+    f'    {MEDIA_DERIVATIVES_COLUMN} '
+    'FROM stores AS s'
+)
+
 
 class StoreRepository(
     interfaces.StoreReader,
@@ -22,17 +85,15 @@ class StoreRepository(
         self,
         conn: AsyncConnection,
         mapper: StoreMapper,
-        s3_client: interfaces.S3Client,
     ):
         self._conn = conn
         self._mapper = mapper
-        self._s3_client = s3_client
 
     async def get_by_id(self, store_id: UUID) -> Store:
         async with self._conn.cursor(row_factory=class_row(Store)) as cursor:
             query = (
-                'SELECT id, title, description, preview_media_type, main_media_type, main_page_url, display_priority '
-                'FROM stores WHERE id = %s'
+                f'SELECT {STORE_COLUMNS} '
+                'FROM stores AS s WHERE s.id = %s'
             )
             await cursor.execute(query, (store_id,))
             result = await cursor.fetchone()
@@ -42,43 +103,7 @@ class StoreRepository(
 
     async def get_with_relations(self, store_id: UUID) -> StoreDetails:
         async with self._conn.cursor(row_factory=dict_row) as cursor:
-            query = (
-                'SELECT '
-                '    s.id AS store_id, '
-                '    s.title AS store_title, '
-                '    s.description, '
-                '    s.preview_media_type, '
-                '    s.main_media_type, '
-                '    s.main_page_url, '
-                '    s.display_priority, '
-                '    COALESCE( '
-                '        json_agg( '
-                "            DISTINCT jsonb_build_object('id', c.id, 'title', c.title) "
-                '        ) FILTER (WHERE c.id IS NOT NULL), '
-                "        '[]' "
-                '    ) AS cities, '
-                '    COALESCE( '
-                '        json_agg( '
-                "            DISTINCT jsonb_build_object('id', cat.id, 'title', cat.title) "
-                '        ) FILTER (WHERE cat.id IS NOT NULL), '
-                "        '[]' "
-                '    ) AS categories, '
-                '    COALESCE( '
-                '        json_agg( '
-                '            DISTINCT '
-                "jsonb_build_object('id', sr.id, 'title', sr.title, 'target_url', sr.target_url, 'store_id', sr.store_id) "
-                '        ) FILTER (WHERE sr.id IS NOT NULL), '
-                "        '[]' "
-                '    ) AS resources '
-                'FROM stores AS s '
-                'LEFT JOIN stores_cities AS sc ON s.id = sc.store_id '
-                'LEFT JOIN cities AS c ON sc.city_id = c.id '
-                'LEFT JOIN stores_categories AS sc2 ON s.id = sc2.store_id '
-                'LEFT JOIN categories AS cat ON sc2.category_id = cat.id '
-                'LEFT JOIN store_resources AS sr ON sr.store_id = s.id '
-                'WHERE s.id = %s '
-                'GROUP BY s.id;'
-            )
+            query = f'{STORE_DETAILS_QUERY} WHERE s.id = %s'
 
             await cursor.execute(query, (store_id,))
             result = await cursor.fetchone()
@@ -87,11 +112,20 @@ class StoreRepository(
 
             return self._mapper.result_to_store_details(result=result)
 
+    async def get_many_with_relations(self, store_ids: Collection[UUID]) -> Collection[StoreDetails]:
+        async with self._conn.cursor(row_factory=dict_row) as cursor:
+            query = f'{STORE_DETAILS_QUERY} WHERE s.id = ANY(%s)'
+
+            await cursor.execute(query, (list(store_ids),))
+            result = await cursor.fetchall()
+
+            return [self._mapper.result_to_store_details(result=row) for row in result]
+
     async def get_all(self) -> Collection[Store]:
         async with self._conn.cursor(row_factory=class_row(Store)) as cursor:
             query = (
-                'SELECT id, title, description, preview_media_type, main_media_type, main_page_url, display_priority '
-                'FROM stores ORDER BY display_priority DESC'
+                f'SELECT {STORE_COLUMNS} '
+                'FROM stores AS s ORDER BY s.display_priority DESC'
             )
             await cursor.execute(query)
             result = await cursor.fetchall()
@@ -99,62 +133,140 @@ class StoreRepository(
                 raise domain_exceptions.StoresNotFoundError
             return result
 
-    async def get_by_filter(
-        self,
-        store_title: str,
-        city_title: str,
-        categories_title: Collection[str],
-    ) -> Collection[Store]:
+    async def get_page(self, page_size: int, offset: int = 0, after: StoreCursor | None = None) -> Pagination[Store]:
         async with self._conn.cursor(row_factory=class_row(Store)) as cursor:
             query = (
-                'SELECT DISTINCT '
-                's.id, '
-                's.title, '
-                's.description, '
-                's.preview_media_type, '
-                's.main_media_type, '
-                's.main_page_url, '
-                's.display_priority '
-                'FROM stores s '
-                'JOIN stores_cities sc ON s.id = sc.store_id '
-                'JOIN cities c ON sc.city_id = c.id '
-                'JOIN stores_categories sc2 ON s.id = sc2.store_id '
-                'JOIN categories cat ON sc2.category_id = cat.id '
-                'WHERE s.title ILIKE %s '
+                f'SELECT {STORE_COLUMNS} '
+                'FROM stores AS s '
             )
+            params = []
 
-            filters = [f'%{store_title}%' if store_title else '%']
+            if after is not None:
+                query += 'WHERE (s.display_priority, s.id) < (%s, %s) '
+                params.extend((after.display_priority, after.id))
 
-            if city_title:
-                query += ' AND c.title ILIKE %s '
-                filters.append(f'%{city_title}%')
+            query += 'ORDER BY s.display_priority DESC, s.id DESC LIMIT %s OFFSET %s'
+            params.extend((page_size, offset))
 
-            if categories_title:
-                query += ' AND cat.title = ANY(%s) '
-                filters.append(list(categories_title))
+            await cursor.execute(query, params)
+            items = await cursor.fetchall()
 
-            query += 'ORDER BY s.display_priority;'
+        async with self._conn.cursor() as cursor:
+            await cursor.execute('SELECT count(*) FROM stores')
+            (total,) = await cursor.fetchone()
 
-            await cursor.execute(query, filters)
-            result = await cursor.fetchall()
-            if not result:
-                raise domain_exceptions.StoresNotFoundByFiltersError
-            return result
+        if not total:
+            raise domain_exceptions.StoresNotFoundError
+
+        return Pagination[Store](total=total, size=page_size, items=items)
 
-    async def save(
+    async def get_by_filter(
         self,
-        store: Store,
-        preview_media_pc: Media,
-        preview_media_mobile: Media,
-        main_media_pc: Media,
-        main_media_mobile: Media,
-        bucket: str,
-    ) -> None:
+        store_title: str | None,
+        city_title: str | None,
+        categories_title: Collection[str] | None,
+        page_size: int,
+        offset: int = 0,
+        search_mode: StoreSearchMode = StoreSearchMode.SUBSTRING,
+    ) -> Pagination[Store]:
+        where_sql, filters = self._build_filter_clause(
+            store_title=store_title,
+            city_title=city_title,
+            categories_title=categories_title,
+            search_mode=search_mode,
+        )
+
+        order_sql = 'ORDER BY s.display_priority, s.id'
+        order_params = []
+        if store_title and search_mode == StoreSearchMode.FUZZY:
+            order_sql = 'ORDER BY word_similarity(%s, s.title) DESC, s.display_priority, s.id'
+            order_params.append(store_title)
+
+        async with self._conn.cursor(row_factory=dict_row) as cursor:
+            query = (
+                f'SELECT {STORE_COLUMNS}, '
+                'count(*) OVER () AS total '
+                f'FROM stores s {where_sql} '
+                f'{order_sql} '
+                'LIMIT %s OFFSET %s'
+            )
+            await cursor.execute(query, [*filters, *order_params, page_size, offset])
+            rows = await cursor.fetchall()
+
+            if rows:
+                total = rows[0]['total']
+            elif offset:
+                await cursor.execute(f'SELECT count(*) AS total FROM stores s {where_sql}', filters)
+                total = (await cursor.fetchone())['total']
+            else:
+                total = 0
+
+        if not total:
+            raise domain_exceptions.StoresNotFoundByFiltersError
+
+        return Pagination[Store](
+            total=total,
+            size=page_size,
+            items=[
+                Store(
+                    id=row['id'],
+                    title=row['title'],
+                    description=row['description'],
+                    preview_media_type=row['preview_media_type'],
+                    main_media_type=row['main_media_type'],
+                    main_page_url=row['main_page_url'],
+                    display_priority=row['display_priority'],
+                    media_files=row['media_files'],
+                    media_derivatives=row['media_derivatives'],
+                )
+                for row in rows
+            ],
+        )
+
+    @staticmethod
+    def _build_filter_clause(
+        store_title: str | None,
+        city_title: str | None,
+        categories_title: Collection[str] | None,
+        search_mode: StoreSearchMode,
+    ) -> tuple[str, list]:
+        city_sql = 'SELECT 1 FROM stores_cities sc JOIN cities c ON c.id = sc.city_id WHERE sc.store_id = s.id'
+        category_sql = (
+            'SELECT 1 FROM stores_categories sc2 JOIN categories cat ON cat.id = sc2.category_id '
+            'WHERE sc2.store_id = s.id'
+        )
+        conditions = []
+        filters = []
+
+        if search_mode == StoreSearchMode.FUZZY:
+            title_sql, title_filter = '%s <%% {column}', '{value}'
+        else:
+            title_sql, title_filter = '{column} ILIKE %s', '%{value}%'
+
+        if store_title:
+            conditions.append(title_sql.format(column='s.title'))
+            filters.append(title_filter.format(value=store_title))
+
+        if city_title:
+            city_sql += f' AND {title_sql.format(column="c.title")}'
+            filters.append(title_filter.format(value=city_title))
+        conditions.append(f'EXISTS ({city_sql})')
+
+        if categories_title:
+            category_sql += ' AND cat.title = ANY(%s)'
+            filters.append(list(categories_title))
+        conditions.append(f'EXISTS ({category_sql})')
+
+        return f'WHERE {" AND ".join(conditions)}', filters
+
+    async def save(self, store: Store) -> bool:
         async with self._conn.cursor() as cursor:
             stmt = (
                 'INSERT INTO stores '
                 '(id, title, description, preview_media_type, main_media_type, main_page_url, display_priority) '
-                'VALUES (%s, %s, %s, %s, %s, %s, %s)'
+                'VALUES (%s, %s, %s, %s, %s, %s, %s) '
+                'ON CONFLICT (id) DO NOTHING '
+                'RETURNING id'
             )
 
             await cursor.execute(
@@ -169,24 +281,7 @@ class StoreRepository(
                     store.display_priority,
                 ),
             )
-
-            media_items = [
-                (StoreMediaName.PC_PREVIEW, preview_media_pc),
-                (StoreMediaName.MOBILE_PREVIEW, preview_media_mobile),
-                (StoreMediaName.PC_MAIN, main_media_pc),
-                (StoreMediaName.MOBILE_MAIN, main_media_mobile),
-            ]
-
-            tasks = [
-                self._s3_client.save(
-                    bucket=bucket,
-                    file_name=f'{store.id}-{media_name}.{media.extension}',
-                    data=media.media_obj,
-                )
-                for media_name, media in media_items
-            ]
-
-            await asyncio.gather(*tasks)
+            return await cursor.fetchone() is not None
 
     async def update(self, store: Store) -> None:
         async with self._conn.cursor() as cursor:
@@ -215,19 +310,6 @@ class StoreRepository(
 
             await self._conn.commit()
 
-    async def update_media(self, store: Store, media: Media, media_name: StoreMediaName, bucket: str) -> None:
-        async with self._conn.cursor() as cursor:
-            stmt = 'UPDATE stores SET preview_media_type = %s, main_media_type = %s WHERE id = %s'
-            await cursor.execute(stmt, (store.preview_media_type, store.main_media_type, store.id))
-
-            await self._conn.commit()
-
-            await self._s3_client.save(
-                bucket=bucket,
-                file_name=f'{store.id}-{media_name}.{media.extension}',
-                data=media.media_obj,
-            )
-
     async def delete(self, store: Store) -> None:
         async with self._conn.cursor() as cursor:
             stmt = 'DELETE FROM stores WHERE id = %s'
@@ -0,0 +1,48 @@
+import json
+from typing import Any
+from uuid import UUID
+
+from backend.domain.entities.media import Media, MediaSource, MediaType
+
+UUID_TAG = '__uuid__'
+UUID_MAP_TAG = '__uuid_map__'
+MEDIA_TAG = '__media__'
+MEDIA_SOURCE_TAG = '__media_source__'
+
+
+def pack_value(value: Any) -> Any:
+    if isinstance(value, Media):
+        return {MEDIA_TAG: [value.digest, value.extension, value.size, list(value.derivatives)]}
+    if isinstance(value, MediaSource):
+        return {MEDIA_SOURCE_TAG: [value.file_id, value.source_id, value.extension]}
+    if isinstance(value, UUID):
+        return {UUID_TAG: str(value)}
+    if isinstance(value, dict):
+        if any(isinstance(key, UUID) for key in value):
+            return {UUID_MAP_TAG: {str(key): pack_value(item) for key, item in value.items()}}
+        return {key: pack_value(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [pack_value(item) for item in value]
+    return value
+
+
+def unpack_value(value: dict[str, Any]) -> Any:
+    if MEDIA_TAG in value:
+        digest, extension, size, derivatives = value[MEDIA_TAG]
+        return Media(digest=digest, extension=MediaType(extension), size=size, derivatives=derivatives)
+    if MEDIA_SOURCE_TAG in value:
+        file_id, source_id, extension = value[MEDIA_SOURCE_TAG]
+        return MediaSource(file_id=file_id, source_id=source_id, extension=MediaType(extension))
+    if UUID_TAG in value:
+        return UUID(value[UUID_TAG])
+    if UUID_MAP_TAG in value:
+        return {UUID(key): item for key, item in value[UUID_MAP_TAG].items()}
+    return value
+
+
+def dumps(data: Any) -> str:
+    return json.dumps(pack_value(data), ensure_ascii=False, separators=(',', ':'))
+
+
+def loads(data: str | bytes) -> Any:
+    return json.loads(data, object_hook=unpack_value)
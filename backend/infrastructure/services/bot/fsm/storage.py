@@ -0,0 +1,6 @@
+from aiogram.fsm.storage.redis import RedisStorage
+
+
+class SharedRedisStorage(RedisStorage):
+    async def close(self) -> None:
+        pass
@@ -0,0 +1,93 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from enum import StrEnum
+from typing import Annotated, Any
+from uuid import UUID
+
+from aiogram.filters.callback_data import CallbackData
+from pydantic import BeforeValidator, PlainSerializer
+
+SHORT_UUID_LENGTH = 22
+
+
+def encode_uuid(value: UUID) -> str:
+    return urlsafe_b64encode(value.bytes).rstrip(b'=').decode()
+
+
+def decode_uuid(value: Any) -> Any:
+    if isinstance(value, str) and len(value) == SHORT_UUID_LENGTH:
+        return UUID(bytes=urlsafe_b64decode(f'{value}=='))
+    return value
+
+
+ShortUUID = Annotated[UUID, BeforeValidator(decode_uuid), PlainSerializer(encode_uuid, return_type=str)]
+
+
+class CityAction(StrEnum):
+    CHOOSE = 'choose'
+    DROP = 'drop'
+
+
+class CategoryAction(StrEnum):
+    CHOOSE = 'choose'
+    DROP = 'drop'
+
+
+class StoreAction(StrEnum):
+    DETAILS = 'details'
+    CITIES = 'cities'
+    CATEGORIES = 'categories'
+    PRIORITY = 'priority'
+    DESCRIPTION = 'description'
+    CHANGE_DESCRIPTION = 'change_description'
+    TITLE = 'title'
+    MAIN_PAGE_URL = 'main_page_url'
+    RESOURCES = 'resources'
+    PREVIEW_MEDIA = 'preview_media'
+    MAIN_MEDIA = 'main_media'
+    DROP = 'drop'
+
+
+class BannerAction(StrEnum):
+    DETAILS = 'details'
+    URL = 'url'
+    PC = 'pc'
+    MOBILE = 'mobile'
+    PRIORITY = 'priority'
+    DROP = 'drop'
+
+
+class CityCallback(CallbackData, prefix='city'):
+    action: CityAction
+    city_id: ShortUUID
+
+
+class CategoryCallback(CallbackData, prefix='category'):
+    action: CategoryAction
+    category_id: ShortUUID
+
+
+class StoreCallback(CallbackData, prefix='store'):
+    action: StoreAction
+    store_id: ShortUUID
+
+
+class StoreCityCallback(CallbackData, prefix='store_city'):
+    link: bool
+    store_id: ShortUUID
+    city_id: ShortUUID
+
+
+class StoreCategoryCallback(CallbackData, prefix='store_category'):
+    link: bool
+    store_id: ShortUUID
+    category_id: ShortUUID
+
+
+class StoreResourceCallback(CallbackData, prefix='store_resource'):
+    store_id: ShortUUID
+    resource_id: ShortUUID
+
+
+class BannerCallback(CallbackData, prefix='banner'):
+    action: BannerAction
+    banner_id: ShortUUID
@@ -1,391 +1,649 @@
-from collections.abc import Collection
+from collections.abc import Callable, Collection, Hashable
+from functools import partial
 from uuid import UUID
 
-from aiogram.types import InlineKeyboardButton
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
 from backend.application import interfaces
+from backend.config import Config
 from backend.domain.entities.banner import Banner
 from backend.domain.entities.category import Category, CategorySelection
 from backend.domain.entities.city import City, CitySelection
 from backend.domain.entities.pagination import Pagination
 from backend.domain.entities.store import Store
 from backend.domain.entities.store_resource import StoreResource
+from backend.infrastructure.cache.memory import TTLCache
+from backend.infrastructure.services.bot.keyboard.callback_data import (
+    BannerAction,
+    BannerCallback,
+    CategoryAction,
+    CategoryCallback,
+    CityAction,
+    CityCallback,
+    StoreAction,
+    StoreCallback,
+    StoreCategoryCallback,
+    StoreCityCallback,
+    StoreResourceCallback,
+)
+
+
+class PrebuiltKeyboard:
+    __slots__ = ('_markup',)
+
+    def __init__(self, kb_builder: InlineKeyboardBuilder):
+        self._markup = kb_builder.as_markup()
+
+    def as_markup(self) -> InlineKeyboardMarkup:
+        return self._markup
 
 
 class KeyboardBuilder(interfaces.KeyboardBuilder):
-    def __init__(self):
-        self._kb_builder: InlineKeyboardBuilder | None = None
+    def __init__(self, config: Config):
+        self._keyboards: TTLCache[Hashable, PrebuiltKeyboard] = TTLCache(
+            max_size=config.bot.keyboard_cache_size,
+            ttl=config.bot.keyboard_cache_ttl,
+        )
+
+        self._main_menu_kb = PrebuiltKeyboard(self._build_main_menu_kb())
+        self._cities_menu_kb = PrebuiltKeyboard(self._build_cities_menu_kb())
+        self._cities_return_kb = PrebuiltKeyboard(self._build_cities_return_kb())
+        self._categories_menu_kb = PrebuiltKeyboard(self._build_categories_menu_kb())
+        self._categories_return_kb = PrebuiltKeyboard(self._build_categories_return_kb())
+        self._stores_menu_kb = PrebuiltKeyboard(self._build_stores_menu_kb())
+        self._stores_menu_return_kb = PrebuiltKeyboard(self._build_stores_menu_return_kb())
+        self._store_save_actions_kb = PrebuiltKeyboard(self._build_store_save_actions_kb())
+        self._banners_menu_kb = PrebuiltKeyboard(self._build_banners_menu_kb())
+        self._banners_return_menu_kb = PrebuiltKeyboard(self._build_banners_return_menu_kb())
+        self._banner_save_actions_kb = PrebuiltKeyboard(self._build_banner_save_actions_kb())
 
     def get_main_menu_kb(self) -> interfaces.Keyboard:
-        if self._kb_builder is not None:
-            return self._kb_builder
-        self._kb_builder = InlineKeyboardBuilder()
+        return self._main_menu_kb
 
-        self._kb_builder.button(text='🌇 Города', callback_data='cities_menu')
-        self._kb_builder.button(text='🛍 Категории', callback_data='categories_menu')
-        self._kb_builder.button(text='🏪 Магазины', callback_data='stores_menu')
-        self._kb_builder.button(text='🌌 Банера', callback_data='banners_menu')
-        self._kb_builder.adjust(2)
+    def get_cities_menu_kb(self) -> interfaces.Keyboard:
+        return self._cities_menu_kb
 
-        return self._kb_builder
+    def get_cities_delete_menu_kb(self, cities: Collection[City]) -> interfaces.Keyboard:
+        return self._memoize(
+            key=('cities_delete_menu', *((city.id, city.title) for city in cities)),
+            build=partial(self._build_cities_delete_menu_kb, cities),
+        )
 
-    def get_cities_menu_kb(self) -> interfaces.Keyboard:
-        if self._kb_builder is not None:
-            return self._kb_builder
-        self._kb_builder = InlineKeyboardBuilder()
+    def get_cities_return_kb(self) -> interfaces.Keyboard:
+        return self._cities_return_kb
 
-        self._kb_builder.button(text='➕ Добавить', callback_data='add_city')
-        self._kb_builder.button(text='➖ Удалить', callback_data='delete_cities_menu')
-        self._kb_builder.button(text='⬅️ Назад', callback_data='main_menu')
-        self._kb_builder.adjust(2)
+    def get_categories_menu_kb(self) -> interfaces.Keyboard:
+        return self._categories_menu_kb
+
+    def get_categories_delete_menu_kb(self, categories: Collection[Category]) -> interfaces.Keyboard:
+        return self._memoize(
+            key=('categories_delete_menu', *((category.id, category.title) for category in categories)),
+            build=partial(self._build_categories_delete_menu_kb, categories),
+        )
+
+    def get_categories_return_kb(self) -> interfaces.Keyboard:
+        return self._categories_return_kb
+
+    def get_stores_menu_kb(self) -> interfaces.Keyboard:
+        return self._stores_menu_kb
+
+    def get_cities_choice_menu_kb(self, cities: Collection[City]) -> interfaces.Keyboard:
+        return self._memoize(
+            key=('cities_choice_menu', *((city.id, city.title) for city in cities)),
+            build=partial(self._build_cities_choice_menu_kb, cities),
+        )
+
+    def get_categories_choice_menu_kb(self, categories: Collection[Category]) -> interfaces.Keyboard:
+        return self._memoize(
+            key=('categories_choice_menu', *((category.id, category.title) for category in categories)),
+            build=partial(self._build_categories_choice_menu_kb, categories),
+        )
+
+    def get_stores_menu_return_kb(self) -> interfaces.Keyboard:
+        return self._stores_menu_return_kb
+
+    def get_store_save_actions_kb(self) -> interfaces.Keyboard:
+        return self._store_save_actions_kb
+
+    def get_stores_choice_menu_kb(
+            self, paginated_items: Pagination[Store], total_pages: int, page: int
+    ) -> interfaces.Keyboard:
+        return self._memoize(
+            key=(
+                'stores_choice_menu',
+                total_pages,
+                page,
+                *((store.id, store.title, store.display_priority) for store in paginated_items.items),
+            ),
+            build=partial(self._build_stores_choice_menu_kb, paginated_items, total_pages, page),
+        )
+
+    def get_store_edit_menu_kb(self, store_id: UUID, display_priority: int) -> interfaces.Keyboard:
+        return self._memoize(
+            key=('store_edit_menu', store_id, display_priority),
+            build=partial(self._build_store_edit_menu_kb, store_id, display_priority),
+        )
+
+    def get_store_return_kb(self, store_id: UUID) -> interfaces.Keyboard:
+        return self._memoize(
+            key=('store_return', store_id),
+            build=partial(self._build_store_return_kb, store_id),
+        )
 
-        return self._kb_builder
+    def get_store_cities_menu_kb(self, store_id: UUID, cities: Collection[CitySelection]) -> interfaces.Keyboard:
+        return self._memoize(
+            key=('store_cities_menu', store_id, *((city.id, city.title, city.is_linked) for city in cities)),
+            build=partial(self._build_store_cities_menu_kb, store_id, cities),
+        )
+
+    def get_store_categories_menu_kb(
+            self,
+            store_id: UUID,
+            categories: Collection[CategorySelection],
+    ) -> interfaces.Keyboard:
+        return self._memoize(
+            key=(
+                'store_categories_menu',
+                store_id,
+                *((category.id, category.title, category.is_linked) for category in categories),
+            ),
+            build=partial(self._build_store_categories_menu_kb, store_id, categories),
+        )
+
+    def store_resources_menu_kb(self, store_id: UUID, resources: Collection[StoreResource]) -> interfaces.Keyboard:
+        return self._memoize(
+            key=(
+                'store_resources_menu',
+                store_id,
+                *((resource.id, resource.target_url, resource.title) for resource in resources),
+            ),
+            build=partial(self._build_store_resources_menu_kb, store_id, resources),
+        )
+
+    def get_store_resources_return_menu_kb(self, store_id: UUID) -> interfaces.Keyboard:
+        return self._memoize(
+            key=('store_resources_return_menu', store_id),
+            build=partial(self._build_store_resources_return_menu_kb, store_id),
+        )
+
+    def get_change_preview_media_menu_kb(self, store_id: UUID) -> interfaces.Keyboard:
+        return self._memoize(
+            key=('change_preview_media_menu', store_id),
+            build=partial(self._build_change_preview_media_menu_kb, store_id),
+        )
+
+    def get_change_main_media_menu_kb(self, store_id: UUID) -> interfaces.Keyboard:
+        return self._memoize(
+            key=('change_main_media_menu', store_id),
+            build=partial(self._build_change_main_media_menu_kb, store_id),
+        )
+
+    def get_banners_menu_kb(self) -> interfaces.Keyboard:
+        return self._banners_menu_kb
+
+    def get_banners_choice_menu(self, banners: Collection[Banner]) -> interfaces.Keyboard:
+        return self._memoize(
+            key=('banners_choice_menu', *((banner.id, banner.target_url) for banner in banners)),
+            build=partial(self._build_banners_choice_menu_kb, banners),
+        )
+
+    def get_banners_return_menu_kb(self) -> interfaces.Keyboard:
+        return self._banners_return_menu_kb
+
+    def get_banner_save_actions_kb(self) -> interfaces.Keyboard:
+        return self._banner_save_actions_kb
+
+    def get_banner_edit_menu_kb(self, banner_id: UUID, display_priority: int) -> interfaces.Keyboard:
+        return self._memoize(
+            key=('banner_edit_menu', banner_id, display_priority),
+            build=partial(self._build_banner_edit_menu_kb, banner_id, display_priority),
+        )
+
+    def get_banner_return_kb(self, banner_id: UUID) -> interfaces.Keyboard:
+        return self._memoize(
+            key=('banner_return', banner_id),
+            build=partial(self._build_banner_return_kb, banner_id),
+        )
 
-    def get_cities_delete_menu_kb(self, cities=Collection[City]) -> interfaces.Keyboard:
-        if self._kb_builder is not None:
-            return self._kb_builder
-        self._kb_builder = InlineKeyboardBuilder()
+    def _memoize(self, key: Hashable, build: Callable[[], InlineKeyboardBuilder]) -> PrebuiltKeyboard:
+        keyboard = self._keyboards.get(key)
+        if keyboard is None:
+            keyboard = PrebuiltKeyboard(build())
+            self._keyboards.set(key, keyboard)
+        return keyboard
+
+    @staticmethod
+    def _build_main_menu_kb() -> InlineKeyboardBuilder:
+        kb_builder = InlineKeyboardBuilder()
+
+        kb_builder.button(text='🌇 Города', callback_data='cities_menu')
+        kb_builder.button(text='🛍 Категории', callback_data='categories_menu')
+        kb_builder.button(text='🏪 Магазины', callback_data='stores_menu')
+        kb_builder.button(text='🌌 Банера', callback_data='banners_menu')
+        kb_builder.adjust(2)
+
+        return kb_builder
+
+    @staticmethod
+    def _build_cities_menu_kb() -> InlineKeyboardBuilder:
+        kb_builder = InlineKeyboardBuilder()
+
+        kb_builder.button(text='➕ Добавить', callback_data='add_city')
+        kb_builder.button(text='➖ Удалить', callback_data='delete_cities_menu')
+        kb_builder.button(text='⬅️ Назад', callback_data='main_menu')
+        kb_builder.adjust(2)
+
+        return kb_builder
+
+    @staticmethod
+    def _build_cities_delete_menu_kb(cities: Collection[City]) -> InlineKeyboardBuilder:
+        kb_builder = InlineKeyboardBuilder()
 
         for city in cities:
-            self._kb_builder.button(text=f'{city.title}', callback_data=f'drop_city:{city.id}')
+            kb_builder.button(
+                text=f'{city.title}',
+                callback_data=CityCallback(action=CityAction.DROP, city_id=city.id).pack(),
+            )
 
-        self._kb_builder.button(text='⬅️ Назад', callback_data='cities_menu')
-        self._kb_builder.adjust(1)
+        kb_builder.button(text='⬅️ Назад', callback_data='cities_menu')
+        kb_builder.adjust(1)
 
-        return self._kb_builder
+        return kb_builder
 
-    def get_cities_return_kb(self) -> interfaces.Keyboard:
-        if self._kb_builder is not None:
-            return self._kb_builder
-        self._kb_builder = InlineKeyboardBuilder()
+    @staticmethod
+    def _build_cities_return_kb() -> InlineKeyboardBuilder:
+        kb_builder = InlineKeyboardBuilder()
 
-        self._kb_builder.button(text='⬅️ Назад', callback_data='cities_menu')
+        kb_builder.button(text='⬅️ Назад', callback_data='cities_menu')
 
-        return self._kb_builder
+        return kb_builder
 
-    def get_categories_menu_kb(self) -> interfaces.Keyboard:
-        if self._kb_builder is not None:
-            return self._kb_builder
-        self._kb_builder = InlineKeyboardBuilder()
+    @staticmethod
+    def _build_categories_menu_kb() -> InlineKeyboardBuilder:
+        kb_builder = InlineKeyboardBuilder()
 
-        self._kb_builder.button(text='➕ Добавить', callback_data='add_category')
-        self._kb_builder.button(text='➖ Удалить', callback_data='delete_categories_menu')
-        self._kb_builder.button(text='⬅️ Назад', callback_data='main_menu')
-        self._kb_builder.adjust(2)
+        kb_builder.button(text='➕ Добавить', callback_data='add_category')
+        kb_builder.button(text='➖ Удалить', callback_data='delete_categories_menu')
+        kb_builder.button(text='⬅️ Назад', callback_data='main_menu')
+        kb_builder.adjust(2)
 
-        return self._kb_builder
+        return kb_builder
 
-    def get_categories_delete_menu_kb(self, categories=Collection[Category]) -> interfaces.Keyboard:
-        if self._kb_builder is not None:
-            return self._kb_builder
-        self._kb_builder = InlineKeyboardBuilder()
+    @staticmethod
+    def _build_categories_delete_menu_kb(categories: Collection[Category]) -> InlineKeyboardBuilder:
+        kb_builder = InlineKeyboardBuilder()
 
         for category in categories:
-            self._kb_builder.button(text=f'{category.title}', callback_data=f'drop_category:{category.id}')
+            kb_builder.button(
+                text=f'{category.title}',
+                callback_data=CategoryCallback(action=CategoryAction.DROP, category_id=category.id).pack(),
+            )
 
-        self._kb_builder.button(text='⬅️ Назад', callback_data='categories_menu')
-        self._kb_builder.adjust(1)
+        kb_builder.button(text='⬅️ Назад', callback_data='categories_menu')
+        kb_builder.adjust(1)
 
-        return self._kb_builder
+        return kb_builder
 
-    def get_categories_return_kb(self) -> interfaces.Keyboard:
-        if self._kb_builder is not None:
-            return self._kb_builder
-        self._kb_builder = InlineKeyboardBuilder()
+    @staticmethod
+    def _build_categories_return_kb() -> InlineKeyboardBuilder:
+        kb_builder = InlineKeyboardBuilder()
 
-        self._kb_builder.button(text='⬅️ Назад', callback_data='categories_menu')
+        kb_builder.button(text='⬅️ Назад', callback_data='categories_menu')
 
-        return self._kb_builder
+        return kb_builder
 
-    def get_stores_menu_kb(self) -> interfaces.Keyboard:
-        if self._kb_builder is not None:
-            return self._kb_builder
-        self._kb_builder = InlineKeyboardBuilder()
+    @staticmethod
+    def _build_stores_menu_kb() -> InlineKeyboardBuilder:
+        kb_builder = InlineKeyboardBuilder()
 
-        self._kb_builder.button(text='➕ Добавить', callback_data='add_store')
-        self._kb_builder.button(text='⚙️ Изменить', callback_data='edit_stores_menu')
-        self._kb_builder.button(text='⬅️ Назад', callback_data='main_menu')
-        self._kb_builder.adjust(2)
+        kb_builder.button(text='➕ Добавить', callback_data='add_store')
+        kb_builder.button(text='⚙️ Изменить', callback_data='edit_stores_menu')
+        kb_builder.button(text='⬅️ Назад', callback_data='main_menu')
+        kb_builder.adjust(2)
 
-        return self._kb_builder
+        return kb_builder
 
-    def get_cities_choice_menu_kb(self, cities: Collection[City]) -> interfaces.Keyboard:
-        if self._kb_builder is not None:
-            return self._kb_builder
-        self._kb_builder = InlineKeyboardBuilder()
+    @staticmethod
+    def _build_cities_choice_menu_kb(cities: Collection[City]) -> InlineKeyboardBuilder:
+        kb_builder = InlineKeyboardBuilder()
         for city in cities:
-            self._kb_builder.button(text=f'{city.title}', callback_data=f'choice_city:{city.id}')
+            kb_builder.button(
+                text=f'{city.title}',
+                callback_data=CityCallback(action=CityAction.CHOOSE, city_id=city.id).pack(),
+            )
 
-        self._kb_builder.adjust(2)
+        kb_builder.adjust(2)
 
-        self._kb_builder.row(
+        kb_builder.row(
             InlineKeyboardButton(text='⬅️ Назад', callback_data='stores_menu'),
             InlineKeyboardButton(text='Дальше ➡️', callback_data='stop_cities_choice'),
         )
 
-        return self._kb_builder
+        return kb_builder
 
-    def get_categories_choice_menu_kb(self, categories: Collection[Category]) -> interfaces.Keyboard:
-        if self._kb_builder is not None:
-            return self._kb_builder
-        self._kb_builder = InlineKeyboardBuilder()
+    @staticmethod
+    def _build_categories_choice_menu_kb(categories: Collection[Category]) -> InlineKeyboardBuilder:
+        kb_builder = InlineKeyboardBuilder()
         for category in categories:
-            self._kb_builder.button(text=f'{category.title}', callback_data=f'choice_category:{category.id}')
+            kb_builder.button(
+                text=f'{category.title}',
+                callback_data=CategoryCallback(action=CategoryAction.CHOOSE, category_id=category.id).pack(),
+            )
 
-        self._kb_builder.adjust(2)
+        kb_builder.adjust(2)
 
-        self._kb_builder.row(
+        kb_builder.row(
             InlineKeyboardButton(text='⬅️ Назад', callback_data='stores_menu'),
             InlineKeyboardButton(text='Дальше ➡️', callback_data='stop_categories_choice'),
         )
 
-        return self._kb_builder
+        return kb_builder
 
-    def get_stores_menu_return_kb(self) -> interfaces.Keyboard:
-        if self._kb_builder is not None:
-            return self._kb_builder
-        self._kb_builder = InlineKeyboardBuilder()
+    @staticmethod
+    def _build_stores_menu_return_kb() -> InlineKeyboardBuilder:
+        kb_builder = InlineKeyboardBuilder()
 
-        self._kb_builder.button(text='⬅️ Назад', callback_data='stores_menu')
+        kb_builder.button(text='⬅️ Назад', callback_data='stores_menu')
 
-        return self._kb_builder
+        return kb_builder
 
-    def get_store_save_actions_kb(self) -> interfaces.Keyboard:
-        if self._kb_builder is not None:
-            return self._kb_builder
-        self._kb_builder = InlineKeyboardBuilder()
+    @staticmethod
+    def _build_store_save_actions_kb() -> InlineKeyboardBuilder:
+        kb_builder = InlineKeyboardBuilder()
 
-        self._kb_builder.button(text='✅ Да', callback_data='save_store')
-        self._kb_builder.button(text='❌ Нет', callback_data='stores_menu')
+        kb_builder.button(text='✅ Да', callback_data='save_store')
+        kb_builder.button(text='❌ Нет', callback_data='stores_menu')
 
-        return self._kb_builder
+        return kb_builder
 
-    def get_stores_choice_menu_kb(
-            self, paginated_items: Pagination[Store], total_pages: int, page: int
-    ) -> interfaces.Keyboard:
-        if self._kb_builder is not None:
-            return self._kb_builder
-        self._kb_builder = InlineKeyboardBuilder()
+    @staticmethod
+    def _build_stores_choice_menu_kb(
+            paginated_items: Pagination[Store],
+            total_pages: int,
+            page: int,
+    ) -> InlineKeyboardBuilder:
+        kb_builder = InlineKeyboardBuilder()
 
         for store in paginated_items.items:
-            self._kb_builder.button(
+            kb_builder.button(
                 text=f'{store.title} [{store.display_priority}]',
-                callback_data=f'store_details:{store.id}',
+                callback_data=StoreCallback(action=StoreAction.DETAILS, store_id=store.id).pack(),
             )
-        self._kb_builder.adjust(1)
+        kb_builder.adjust(1)
 
         if total_pages > 1:
-            self._kb_builder.row(
+            kb_builder.row(
                 InlineKeyboardButton(text='⬅️', callback_data='prev_shops'),
                 InlineKeyboardButton(text=f'[{page}/{total_pages}]', callback_data='current_page'),
                 InlineKeyboardButton(text='➡️', callback_data='next_shops'),
             )
 
-        self._kb_builder.row(InlineKeyboardButton(text='⬅️ Назад', callback_data='stores_menu'))
+        kb_builder.row(InlineKeyboardButton(text='⬅️ Назад', callback_data='stores_menu'))
 
-        return self._kb_builder
+        return kb_builder
 
-    def get_store_edit_menu_kb(self, store_id: UUID, display_priority: int) -> interfaces.Keyboard:
-        if self._kb_builder is not None:
-            return self._kb_builder
-        self._kb_builder = InlineKeyboardBuilder()
+    @staticmethod
+    def _build_store_edit_menu_kb(store_id: UUID, display_priority: int) -> InlineKeyboardBuilder:
+        kb_builder = InlineKeyboardBuilder()
 
-        self._kb_builder.row(
-            InlineKeyboardButton(text='🌇 Города', callback_data=f'store_cities_menu:{store_id}'),
-            InlineKeyboardButton(text='🛍 Категории', callback_data=f'store_categories_menu:{store_id}'),
+        kb_builder.row(
+            InlineKeyboardButton(
+                text='🌇 Города',
+                callback_data=StoreCallback(action=StoreAction.CITIES, store_id=store_id).pack(),
+            ),
+            InlineKeyboardButton(
+                text='🛍 Категории',
+                callback_data=StoreCallback(action=StoreAction.CATEGORIES, store_id=store_id).pack(),
+            ),
         )
-        self._kb_builder.row(
+        kb_builder.row(
             InlineKeyboardButton(
                 text=f'📊 Приоритет [{display_priority}]',
-                callback_data=f'change_store_priority:{store_id}',
+                callback_data=StoreCallback(action=StoreAction.PRIORITY, store_id=store_id).pack(),
             ),
         )
-        self._kb_builder.row(
-            InlineKeyboardButton(text='👀 Описание', callback_data=f'display_store_description:{store_id}'),
-            InlineKeyboardButton(text='📃 Описание', callback_data=f'change_store_description:{store_id}'),
+        kb_builder.row(
+            InlineKeyboardButton(
+                text='👀 Описание',
+                callback_data=StoreCallback(action=StoreAction.DESCRIPTION, store_id=store_id).pack(),
+            ),
+            InlineKeyboardButton(
+                text='📃 Описание',
+                callback_data=StoreCallback(action=StoreAction.CHANGE_DESCRIPTION, store_id=store_id).pack(),
+            ),
         )
-        self._kb_builder.row(
-            InlineKeyboardButton(text='📌 Название', callback_data=f'change_store_title:{store_id}'),
+        kb_builder.row(
+            InlineKeyboardButton(
+                text='📌 Название',
+                callback_data=StoreCallback(action=StoreAction.TITLE, store_id=store_id).pack(),
+            ),
         )
-        self._kb_builder.row(
-            InlineKeyboardButton(text='🔗 Ресурс', callback_data=f'change_store_main_page_url:{store_id}'),
-            InlineKeyboardButton(text='🔗 Доп.ресурсы', callback_data=f'store_recources_menu:{store_id}'),
+        kb_builder.row(
+            InlineKeyboardButton(
+                text='🔗 Ресурс',
+                callback_data=StoreCallback(action=StoreAction.MAIN_PAGE_URL, store_id=store_id).pack(),
+            ),
+            InlineKeyboardButton(
+                text='🔗 Доп.ресурсы',
+                callback_data=StoreCallback(action=StoreAction.RESOURCES, store_id=store_id).pack(),
+            ),
         )
-        self._kb_builder.row(
-            InlineKeyboardButton(text='🏞 Превью', callback_data=f'change_preview_media_menu:{store_id}'),
-            InlineKeyboardButton(text='🌁 Баннер', callback_data=f'change_main_media_menu:{store_id}'),
+        kb_builder.row(
+            InlineKeyboardButton(
+                text='🏞 Превью',
+                callback_data=StoreCallback(action=StoreAction.PREVIEW_MEDIA, store_id=store_id).pack(),
+            ),
+            InlineKeyboardButton(
+                text='🌁 Баннер',
+                callback_data=StoreCallback(action=StoreAction.MAIN_MEDIA, store_id=store_id).pack(),
+            ),
         )
-        self._kb_builder.row(
-            InlineKeyboardButton(text='🗑 Удалить', callback_data=f'drop_store:{store_id}'),
+        kb_builder.row(
+            InlineKeyboardButton(
+                text='🗑 Удалить',
+                callback_data=StoreCallback(action=StoreAction.DROP, store_id=store_id).pack(),
+            ),
         )
-        self._kb_builder.row(
+        kb_builder.row(
             InlineKeyboardButton(text='⬅️ Назад', callback_data='edit_stores_menu'),
         )
 
-        return self._kb_builder
+        return kb_builder
 
-    def get_store_return_kb(self, store_id: UUID) -> interfaces.Keyboard:
-        if self._kb_builder is not None:
-            return self._kb_builder
-        self._kb_builder = InlineKeyboardBuilder()
+    @staticmethod
+    def _build_store_return_kb(store_id: UUID) -> InlineKeyboardBuilder:
+        kb_builder = InlineKeyboardBuilder()
 
-        self._kb_builder.button(text='⬅️ Назад', callback_data=f'store_details:{store_id}')
+        kb_builder.button(
+            text='⬅️ Назад',
+            callback_data=StoreCallback(action=StoreAction.DETAILS, store_id=store_id).pack(),
+        )
 
-        return self._kb_builder
+        return kb_builder
 
-    def get_store_cities_menu_kb(self, store_id: UUID, cities: Collection[CitySelection]) -> interfaces.Keyboard:
-        if self._kb_builder is not None:
-            return self._kb_builder
-        self._kb_builder = InlineKeyboardBuilder()
+    @staticmethod
+    def _build_store_cities_menu_kb(store_id: UUID, cities: Collection[CitySelection]) -> InlineKeyboardBuilder:
+        kb_builder = InlineKeyboardBuilder()
 
         for city in cities:
-            self._kb_builder.button(
+            kb_builder.button(
                 text=f'{city.title} [{"✅" if city.is_linked else "❌"}]',
-                callback_data=f'{"unlink_city" if city.is_linked else "link_city"}:{city.id}',
+                callback_data=StoreCityCallback(link=not city.is_linked, store_id=store_id, city_id=city.id).pack(),
             )
-        self._kb_builder.adjust(2)
-        self._kb_builder.row(
-            InlineKeyboardButton(text='⬅️ Назад', callback_data=f'store_details:{store_id}'),
+        kb_builder.adjust(2)
+        kb_builder.row(
+            InlineKeyboardButton(
+                text='⬅️ Назад',
+                callback_data=StoreCallback(action=StoreAction.DETAILS, store_id=store_id).pack(),
+            ),
         )
 
-        return self._kb_builder
+        return kb_builder
 
-    def get_store_categories_menu_kb(
-            self,
+    @staticmethod
+    def _build_store_categories_menu_kb(
             store_id: UUID,
             categories: Collection[CategorySelection],
-    ) -> interfaces.Keyboard:
-        if self._kb_builder is not None:
-            return self._kb_builder
-        self._kb_builder = InlineKeyboardBuilder()
-
-        for categories in categories:
-            self._kb_builder.button(
-                text=f'{categories.title} [{"✅" if categories.is_linked else "❌"}]',
-                callback_data=f'{"unlink_category" if categories.is_linked else "link_category"}:{categories.id}',
+    ) -> InlineKeyboardBuilder:
+        kb_builder = InlineKeyboardBuilder()
+
+        for category in categories:
+            kb_builder.button(
+                text=f'{category.title} [{"✅" if category.is_linked else "❌"}]',
+                callback_data=StoreCategoryCallback(
+                    link=not category.is_linked,
+                    store_id=store_id,
+                    category_id=category.id,
+                ).pack(),
             )
-        self._kb_builder.adjust(2)
-        self._kb_builder.row(
-            InlineKeyboardButton(text='⬅️ Назад', callback_data=f'store_details:{store_id}'),
+        kb_builder.adjust(2)
+        kb_builder.row(
+            InlineKeyboardButton(
+                text='⬅️ Назад',
+                callback_data=StoreCallback(action=StoreAction.DETAILS, store_id=store_id).pack(),
+            ),
         )
 
-        return self._kb_builder
+        return kb_builder
 
-    def store_resources_menu_kb(self, store_id: UUID, resources: Collection[StoreResource]) -> interfaces.Keyboard:
-        if self._kb_builder is not None:
-            return self._kb_builder
-        self._kb_builder = InlineKeyboardBuilder()
+    @staticmethod
+    def _build_store_resources_menu_kb(store_id: UUID, resources: Collection[StoreResource]) -> InlineKeyboardBuilder:
+        kb_builder = InlineKeyboardBuilder()
 
         for resource in resources:
-            self._kb_builder.button(
+            kb_builder.button(
                 text=f'{resource.target_url[0:10]}...-{resource.title}',
-                callback_data=f'drop_resource:{resource.id}',
+                callback_data=StoreResourceCallback(store_id=store_id, resource_id=resource.id).pack(),
             )
 
-        self._kb_builder.button(text='➕ Добавить', callback_data='add_store_resources')
-        self._kb_builder.button(text='⬅️ Назад', callback_data=f'store_details:{store_id}')
-        self._kb_builder.adjust(1)
+        kb_builder.button(text='➕ Добавить', callback_data='add_store_resources')
+        kb_builder.button(
+            text='⬅️ Назад',
+            callback_data=StoreCallback(action=StoreAction.DETAILS, store_id=store_id).pack(),
+        )
+        kb_builder.adjust(1)
 
-        return self._kb_builder
+        return kb_builder
 
-    def get_store_resources_return_menu_kb(self, store_id: UUID) -> interfaces.Keyboard:
-        if self._kb_builder is not None:
-            return self._kb_builder
-        self._kb_builder = InlineKeyboardBuilder()
+    @staticmethod
+    def _build_store_resources_return_menu_kb(store_id: UUID) -> InlineKeyboardBuilder:
+        kb_builder = InlineKeyboardBuilder()
 
-        self._kb_builder.button(text='⬅️ Назад', callback_data=f'store_recources_menu:{store_id}')
+        kb_builder.button(
+            text='⬅️ Назад',
+            callback_data=StoreCallback(action=StoreAction.RESOURCES, store_id=store_id).pack(),
+        )
 
-        return self._kb_builder
+        return kb_builder
 
-    def get_change_preview_media_menu_kb(self, store_id: UUID) -> interfaces.Keyboard:
-        if self._kb_builder is not None:
-            return self._kb_builder
-        self._kb_builder = InlineKeyboardBuilder()
+    @staticmethod
+    def _build_change_preview_media_menu_kb(store_id: UUID) -> InlineKeyboardBuilder:
+        kb_builder = InlineKeyboardBuilder()
 
-        self._kb_builder.button(text='🌌 PC', callback_data='change_media_preview_pc')
-        self._kb_builder.button(text='🌌 Mobile', callback_data='change_media_preview_mobile')
-        self._kb_builder.button(text='⬅️ Назад', callback_data=f'store_details:{store_id}')
-        self._kb_builder.adjust(2)
+        kb_builder.button(text='🌌 PC', callback_data='change_media_preview_pc')
+        kb_builder.button(text='🌌 Mobile', callback_data='change_media_preview_mobile')
+        kb_builder.button(
+            text='⬅️ Назад',
+            callback_data=StoreCallback(action=StoreAction.DETAILS, store_id=store_id).pack(),
+        )
+        kb_builder.adjust(2)
 
-        return self._kb_builder
+        return kb_builder
 
-    def get_change_main_media_menu_kb(self, store_id: UUID) -> interfaces.Keyboard:
-        if self._kb_builder is not None:
-            return self._kb_builder
-        self._kb_builder = InlineKeyboardBuilder()
+    @staticmethod
+    def _build_change_main_media_menu_kb(store_id: UUID) -> InlineKeyboardBuilder:
+        kb_builder = InlineKeyboardBuilder()
 
-        self._kb_builder.button(text='🌌 PC', callback_data='change_media_main_pc')
-        self._kb_builder.button(text='🌌 Mobile', callback_data='change_media_main_mobile')
-        self._kb_builder.button(text='⬅️ Назад', callback_data=f'store_details:{store_id}')
-        self._kb_builder.adjust(2)
+        kb_builder.button(text='🌌 PC', callback_data='change_media_main_pc')
+        kb_builder.button(text='🌌 Mobile', callback_data='change_media_main_mobile')
+        kb_builder.button(
+            text='⬅️ Назад',
+            callback_data=StoreCallback(action=StoreAction.DETAILS, store_id=store_id).pack(),
+        )
+        kb_builder.adjust(2)
 
-        return self._kb_builder
+        return kb_builder
 
-    def get_banners_menu_kb(self) -> interfaces.Keyboard:
-        if self._kb_builder is not None:
-            return self._kb_builder
-        self._kb_builder = InlineKeyboardBuilder()
+    @staticmethod
+    def _build_banners_menu_kb() -> InlineKeyboardBuilder:
+        kb_builder = InlineKeyboardBuilder()
 
-        self._kb_builder.button(text='➕ Добавить', callback_data='add_banner')
-        self._kb_builder.button(text='️⚙️ Изменить', callback_data='edit_banners_menu')
-        self._kb_builder.button(text='⬅️ Назад', callback_data='main_menu')
-        self._kb_builder.adjust(2)
+        kb_builder.button(text='➕ Добавить', callback_data='add_banner')
+        kb_builder.button(text='️⚙️ Изменить', callback_data='edit_banners_menu')
+        kb_builder.button(text='⬅️ Назад', callback_data='main_menu')
+        kb_builder.adjust(2)
 
-        return self._kb_builder
+        return kb_builder
 
-    def get_banners_choice_menu(self, banners: Collection[Banner]) -> interfaces.Keyboard:
-        if self._kb_builder is not None:
-            return self._kb_builder
-        self._kb_builder = InlineKeyboardBuilder()
+    @staticmethod
+    def _build_banners_choice_menu_kb(banners: Collection[Banner]) -> InlineKeyboardBuilder:
+        kb_builder = InlineKeyboardBuilder()
 
         for banner in banners:
-            self._kb_builder.button(text=f'{banner.target_url}', callback_data=f'banner_details:{banner.id}')
+            kb_builder.button(
+                text=f'{banner.target_url}',
+                callback_data=BannerCallback(action=BannerAction.DETAILS, banner_id=banner.id).pack(),
+            )
 
-        self._kb_builder.button(text='⬅️ Назад', callback_data='main_menu')
-        self._kb_builder.adjust(1)
+        kb_builder.button(text='⬅️ Назад', callback_data='main_menu')
+        kb_builder.adjust(1)
 
-        return self._kb_builder
+        return kb_builder
 
-    def get_banners_return_menu_kb(self) -> interfaces.Keyboard:
-        if self._kb_builder is not None:
-            return self._kb_builder
-        self._kb_builder = InlineKeyboardBuilder()
+    @staticmethod
+    def _build_banners_return_menu_kb() -> InlineKeyboardBuilder:
+        kb_builder = InlineKeyboardBuilder()
 
-        self._kb_builder.button(text='⬅️ Назад', callback_data='main_menu')
+        kb_builder.button(text='⬅️ Назад', callback_data='main_menu')
 
-        return self._kb_builder
+        return kb_builder
 
-    def get_banner_save_actions_kb(self) -> interfaces.Keyboard:
-        if self._kb_builder is not None:
-            return self._kb_builder
-        self._kb_builder = InlineKeyboardBuilder()
+    @staticmethod
+    def _build_banner_save_actions_kb() -> InlineKeyboardBuilder:
+        kb_builder = InlineKeyboardBuilder()
 
-        self._kb_builder.button(text='✅ Да', callback_data='save_banner')
-        self._kb_builder.button(text='❌ Нет', callback_data='banners_menu')
+        kb_builder.button(text='✅ Да', callback_data='save_banner')
+        kb_builder.button(text='❌ Нет', callback_data='banners_menu')
 
-        return self._kb_builder
+        return kb_builder
 
-    def get_banner_edit_menu_kb(self, banner_id: UUID, display_priority: int) -> interfaces.Keyboard:
-        if self._kb_builder is not None:
-            return self._kb_builder
-        self._kb_builder = InlineKeyboardBuilder()
+    @staticmethod
+    def _build_banner_edit_menu_kb(banner_id: UUID, display_priority: int) -> InlineKeyboardBuilder:
+        kb_builder = InlineKeyboardBuilder()
 
-        self._kb_builder.button(text='🌌 Банер [PC]', callback_data=f'change_banner_pc:{banner_id}')
-        self._kb_builder.button(text='🌌 Банер [MOBILE]', callback_data=f'change_banner_mobile:{banner_id}')
-        self._kb_builder.button(text='🔗 Ресурс', callback_data=f'change_banner_url:{banner_id}')
-        self._kb_builder.button(text=f'📊 Приоритет [{display_priority}]', callback_data=f'change_banner_priority:{banner_id}')
-        self._kb_builder.button(text='🗑 Удалить', callback_data=f'drop_banner:{banner_id}')
-        self._kb_builder.button(text='⬅️ Назад', callback_data='banners_menu')
-        self._kb_builder.adjust(2)
+        kb_builder.button(
+            text='🌌 Банер [PC]',
+            callback_data=BannerCallback(action=BannerAction.PC, banner_id=banner_id).pack(),
+        )
+        kb_builder.button(
+            text='🌌 Банер [MOBILE]',
+            callback_data=BannerCallback(action=BannerAction.MOBILE, banner_id=banner_id).pack(),
+        )
+        kb_builder.button(
+            text='🔗 Ресурс',
+            callback_data=BannerCallback(action=BannerAction.URL, banner_id=banner_id).pack(),
+        )
+        kb_builder.button(
+            text=f'📊 Приоритет [{display_priority}]',
+            callback_data=BannerCallback(action=BannerAction.PRIORITY, banner_id=banner_id).pack(),
+        )
+        kb_builder.button(
+            text='🗑 Удалить',
+            callback_data=BannerCallback(action=BannerAction.DROP, banner_id=banner_id).pack(),
+        )
+        kb_builder.button(text='⬅️ Назад', callback_data='banners_menu')
+        kb_builder.adjust(2)
 
-        return self._kb_builder
+        return kb_builder
 
-    def get_banner_return_kb(self, banner_id: UUID) -> interfaces.Keyboard:
-        if self._kb_builder is not None:
-            return self._kb_builder
-        self._kb_builder = InlineKeyboardBuilder()
+    @staticmethod
+    def _build_banner_return_kb(banner_id: UUID) -> InlineKeyboardBuilder:
+        kb_builder = InlineKeyboardBuilder()
 
-        self._kb_builder.button(text='⬅️ Назад', callback_data=f'banner_details:{banner_id}')
+        kb_builder.button(
+            text='⬅️ Назад',
+            callback_data=BannerCallback(action=BannerAction.DETAILS, banner_id=banner_id).pack(),
+        )
 
-        return self._kb_builder
+        return kb_builder
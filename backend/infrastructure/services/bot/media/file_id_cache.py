@@ -0,0 +1,57 @@
+import asyncio
+import hashlib
+import logging
+import os
+from collections.abc import Awaitable, Callable
+
+import redis.asyncio as redis
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import FSInputFile, Message
+
+FILE_IDS_KEY = 'telegram:file_ids'
+
+logger = logging.getLogger(__name__)
+
+
+def get_file_digest(path: str) -> str:
+    with open(path, 'rb') as file:
+        return hashlib.file_digest(file, 'sha256').hexdigest()
+
+
+class FileIdCache:
+    def __init__(
+        self,
+        client: redis.Redis,
+    ):
+        self._client = client
+        self._digests: dict[str, tuple[int, int, str]] = {}
+
+    async def send_photo(
+        self,
+        send: Callable[..., Awaitable[Message]],
+        path: str,
+        filename: str,
+    ) -> Message:
+        digest = await self._get_digest(path)
+
+        file_id = await self._client.hget(FILE_IDS_KEY, digest)
+        if file_id is not None:
+            try:
+                return await send(photo=file_id.decode())
+            except TelegramBadRequest:
+                logger.warning('Cached file_id for %s was rejected, uploading it again', path)
+                await self._client.hdel(FILE_IDS_KEY, digest)
+
+        message = await send(photo=FSInputFile(path=path, filename=filename))
+        await self._client.hset(FILE_IDS_KEY, digest, message.photo[-1].file_id)
+        return message
+
+    async def _get_digest(self, path: str) -> str:
+        stat = os.stat(path)
+        cached = self._digests.get(path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+
+        digest = await asyncio.to_thread(get_file_digest, path)
+        self._digests[path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
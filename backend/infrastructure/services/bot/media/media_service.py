@@ -1,29 +1,130 @@
+import asyncio
+import hashlib
+from collections.abc import AsyncGenerator, AsyncIterable
 from io import BytesIO
 
+from aiogram import Bot
 from aiogram.types import Message
 
-from backend.domain.entities.media import Media, MediaType
+from backend.application import interfaces
+from backend.config import Config
+from backend.domain.entities.media import STAGING_PREFIX, Media, MediaSource, MediaType
 from backend.infrastructure import exceptions as infra_exceptions
+from backend.infrastructure.repository.media import MediaRepository
+from backend.infrastructure.services.image.processor import ImageProcessor
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
 
 
 class MediaService:
-    async def download_media(self, message: Message) -> Media:
-        file_id, extension = self._get_file_metadata(message)
-        file = await message.bot.get_file(file_id=file_id)
-        file_path = file.file_path
-        media_obj = BytesIO()
-        await message.bot.download_file(file_path=file_path, destination=media_obj)
-        media_obj.seek(0)
-
-        return Media(
-            media_obj=media_obj,
-            extension=extension,
-        )
+    def __init__(
+        self,
+        s3_client: interfaces.S3Client,
+        image_processor: ImageProcessor,
+        repository: MediaRepository,
+        uuid_generator: interfaces.UUIDGenerator,
+        config: Config,
+    ):
+        self._s3_client = s3_client
+        self._image_processor = image_processor
+        self._repository = repository
+        self._uuid_generator = uuid_generator
+        self._config = config
+
+    async def upload(self, bot: Bot, source: MediaSource) -> Media:
+        media = await self._repository.get_by_source(source_id=source.source_id)
+        if media is None:
+            file = await bot.get_file(file_id=source.file_id)
+            stream = self._stream_file(bot=bot, file_path=file.file_path)
+            if source.extension == MediaType.PNG:
+                media = await self._upload_image(stream=stream)
+            else:
+                media = await self._upload_animation(stream=stream, extension=source.extension)
+
+        await self._repository.save(media=media, source_id=source.source_id)
+        return media
 
     @staticmethod
-    def _get_file_metadata(message: Message) -> str:
+    def get_source(message: Message) -> MediaSource:
         if message.content_type == 'photo':
-            return message.photo[-1].file_id, MediaType.PNG
+            photo = message.photo[-1]
+            return MediaSource(file_id=photo.file_id, source_id=photo.file_unique_id, extension=MediaType.PNG)
         if message.content_type == 'animation':
-            return message.animation.file_id, MediaType.GIF
+            animation = message.animation
+            return MediaSource(file_id=animation.file_id, source_id=animation.file_unique_id, extension=MediaType.GIF)
         raise infra_exceptions.InvalidMediaContentTypeError
+
+    async def _upload_image(self, stream: AsyncIterable[bytes]) -> Media:
+        image = bytearray()
+        async for chunk in stream:
+            image.extend(chunk)
+
+        digest = hashlib.sha256(image).hexdigest()
+        media = await self._repository.get_by_digest(digest=digest)
+        if media is not None:
+            return media
+
+        derivatives = await self._image_processor.render_derivatives(bytes(image))
+        media = Media(
+            digest=digest,
+            extension=MediaType.PNG,
+            size=len(image),
+            derivatives=tuple(suffix for suffix, _ in derivatives),
+        )
+
+        tasks = [
+            self._s3_client.save(
+                bucket=self._config.minio.bucket,
+                file_name=file_name,
+                data=BytesIO(data),
+                cache_control=IMMUTABLE_CACHE_CONTROL,
+            )
+            for file_name, data in [
+                (media.file_name, image),
+                *zip(media.derivative_file_names, (data for _, data in derivatives), strict=True),
+            ]
+        ]
+        await asyncio.gather(*tasks)
+
+        return media
+
+    async def _upload_animation(self, stream: AsyncIterable[bytes], extension: MediaType) -> Media:
+        staging_name = f'{STAGING_PREFIX}{self._uuid_generator()}.{extension}'
+        hasher = hashlib.sha256()
+
+        async def hashed_stream() -> AsyncGenerator[bytes, None]:
+            async for chunk in stream:
+                hasher.update(chunk)
+                yield chunk
+
+        size = await self._s3_client.save_stream(
+            bucket=self._config.minio.bucket,
+            file_name=staging_name,
+            stream=hashed_stream(),
+            cache_control=IMMUTABLE_CACHE_CONTROL,
+        )
+
+        media = await self._repository.get_by_digest(digest=hasher.hexdigest())
+        if media is not None:
+            await self._s3_client.delete_many(bucket=self._config.minio.bucket, file_names=[staging_name])
+            return media
+
+        # Content-addressed objects are immutable, so they can be promoted before the references commit. The upload
+        # runs inside the save job, which records the row here and its references right after, and the sweeper only
+        # collects rows that are unreferenced and untouched for MEDIA_STAGING_TTL. Wizards only hold Telegram file ids.
+        media = Media(digest=hasher.hexdigest(), extension=extension, size=size)
+        await self._s3_client.move(
+            bucket=self._config.minio.bucket,
+            source_file_name=staging_name,
+            file_name=media.file_name,
+        )
+        return media
+
+    @staticmethod
+    def _stream_file(bot: Bot, file_path: str) -> AsyncGenerator[bytes, None]:
+        return bot.session.stream_content(
+            url=bot.session.api.file_url(bot.token, file_path),
+            chunk_size=DOWNLOAD_CHUNK_SIZE,
+            raise_for_status=True,
+        )
@@ -0,0 +1,57 @@
+import asyncio
+from collections.abc import Collection
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from io import BytesIO
+
+from PIL import Image, ImageOps
+
+from backend.config import Config
+from backend.domain.entities.media import get_derivative_suffix
+
+
+def render_derivatives(
+    data: bytes,
+    widths: Collection[int],
+    formats: Collection[str],
+    quality: int,
+) -> list[tuple[str, bytes]]:
+    with Image.open(BytesIO(data)) as source:
+        image = ImageOps.exif_transpose(source)
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA' if 'A' in image.getbands() or 'transparency' in image.info else 'RGB')
+
+    derivatives = []
+    # The original already covers its own width, and upscaled copies would only be mislabelled.
+    for width in sorted((width for width in widths if width < image.width), reverse=True):
+        image = image.resize((width, max(1, round(image.height * width / image.width))), Image.Resampling.LANCZOS)
+
+        for image_format in formats:
+            buffer = BytesIO()
+            image.save(buffer, format=image_format.upper(), quality=quality)
+            derivatives.append((get_derivative_suffix(width=width, image_format=image_format), buffer.getvalue()))
+
+    return derivatives
+
+
+class ImageProcessor:
+    def __init__(
+        self,
+        executor: ProcessPoolExecutor,
+        config: Config,
+    ):
+        self._executor = executor
+        self._config = config
+
+    async def render_derivatives(self, data: bytes) -> list[tuple[str, bytes]]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            partial(
+                render_derivatives,
+                data,
+                widths=self._config.media.derivative_widths,
+                formats=self._config.media.derivative_formats,
+                quality=self._config.media.derivative_quality,
+            ),
+        )
@@ -0,0 +1,27 @@
+from collections.abc import Collection
+from datetime import datetime
+
+from backend.application import interfaces
+from backend.config import Config
+from backend.domain.entities.media import STAGING_PREFIX
+
+
+class S3MediaStorage(interfaces.MediaStorage):
+    def __init__(
+        self,
+        s3_client: interfaces.S3Client,
+        config: Config,
+    ):
+        self._s3_client = s3_client
+        self._bucket = config.minio.bucket
+
+    async def get_staged_before(self, created_before: datetime) -> Collection[str]:
+        return await self._s3_client.get_modified_before(
+            bucket=self._bucket,
+            prefix=STAGING_PREFIX,
+            modified_before=created_before,
+        )
+
+    async def discard(self, file_names: Collection[str]) -> None:
+        if file_names:
+            await self._s3_client.delete_many(bucket=self._bucket, file_names=file_names)
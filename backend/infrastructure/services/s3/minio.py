@@ -0,0 +1,15 @@
+import aiohttp
+from miniopy_async import Minio
+
+
+class PooledMinio(Minio):
+    def __init__(self, *args, session: aiohttp.ClientSession, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._session = session
+
+    async def _url_open(self, *args, **kwargs) -> aiohttp.ClientResponse:
+        # miniopy-async opens a throwaway ClientSession for most calls, so whatever session it passes is replaced.
+        # _url_open is private, which is why miniopy-async is pinned exactly in requirements.txt. Re-run
+        # tests/test_minio_session.py before bumping it.
+        kwargs['session'] = self._session
+        return await super()._url_open(*args, **kwargs)
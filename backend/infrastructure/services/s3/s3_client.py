@@ -1,9 +1,20 @@
+import logging
 import mimetypes
+from collections.abc import AsyncIterable, Collection
+from datetime import datetime
 from io import BytesIO
 
 from miniopy_async import Minio
+from miniopy_async.commonconfig import CopySource
+from miniopy_async.deleteobjects import DeleteObject
+from miniopy_async.error import S3Error
 
 from backend.application import interfaces
+from backend.infrastructure.services.s3.stream import AsyncChunkReader
+
+MULTIPART_PART_SIZE = 5 * 1024 * 1024
+
+logger = logging.getLogger(__name__)
 
 
 class S3Client(interfaces.S3Client):
@@ -13,9 +24,8 @@ class S3Client(interfaces.S3Client):
     ):
         self._client = client
 
-    async def save(self, bucket: str, file_name: str, data: BytesIO) -> None:
+    async def save(self, bucket: str, file_name: str, data: BytesIO, cache_control: str | None = None) -> None:
         content_type, _ = mimetypes.guess_type(file_name)
-        print(content_type)
 
         await self._client.put_object(
             bucket_name=bucket,
@@ -23,7 +33,59 @@ class S3Client(interfaces.S3Client):
             data=data,
             length=len(data.getbuffer()),
             content_type=content_type,
+            metadata={'Cache-Control': cache_control} if cache_control else None,
+        )
+
+    async def save_stream(
+        self,
+        bucket: str,
+        file_name: str,
+        stream: AsyncIterable[bytes],
+        cache_control: str | None = None,
+    ) -> int:
+        content_type, _ = mimetypes.guess_type(file_name)
+        reader = AsyncChunkReader(stream)
+
+        await self._client.put_object(
+            bucket_name=bucket,
+            object_name=file_name,
+            data=reader,
+            length=-1,
+            part_size=MULTIPART_PART_SIZE,
+            content_type=content_type,
+            metadata={'Cache-Control': cache_control} if cache_control else None,
+        )
+        return reader.size
+
+    async def move(self, bucket: str, source_file_name: str, file_name: str) -> bool:
+        try:
+            await self._client.copy_object(
+                bucket_name=bucket,
+                object_name=file_name,
+                source=CopySource(bucket_name=bucket, object_name=source_file_name),
+            )
+        except S3Error as exc:
+            if exc.code == 'NoSuchKey':
+                return False
+            raise
+
+        await self._client.remove_object(bucket_name=bucket, object_name=source_file_name)
+        return True
+
+    async def get_modified_before(self, bucket: str, prefix: str, modified_before: datetime) -> Collection[str]:
+        return [
+            obj.object_name
+            async for obj in self._client.list_objects(bucket_name=bucket, prefix=prefix, recursive=True)
+            if obj.last_modified < modified_before
+        ]
+
+    async def delete_many(self, bucket: str, file_names: Collection[str]) -> None:
+        errors = await self._client.remove_objects(
+            bucket_name=bucket,
+            delete_object_list=[DeleteObject(file_name) for file_name in file_names],
         )
+        for error in errors:
+            logger.warning('Failed to delete %s from %s: %s', error.name, bucket, error.message)
 
     async def get_temporary_url(self, bucket: str, file_name: str) -> str:
         return await self._client.presigned_get_object(bucket_name=bucket, object_name=file_name)
@@ -0,0 +1,20 @@
+from collections.abc import AsyncIterable
+
+
+class AsyncChunkReader:
+    def __init__(self, chunks: AsyncIterable[bytes]):
+        self._chunks = aiter(chunks)
+        self._buffer = b''
+        self.size = 0
+
+    async def read(self, size: int = -1) -> bytes:
+        if not self._buffer:
+            self._buffer = await anext(self._chunks, b'')
+
+        if size < 0:
+            data, self._buffer = self._buffer, b''
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+
+        self.size += len(data)
+        return data
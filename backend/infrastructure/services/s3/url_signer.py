@@ -0,0 +1,54 @@
+import time
+from collections.abc import Collection, Mapping
+from datetime import UTC, datetime, timedelta
+
+from miniopy_async import Minio
+
+from backend.application import interfaces
+from backend.config import Config
+from backend.domain.entities.cache import CacheStats
+from backend.infrastructure.cache.memory import TTLCache
+
+
+class PresignedUrlCache(interfaces.MediaUrlSigner):
+    def __init__(
+        self,
+        client: Minio,
+        config: Config,
+    ):
+        self._client = client
+        self._bucket = config.minio.bucket
+        self._expiry = timedelta(seconds=config.media.url_expiry)
+        self._window_size = config.media.url_expiry - config.media.url_refresh_before
+        self._urls: TTLCache[tuple[int, str], str] = TTLCache(
+            max_size=config.media.url_cache_size,
+            ttl=self._window_size,
+        )
+
+    def get_window(self) -> int:
+        return int(time.time()) // self._window_size
+
+    async def sign_many(self, file_names: Collection[str]) -> Mapping[str, str]:
+        window = self.get_window()
+        request_date = datetime.fromtimestamp(window * self._window_size, tz=UTC)
+
+        urls = {}
+        for file_name in file_names:
+            if file_name in urls:
+                continue
+
+            url = self._urls.get((window, file_name))
+            if url is None:
+                url = await self._client.presigned_get_object(
+                    bucket_name=self._bucket,
+                    object_name=file_name,
+                    expires=self._expiry,
+                    request_date=request_date,
+                )
+                self._urls.set((window, file_name), url)
+            urls[file_name] = url
+
+        return urls
+
+    def get_stats(self) -> CacheStats:
+        return CacheStats(name='presigned_urls', hits=self._urls.hits, misses=self._urls.misses)
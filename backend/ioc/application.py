@@ -3,17 +3,20 @@ from uuid import uuid4
 from dishka import Provider, Scope, from_context, provide
 
 from backend.application import interfaces
+from backend.application.services.media import MediaUrlService
 from backend.application.services.pagination import PaginationService
 from backend.application.use_cases.banner import (
     DeleteBannerInteractor,
     GetBannerInteractor,
+    GetBannersFeedInteractor,
     GetBannersInteractor,
     SaveBannerInteractor,
+    UpdateBannerDisplayPriorityInteractor,
     UpdateBannerUrlInteractor,
-    UpdatePcBannerInteractor,
     UpdateMobileBannerInteractor,
-    UpdateBannerDisplayPriorityInteractor
+    UpdatePcBannerInteractor,
 )
+from backend.application.use_cases.cache import GetCacheStatsInteractor
 from backend.application.use_cases.category import (
     DeleteCategoryInteractor,
     GetAllCategoriesInteractor,
@@ -28,6 +31,7 @@ from backend.application.use_cases.city import (
     GetStoreCitiesInteractor,
     SaveCitiesInteractor,
 )
+from backend.application.use_cases.media import SweepMediaInteractor
 from backend.application.use_cases.store import (
     CanAddStoreInteractor,
     DeleteStoreInteractor,
@@ -35,6 +39,7 @@ from backend.application.use_cases.store import (
     GetStoreDetailsInteractor,
     GetStoreInteractor,
     GetStoresByFilterInteractor,
+    GetStoresDetailsInteractor,
     SaveStoreInteractor,
     UpdateStoreDescriptionInteractor,
     UpdateStoreDisplayPriorityInteractor,
@@ -82,6 +87,7 @@ class ApplicationProvider(Provider):
 
     get_store_interactor = provide(GetStoreInteractor, scope=Scope.REQUEST)
     get_store_details_interactor = provide(GetStoreDetailsInteractor, scope=Scope.REQUEST)
+    get_stores_details_interactor = provide(GetStoresDetailsInteractor, scope=Scope.REQUEST)
     can_add_store_interactor = provide(CanAddStoreInteractor, scope=Scope.REQUEST)
     get_all_stores_interactor = provide(GetAllStoresInteractor, scope=Scope.REQUEST)
     get_stores_by_filter = provide(GetStoresByFilterInteractor, scope=Scope.REQUEST)
@@ -109,6 +115,7 @@ class ApplicationProvider(Provider):
 
     get_banner_interactor = provide(GetBannerInteractor, scope=Scope.REQUEST)
     get_banners_interactor = provide(GetBannersInteractor, scope=Scope.REQUEST)
+    get_banners_feed_interactor = provide(GetBannersFeedInteractor, scope=Scope.REQUEST)
     save_banner_interactor = provide(SaveBannerInteractor, scope=Scope.REQUEST)
     update_banner_url_interactor = provide(UpdateBannerUrlInteractor, scope=Scope.REQUEST)
     update_banner_display_priority = provide(UpdateBannerDisplayPriorityInteractor, scope=Scope.REQUEST)
@@ -116,4 +123,9 @@ class ApplicationProvider(Provider):
     update_mobile_banner_interactor = provide(UpdateMobileBannerInteractor, scope=Scope.REQUEST)
     delete_banner_interactor = provide(DeleteBannerInteractor, scope=Scope.REQUEST)
 
+    get_cache_stats_interactor = provide(GetCacheStatsInteractor, scope=Scope.REQUEST)
+
+    sweep_media_interactor = provide(SweepMediaInteractor, scope=Scope.REQUEST)
+
     pagination_service = provide(PaginationService, scope=Scope.REQUEST)
+    media_url_service = provide(MediaUrlService, scope=Scope.APP)
@@ -1,6 +1,10 @@
-from collections.abc import AsyncIterable
+from collections.abc import AsyncIterable, Iterable
+from concurrent.futures import ProcessPoolExecutor
 
+import aiohttp
 import redis.asyncio as redis
+from aiogram.fsm.storage.base import BaseEventIsolation, BaseStorage, DefaultKeyBuilder
+from aiogram.fsm.storage.redis import RedisEventIsolation
 from dishka import AnyOf, Provider, Scope, provide
 from miniopy_async import Minio
 from psycopg import AsyncConnection
@@ -11,23 +15,39 @@ from backend.application.use_cases.banner import DeleteBannerManager, UpdateBann
 from backend.application.use_cases.category import DeleteCategoryManager
 from backend.application.use_cases.city import DeleteCityManager
 from backend.application.use_cases.store import DeleteStoreManager, UpdateStoreManager
-from backend.application.use_cases.store_category import AddStoreCategoryManager, DeleteStoreCategoryManager
-from backend.application.use_cases.store_city import AddStoreCityManager, DeleteStoreCityManager
+from backend.application.use_cases.store_category import AddStoreCategoryManager
+from backend.application.use_cases.store_city import AddStoreCityManager
 from backend.application.use_cases.store_resource import AddStoreResourceManager, DeleteStoreResourcesManager
 from backend.config import Config
+from backend.infrastructure import serialization
+from backend.infrastructure.cache.catalog_version import CatalogVersionTracker, RedisCatalogVersionBumper
+from backend.infrastructure.cache.reference_data import (
+    CachedCategoryReader,
+    CachedCityReader,
+    InMemoryReferenceDataCache,
+)
+from backend.infrastructure.cache.store_details import RedisStoreDetailsCache
+from backend.infrastructure.jobs.redis_stream import RedisJobQueue, RedisJobWorker
 from backend.infrastructure.mapper.banner import BannerMapper
 from backend.infrastructure.mapper.store import StoreMapper
 from backend.infrastructure.repository.banner import BannerRepository
 from backend.infrastructure.repository.category import CategoryRepository
 from backend.infrastructure.repository.city import CityRepository
+from backend.infrastructure.repository.media import MediaRepository
 from backend.infrastructure.repository.store import StoreRepository
 from backend.infrastructure.repository.store_category import StoreCategoryRepository
 from backend.infrastructure.repository.store_city import StoreCityRepository
 from backend.infrastructure.repository.store_recource import StoreRecourceRepository
+from backend.infrastructure.services.bot.fsm.storage import SharedRedisStorage
 from backend.infrastructure.services.bot.helpers.items_displayer import ItemsDisplayer
 from backend.infrastructure.services.bot.keyboard.inline import KeyboardBuilder
+from backend.infrastructure.services.bot.media.file_id_cache import FileIdCache
 from backend.infrastructure.services.bot.media.media_service import MediaService
+from backend.infrastructure.services.image.processor import ImageProcessor
+from backend.infrastructure.services.s3.media_storage import S3MediaStorage
+from backend.infrastructure.services.s3.minio import PooledMinio
 from backend.infrastructure.services.s3.s3_client import S3Client
+from backend.infrastructure.services.s3.url_signer import PresignedUrlCache
 
 
 class InfrastructureProvider(Provider):
@@ -35,8 +55,8 @@ class InfrastructureProvider(Provider):
     async def get_connection_pool(self, config: Config) -> AsyncIterable[AsyncConnectionPool]:
         pool = AsyncConnectionPool(
             conninfo=config.pg.create_connection_string(),
-            min_size=40,
-            max_size=80,
+            min_size=config.pg.pool_min_size,
+            max_size=config.pg.pool_max_size,
             open=False,
         )
         await pool.open()
@@ -52,37 +72,91 @@ class InfrastructureProvider(Provider):
 
     @provide(scope=Scope.APP)
     async def get_redis_connection_pool(self, config: Config) -> AsyncIterable[redis.ConnectionPool]:
-        pool = redis.ConnectionPool.from_url(url=config.redis.create_connection_string())
+        pool = redis.BlockingConnectionPool.from_url(
+            url=config.redis.create_connection_string(),
+            max_connections=config.redis.max_connections,
+            timeout=config.redis.pool_timeout,
+            health_check_interval=config.redis.health_check_interval,
+            socket_keepalive=config.redis.socket_keepalive,
+        )
         yield pool
         await pool.aclose()
 
-    @provide(scope=Scope.REQUEST)
+    @provide(scope=Scope.APP)
     async def get_redis_client(self, pool: redis.ConnectionPool) -> AsyncIterable[redis.Redis]:
         client = redis.Redis(connection_pool=pool)
+        await client.ping()
         yield client
         await client.aclose()
 
-    @provide(scope=Scope.REQUEST)
-    async def get_minio_client(self, config: Config) -> Minio:
-        client = Minio(
+    @provide(scope=Scope.APP)
+    def get_fsm_storage(self, client: redis.Redis, config: Config) -> BaseStorage:
+        return SharedRedisStorage(
+            redis=client,
+            key_builder=DefaultKeyBuilder(prefix='fsm'),
+            state_ttl=config.bot.fsm_ttl,
+            data_ttl=config.bot.fsm_ttl,
+            json_dumps=serialization.dumps,
+            json_loads=serialization.loads,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_fsm_events_isolation(self, client: redis.Redis, config: Config) -> BaseEventIsolation:
+        return RedisEventIsolation(
+            redis=client,
+            key_builder=DefaultKeyBuilder(prefix='fsm'),
+            lock_kwargs={'timeout': config.webhook.chat_lock_timeout},
+        )
+
+    @provide(scope=Scope.APP, provides=AnyOf[CatalogVersionTracker, interfaces.CatalogVersionReader])
+    def get_catalog_version_tracker(self, client: redis.Redis, config: Config) -> CatalogVersionTracker:
+        return CatalogVersionTracker(client=client, config=config)
+
+    @provide(scope=Scope.APP, provides=AnyOf[InMemoryReferenceDataCache, interfaces.ReferenceDataCache])
+    def get_reference_data_cache(self, config: Config, tracker: CatalogVersionTracker) -> InMemoryReferenceDataCache:
+        cache = InMemoryReferenceDataCache(config=config)
+        tracker.add_listener(cache.on_catalog_change)
+        return cache
+
+    @provide(scope=Scope.APP)
+    async def get_minio_client(self, config: Config) -> AsyncIterable[Minio]:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=config.minio.max_connections,
+                keepalive_timeout=config.minio.keepalive_timeout,
+            ),
+        )
+        client = PooledMinio(
             endpoint=config.minio.url,
             access_key=config.minio.user,
             secret_key=config.minio.password,
             secure=True,
+            region=config.minio.region,
+            session=session,
         )
-
-        return client
+        yield client
+        await session.close()
 
     city_repo = provide(
         CityRepository,
         scope=Scope.REQUEST,
-        provides=AnyOf[interfaces.CityReader, interfaces.CitySaver, DeleteCityManager],
+        provides=AnyOf[interfaces.CitySaver, DeleteCityManager],
+    )
+    cached_city_reader = provide(
+        CachedCityReader,
+        scope=Scope.APP,
+        provides=interfaces.CityReader,
     )
 
     category_repo = provide(
         CategoryRepository,
         scope=Scope.REQUEST,
-        provides=AnyOf[interfaces.CategoryReader, interfaces.CategorySaver, DeleteCategoryManager],
+        provides=AnyOf[interfaces.CategorySaver, DeleteCategoryManager],
+    )
+    cached_category_reader = provide(
+        CachedCategoryReader,
+        scope=Scope.APP,
+        provides=interfaces.CategoryReader,
     )
 
     store_mapper = provide(
@@ -95,16 +169,38 @@ class InfrastructureProvider(Provider):
         provides=AnyOf[interfaces.StoreReader, interfaces.StoreSaver, UpdateStoreManager, DeleteStoreManager],
     )
 
+    store_details_cache = provide(
+        RedisStoreDetailsCache,
+        scope=Scope.REQUEST,
+        provides=interfaces.StoreDetailsCache,
+    )
+
+    catalog_version_bumper = provide(
+        RedisCatalogVersionBumper,
+        scope=Scope.REQUEST,
+        provides=interfaces.CatalogVersionBumper,
+    )
+
+    job_queue = provide(
+        RedisJobQueue,
+        scope=Scope.APP,
+        provides=interfaces.JobQueue,
+    )
+    job_worker = provide(
+        RedisJobWorker,
+        scope=Scope.APP,
+    )
+
     store_city_repo = provide(
         StoreCityRepository,
         scope=Scope.REQUEST,
-        provides=AnyOf[AddStoreCityManager, DeleteStoreCityManager, interfaces.StoreCitySaver],
+        provides=AnyOf[AddStoreCityManager, interfaces.StoreCitySaver, interfaces.StoreCityDeleter],
     )
 
     store_category_repo = provide(
         StoreCategoryRepository,
         scope=Scope.REQUEST,
-        provides=AnyOf[AddStoreCategoryManager, DeleteStoreCategoryManager, interfaces.StoreCategorySaver],
+        provides=AnyOf[AddStoreCategoryManager, interfaces.StoreCategorySaver, interfaces.StoreCategoryDeleter],
     )
 
     store_recource_repo = provide(
@@ -130,7 +226,7 @@ class InfrastructureProvider(Provider):
 
     keyboard_builder = provide(
         KeyboardBuilder,
-        scope=Scope.REQUEST,
+        scope=Scope.APP,
         provides=interfaces.KeyboardBuilder,
     )
 
@@ -138,11 +234,50 @@ class InfrastructureProvider(Provider):
         MediaService,
         scope=Scope.REQUEST,
     )
+    file_id_cache = provide(
+        FileIdCache,
+        scope=Scope.APP,
+    )
+
+    @provide(scope=Scope.APP)
+    def get_image_process_pool(self, config: Config) -> Iterable[ProcessPoolExecutor]:
+        executor = ProcessPoolExecutor(max_workers=config.media.processing_workers)
+        yield executor
+        executor.shutdown(cancel_futures=True)
+
+    image_processor = provide(
+        ImageProcessor,
+        scope=Scope.APP,
+    )
 
     s3_client = provide(
         S3Client,
-        scope=Scope.REQUEST,
+        scope=Scope.APP,
         provides=interfaces.S3Client,
     )
 
+    media_url_signer = provide(
+        PresignedUrlCache,
+        scope=Scope.APP,
+        provides=interfaces.MediaUrlSigner,
+    )
+
+    media_storage = provide(
+        S3MediaStorage,
+        scope=Scope.APP,
+        provides=interfaces.MediaStorage,
+    )
+    media_repo = provide(
+        MediaRepository,
+        scope=Scope.REQUEST,
+        provides=AnyOf[
+            MediaRepository,
+            interfaces.MediaObjectReader,
+            interfaces.MediaObjectSaver,
+            interfaces.MediaObjectDeleter,
+            interfaces.MediaReferenceSaver,
+            interfaces.MediaReferenceDeleter,
+        ],
+    )
+
     items_displayer = provide(ItemsDisplayer, scope=Scope.REQUEST)
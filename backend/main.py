@@ -1,14 +1,22 @@
 import argparse
+import asyncio
 import logging
+import multiprocessing
+import signal
+import time
 from collections.abc import Callable, Coroutine
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
+from dataclasses import replace
+from multiprocessing.connection import wait
+from multiprocessing.process import BaseProcess
+from types import FrameType
 from typing import Any
 
 import uvicorn
 from aiogram import Bot, Dispatcher, Router
 from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
-from aiogram.fsm.storage.memory import MemoryStorage
+from aiogram.fsm.storage.base import BaseEventIsolation, BaseStorage
 from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
 from aiohttp import web
 from dishka import AsyncContainer, make_async_container
@@ -17,20 +25,66 @@ from fastapi import APIRouter, FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from backend import ioc
+from backend.application.use_cases.media import SweepMediaInteractor
 from backend.config import Config
+from backend.infrastructure.cache.catalog_version import CatalogVersionTracker
+from backend.infrastructure.jobs.redis_stream import RedisJobWorker
+from backend.presentation.api.middlewares.http_cache import HttpCacheMiddleware
 from backend.presentation.api.routers import router
 from backend.presentation.bot.handlers import router_list
+from backend.presentation.bot.jobs import get_job_handlers
 from backend.presentation.bot.middlewares.user_access import UserAcessMiddleware
 from backend.presentation.exceptions_mapping import EXCEPTIONS_MAPPING
 
 config = Config()
 
+logger = logging.getLogger(__name__)
+
+WORKER_RESTART_DELAY = 1
+
 
 async def on_startup(bot: Bot):
     await bot.delete_webhook(drop_pending_updates=True)
     await bot.set_webhook(f'{config.webhook.url}{config.webhook.path}', allowed_updates=['message', 'callback_query'])
 
 
+async def start_catalog_change_feed(dispatcher: Dispatcher, app_container: AsyncContainer):
+    tracker = await app_container.get(CatalogVersionTracker)
+    dispatcher['catalog_change_feed'] = asyncio.create_task(
+        tracker.run(resync_interval=config.catalog.resync_interval),
+    )
+
+
+async def stop_catalog_change_feed(dispatcher: Dispatcher):
+    change_feed_task = dispatcher['catalog_change_feed']
+    change_feed_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await change_feed_task
+
+
+async def start_job_worker(dispatcher: Dispatcher, app_container: AsyncContainer):
+    worker = await app_container.get(RedisJobWorker)
+    dispatcher['job_worker'] = asyncio.create_task(worker.run(handlers=get_job_handlers(app_container)))
+
+
+async def stop_job_worker(dispatcher: Dispatcher):
+    job_worker_task = dispatcher['job_worker']
+    job_worker_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await job_worker_task
+
+
+async def run_media_sweeper(container: AsyncContainer):
+    while True:
+        try:
+            async with container() as request_container:
+                sweeper = await request_container.get(SweepMediaInteractor)
+                await sweeper()
+        except Exception:
+            logger.exception('Media sweep failed')
+        await asyncio.sleep(config.media.sweep_interval)
+
+
 def setup_logging():
     logging.basicConfig(
         level=logging.DEBUG,
@@ -47,11 +101,21 @@ def create_bot(token: str) -> Bot:
     )
 
 
-def create_dispatcher(routers: list[Router], container: AsyncContainer) -> Dispatcher:
-    storage = MemoryStorage()
-    dp = Dispatcher(storage=storage)
+async def create_dispatcher(
+        routers: list[Router],
+        container: AsyncContainer,
+        register_webhook: bool = True,
+) -> Dispatcher:
+    storage = await container.get(BaseStorage)
+    events_isolation = await container.get(BaseEventIsolation)
+    dp = Dispatcher(storage=storage, events_isolation=events_isolation, app_container=container)
     dp.include_routers(*routers)
-    dp.startup.register(on_startup)
+    if register_webhook:
+        dp.startup.register(on_startup)
+    dp.startup.register(start_catalog_change_feed)
+    dp.shutdown.register(stop_catalog_change_feed)
+    dp.startup.register(start_job_worker)
+    dp.shutdown.register(stop_job_worker)
 
     middleware = UserAcessMiddleware(container=container)
     dp.message.outer_middleware(middleware)
@@ -73,7 +137,16 @@ def create_bot_app(dp: Dispatcher, bot: Bot) -> web.Application:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    tracker = await app.state.dishka_container.get(CatalogVersionTracker)
+    change_feed_task = asyncio.create_task(tracker.run(resync_interval=config.catalog.resync_interval))
+    media_sweeper_task = asyncio.create_task(run_media_sweeper(app.state.dishka_container))
+
     yield
+
+    for task in (change_feed_task, media_sweeper_task):
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
     await app.state.dishka_container.close()
 
 
@@ -88,6 +161,7 @@ def create_api_app(
     app = FastAPI(lifespan=lifespan, exception_handlers=exc_mapping, openapi_url="/api/openapi.json", docs_url="/api/docs")
     app.include_router(router)
 
+    app.add_middleware(HttpCacheMiddleware, container=container, max_age=config.http_cache.max_age)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=['*'],
@@ -100,14 +174,89 @@ def create_api_app(
     return app
 
 
-def launch_bot(bot: Bot, container: AsyncContainer, routers: list[Router]):
+async def init_bot_app(
+        bot: Bot,
+        container: AsyncContainer,
+        routers: list[Router],
+        register_webhook: bool = True,
+) -> web.Application:
+    dp = await create_dispatcher(routers, container, register_webhook=register_webhook)
+    aiogram_integration.setup_dishka(container=container, router=dp, auto_inject=True)
+    return create_bot_app(dp, bot)
+
+
+def launch_bot(bot: Bot, container: AsyncContainer, routers: list[Router], register_webhook: bool = True):
     setup_logging()
 
-    dp = create_dispatcher(routers, container)
-    aiogram_integration.setup_dishka(container=container, router=dp, auto_inject=True)
-    app = create_bot_app(dp, bot)
+    web.run_app(
+        init_bot_app(bot, container, routers, register_webhook=register_webhook),
+        host=config.webhook.host,
+        port=config.webhook.port,
+        reuse_port=config.webhook.workers > 1,
+    )
+
+
+def run_bot_worker(register_webhook: bool):
+    bot = create_bot(token=config.bot.token)
+    worker_config = replace(config, pg=config.pg.split_pool(processes=config.webhook.workers))
+    bot_container = make_async_container(
+        ioc.ApplicationProvider(),
+        ioc.InfrastructureProvider(),
+        aiogram_integration.AiogramProvider(),
+        context={Config: worker_config, Bot: bot},
+    )
+    launch_bot(bot=bot, container=bot_container, routers=router_list, register_webhook=register_webhook)
+
+
+class BotWorkerSupervisor:
+    def __init__(self, workers: int):
+        self._workers = workers
+        self._context = multiprocessing.get_context('spawn')
+        self._processes: dict[int, BaseProcess] = {}
+        self._stopping = False
+
+    def run(self):
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        for worker_id in range(self._workers):
+            self._start(worker_id, register_webhook=worker_id == 0)
+
+        while not self._stopping:
+            wait([process.sentinel for process in self._processes.values()])
+            for worker_id, process in list(self._processes.items()):
+                if process.is_alive() or self._stopping:
+                    continue
+                logger.warning('Bot worker %s exited with code %s, restarting', worker_id, process.exitcode)
+                time.sleep(WORKER_RESTART_DELAY)
+                self._start(worker_id)
+
+        for process in self._processes.values():
+            process.join()
+
+    def _start(self, worker_id: int, register_webhook: bool = False):
+        process = self._context.Process(
+            target=run_bot_worker,
+            args=(register_webhook,),
+            name=f'bot-worker-{worker_id}',
+        )
+        process.start()
+        self._processes[worker_id] = process
+
+    def _stop(self, signum: int, _: FrameType | None):
+        self._stopping = True
+        logger.info('Received signal %s, stopping bot workers', signum)
+        for process in self._processes.values():
+            if process.is_alive():
+                process.terminate()
+
 
-    web.run_app(app, host=config.webhook.host, port=config.webhook.port)
+def launch_bot_workers(workers: int):
+    if workers <= 1:
+        run_bot_worker(register_webhook=True)
+        return
+
+    BotWorkerSupervisor(workers=workers).run()
 
 
 def launch_api(
@@ -146,14 +295,7 @@ def main():
     args = parser.parse_args()
 
     if args.app == 'bot':
-        bot = create_bot(token=config.bot.token)
-        bot_container = make_async_container(
-            ioc.ApplicationProvider(),
-            ioc.InfrastructureProvider(),
-            aiogram_integration.AiogramProvider(),
-            context={Config: config, Bot: bot},
-        )
-        launch_bot(bot=bot, container=bot_container, routers=router_list)
+        launch_bot_workers(workers=config.webhook.workers)
 
     elif args.app == 'api':
         api_container = make_async_container(
@@ -36,3 +36,10 @@ async def banners_not_found_exception_handler(request: Request, exc: Exception)
         status_code=status.HTTP_404_NOT_FOUND,
         content={'detail': str(exc)},
     )
+
+
+async def invalid_pagination_cursor_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={'detail': str(exc)},
+    )
@@ -0,0 +1,123 @@
+import hashlib
+from collections.abc import Mapping
+from http import HTTPStatus
+from urllib.parse import parse_qs
+from uuid import UUID
+
+from dishka import AsyncContainer
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.application import interfaces
+from backend.domain.entities.catalog import CatalogEntity
+
+ROUTE_ENTITIES: dict[str, tuple[CatalogEntity, ...]] = {
+    '/api/banner/': (CatalogEntity.BANNER,),
+    '/api/city/': (CatalogEntity.CITY,),
+    '/api/category/': (CatalogEntity.CATEGORY,),
+    '/api/store/': (CatalogEntity.STORE,),
+}
+
+MEDIA_ROUTES = ('/api/banner/', '/api/store/')
+
+STORE_DETAILS_PATH = '/api/store/by-id'
+STORE_DETAILS_ENTITIES = (CatalogEntity.CITY, CatalogEntity.CATEGORY)
+
+
+class HttpCacheMiddleware:
+    def __init__(self, app: ASGIApp, container: AsyncContainer, max_age: int):
+        self._app = app
+        self._container = container
+        self._cache_control = f'public, max-age={max_age}, must-revalidate'
+        self._versions: interfaces.CatalogVersionReader | None = None
+        self._url_signer: interfaces.MediaUrlSigner | None = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or scope['method'] != 'GET':
+            await self._app(scope, receive, send)
+            return
+
+        entities = self._get_route_entities(scope['path'])
+        if entities is None:
+            await self._app(scope, receive, send)
+            return
+
+        if self._versions is None:
+            self._versions = await self._container.get(interfaces.CatalogVersionReader)
+            self._url_signer = await self._container.get(interfaces.MediaUrlSigner)
+
+        versions = self._versions.get_versions()
+        if versions is None:
+            await self._app(scope, receive, send)
+            return
+
+        etag = self._make_etag(scope=scope, state=self._get_state(scope=scope, entities=entities, versions=versions))
+        if_none_match = Headers(scope=scope).get('if-none-match')
+        if if_none_match and self._etag_matches(etag=etag, if_none_match=if_none_match):
+            await send(
+                {
+                    'type': 'http.response.start',
+                    'status': HTTPStatus.NOT_MODIFIED,
+                    'headers': [
+                        (b'etag', etag.encode()),
+                        (b'cache-control', self._cache_control.encode()),
+                    ],
+                },
+            )
+            await send({'type': 'http.response.body', 'body': b''})
+            return
+
+        async def send_with_etag(message: Message) -> None:
+            if message['type'] == 'http.response.start' and message['status'] == HTTPStatus.OK:
+                headers = MutableHeaders(scope=message)
+                headers['etag'] = etag
+                headers['cache-control'] = self._cache_control
+            await send(message)
+
+        await self._app(scope, receive, send_with_etag)
+
+    @staticmethod
+    def _get_route_entities(path: str) -> tuple[CatalogEntity, ...] | None:
+        for prefix, entities in ROUTE_ENTITIES.items():
+            if path.startswith(prefix):
+                return entities
+        return None
+
+    def _get_state(
+        self,
+        scope: Scope,
+        entities: tuple[CatalogEntity, ...],
+        versions: Mapping[CatalogEntity, int],
+    ) -> str:
+        state = ''
+        store_id = self._parse_store_id(scope['query_string']) if scope['path'] == STORE_DETAILS_PATH else None
+        if store_id is not None:
+            entities = STORE_DETAILS_ENTITIES
+            state = f'store:{store_id}:{self._versions.get_store_version(store_id)},'
+
+        if scope['path'].startswith(MEDIA_ROUTES):
+            state += f'media:{self._url_signer.get_window()},'
+
+        return state + ','.join(f'{entity}:{versions.get(entity, 0)}' for entity in entities)
+
+    @staticmethod
+    def _parse_store_id(query_string: bytes) -> UUID | None:
+        values = parse_qs(query_string.decode('latin-1')).get('store_id')
+        if not values:
+            return None
+        try:
+            return UUID(values[0])
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _make_etag(scope: Scope, state: str) -> str:
+        key = b'%s?%s|%s' % (scope['path'].encode(), scope['query_string'], state.encode())
+        digest = hashlib.sha256(key).hexdigest()
+        return f'"{digest[:32]}"'
+
+    @staticmethod
+    def _etag_matches(etag: str, if_none_match: str) -> bool:
+        if if_none_match.strip() == '*':
+            return True
+        return any(candidate.strip().removeprefix('W/') == etag for candidate in if_none_match.split(','))
@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
 from backend.presentation.api.routers.banners.route import router as banner_router
+from backend.presentation.api.routers.cache.route import router as cache_router
 from backend.presentation.api.routers.category.route import router as category_router
 from backend.presentation.api.routers.city.route import router as city_router
 from backend.presentation.api.routers.store.route import router as store_router
@@ -10,6 +11,7 @@ router = APIRouter(
 )
 
 router.include_router(banner_router)
+router.include_router(cache_router)
 router.include_router(category_router)
 router.include_router(city_router)
 router.include_router(store_router)
@@ -1,8 +1,8 @@
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
-from backend.application.use_cases.banner import GetBannersInteractor
-from backend.presentation.api.routers.banners.schemas import BannerReponseSchema, BannersReponseSchema
+from backend.application.use_cases.banner import GetBannersFeedInteractor
+from backend.presentation.api.routers.banners.schemas import BannersReponseSchema
 
 router = APIRouter(
     prefix='/banner',
@@ -13,18 +13,8 @@ router = APIRouter(
 
 @router.get('/all', response_model=BannersReponseSchema)
 async def get_all_banners(
-    interactor: FromDishka[GetBannersInteractor],
+    interactor: FromDishka[GetBannersFeedInteractor],
 ):
-    banners = await interactor()
+    feed = await interactor()
 
-    return BannersReponseSchema(
-        banners=[
-            BannerReponseSchema(
-                id=banner.id,
-                media_type=banner.media_type,
-                target_url=banner.target_url,
-                display_priority=banner.display_priority
-            )
-            for banner in banners
-        ]
-    )
+    return Response(content=feed, media_type='application/json')
@@ -3,6 +3,7 @@ from uuid import UUID
 from pydantic import BaseModel
 
 from backend.domain.entities.media import MediaType
+from backend.presentation.api.schemas import MediaAssetSchema
 
 
 class BannerReponseSchema(BaseModel):
@@ -10,6 +11,7 @@ class BannerReponseSchema(BaseModel):
     media_type: MediaType
     target_url: str
     display_priority: int
+    media: list[MediaAssetSchema] = []
 
 
 class BannersReponseSchema(BaseModel):
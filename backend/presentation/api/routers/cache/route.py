@@ -0,0 +1,33 @@
+import secrets
+from typing import Annotated
+
+from dishka.integrations.fastapi import DishkaRoute, FromDishka
+from fastapi import APIRouter, Header, HTTPException
+from starlette import status
+
+from backend.application.use_cases.cache import GetCacheStatsInteractor
+from backend.config import Config
+from backend.presentation.api.routers.cache.schemas import CachesStatsResponseSchema, CacheStatsResponseSchema
+
+router = APIRouter(
+    prefix='/cache',
+    route_class=DishkaRoute,
+    tags=['cache'],
+)
+
+
+@router.get('/stats', response_model=CachesStatsResponseSchema, include_in_schema=False)
+async def get_cache_stats(
+    interactor: FromDishka[GetCacheStatsInteractor],
+    config: FromDishka[Config],
+    x_admin_token: Annotated[str | None, Header()] = None,
+) -> CachesStatsResponseSchema:
+    admin_token = config.api.admin_token
+    if not admin_token or x_admin_token is None or not secrets.compare_digest(x_admin_token, admin_token):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
+
+    stats = await interactor()
+
+    return CachesStatsResponseSchema(
+        caches=[CacheStatsResponseSchema(name=item.name, hits=item.hits, misses=item.misses) for item in stats],
+    )
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+
+class CacheStatsResponseSchema(BaseModel):
+    name: str
+    hits: int
+    misses: int
+
+
+class CachesStatsResponseSchema(BaseModel):
+    caches: list[CacheStatsResponseSchema]
@@ -1,19 +1,28 @@
+from collections.abc import Collection
+from typing import Annotated
 from uuid import UUID
 
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
 
+from backend.application.services.media import MediaUrlService
 from backend.application.use_cases.store import (
     GetAllStoresInteractor,
     GetStoreDetailsInteractor,
     GetStoresByFilterInteractor,
+    GetStoresDetailsInteractor,
 )
+from backend.domain.entities.media import MediaAsset
+from backend.domain.entities.store import Store, StoreDetails, StoreSearchMode
 from backend.presentation.api.routers.store.schemas import (
     StoreDetailsResponseSchema,
+    StoreInclude,
     StoreResourceResponseSchema,
     StoreResponseSchema,
+    StoresDetailsReponseSchema,
     StoresReponseSchema,
 )
+from backend.presentation.api.schemas import MediaAssetSchema
 
 router = APIRouter(
     prefix='/store',
@@ -22,28 +31,67 @@ router = APIRouter(
 )
 
 
-@router.get('/all', response_model=StoresReponseSchema)
+async def get_signed_assets(stores: Collection[Store], media_urls: MediaUrlService) -> dict[UUID, list[MediaAsset]]:
+    assets = {store.id: media_urls.get_store_assets(store=store) for store in stores}
+    await media_urls.sign(assets=[asset for store_assets in assets.values() for asset in store_assets])
+    return assets
+
+
+def store_to_schema(store: Store, assets: list[MediaAsset]) -> StoreResponseSchema:
+    return StoreResponseSchema(
+        id=store.id,
+        title=store.title,
+        description=store.description,
+        preview_media_type=store.preview_media_type,
+        main_media_type=store.main_media_type,
+        main_page_url=store.main_page_url,
+        media=[MediaAssetSchema.model_validate(asset, from_attributes=True) for asset in assets],
+    )
+
+
+def store_details_to_schema(details: StoreDetails, assets: list[MediaAsset]) -> StoreDetailsResponseSchema:
+    return StoreDetailsResponseSchema(
+        store=store_to_schema(store=details.store, assets=assets),
+        cities=[city.title for city in details.cities],
+        categories=[category.title for category in details.categories],
+        resources=[
+            StoreResourceResponseSchema(
+                title=resource.title,
+                target_url=resource.target_url,
+            )
+            for resource in details.resources
+        ],
+    )
+
+
+@router.get('/all', response_model=StoresReponseSchema | StoresDetailsReponseSchema)
 async def get_all_stores(
-    page: int,
-    page_size: int,
+    page_size: Annotated[int, Query(ge=1)],
     interactor: FromDishka[GetAllStoresInteractor],
+    details_interactor: FromDishka[GetStoresDetailsInteractor],
+    media_urls: FromDishka[MediaUrlService],
+    page: Annotated[int, Query(ge=1)] = 1,
+    cursor: str | None = None,
+    include: StoreInclude | None = None,
 ):
-    stores = await interactor(page=page, page_size=page_size)
+    stores = await interactor(page=page, page_size=page_size, cursor=cursor)
+
+    if include == StoreInclude.DETAILS:
+        details = await details_interactor(store_ids=[store.id for store in stores.items])
+        assets = await get_signed_assets(stores=[item.store for item in details], media_urls=media_urls)
+        return StoresDetailsReponseSchema(
+            total=stores.total,
+            size=stores.size,
+            next_cursor=stores.next_cursor,
+            stores=[store_details_to_schema(details=item, assets=assets[item.store.id]) for item in details],
+        )
 
+    assets = await get_signed_assets(stores=stores.items, media_urls=media_urls)
     return StoresReponseSchema(
         total=stores.total,
         size=stores.size,
-        stores=[
-            StoreResponseSchema(
-                id=store.id,
-                title=store.title,
-                description=store.description,
-                preview_media_type=store.preview_media_type,
-                main_media_type=store.main_media_type,
-                main_page_url=store.main_page_url,
-            )
-            for store in stores.items
-        ],
+        next_cursor=stores.next_cursor,
+        stores=[store_to_schema(store=store, assets=assets[store.id]) for store in stores.items],
     )
 
 
@@ -51,59 +99,58 @@ async def get_all_stores(
 async def get_store_details(
     store_id: UUID,
     interactor: FromDishka[GetStoreDetailsInteractor],
+    media_urls: FromDishka[MediaUrlService],
 ):
     details = await interactor(store_id=store_id)
-    return StoreDetailsResponseSchema(
-        store=StoreResponseSchema(
-            id=details.store.id,
-            title=details.store.title,
-            description=details.store.description,
-            preview_media_type=details.store.preview_media_type,
-            main_media_type=details.store.main_media_type,
-            main_page_url=details.store.main_page_url,
-        ),
-        cities=[city.title for city in details.cities],
-        categories=[category.title for category in details.categories],
-        resources=[
-            StoreResourceResponseSchema(
-                title=resource.title,
-                target_url=resource.target_url,
-            )
-            for resource in details.resources
-        ],
-    )
+    assets = await get_signed_assets(stores=[details.store], media_urls=media_urls)
+    return store_details_to_schema(details=details, assets=assets[details.store.id])
+
 
+@router.get('/by-ids', response_model=list[StoreDetailsResponseSchema])
+async def get_stores_details(
+    ids: Annotated[list[UUID], Query(min_length=1, max_length=100)],
+    interactor: FromDishka[GetStoresDetailsInteractor],
+    media_urls: FromDishka[MediaUrlService],
+) -> list[StoreDetailsResponseSchema]:
+    details = await interactor(store_ids=ids)
+    assets = await get_signed_assets(stores=[item.store for item in details], media_urls=media_urls)
+    return [store_details_to_schema(details=item, assets=assets[item.store.id]) for item in details]
 
-@router.get('/by-filters', response_model=StoresReponseSchema)
+
+@router.get('/by-filters', response_model=StoresReponseSchema | StoresDetailsReponseSchema)
 async def get_stors_by_filters(
     interactor: FromDishka[GetStoresByFilterInteractor],
-    page: int,
-    page_size: int,
+    details_interactor: FromDishka[GetStoresDetailsInteractor],
+    media_urls: FromDishka[MediaUrlService],
+    page: Annotated[int, Query(ge=1)],
+    page_size: Annotated[int, Query(ge=1)],
     store_title: str | None = None,
     city_title: str | None = None,
     categories_title: str | None = None,
+    search_mode: StoreSearchMode = StoreSearchMode.SUBSTRING,
+    include: StoreInclude | None = None,
 ):
-    print(city_title)
     stores = await interactor(
         page=page,
         page_size=page_size,
         store_title=store_title,
         city_title=city_title,
         categories_title=categories_title,
+        search_mode=search_mode,
     )
 
+    if include == StoreInclude.DETAILS:
+        details = await details_interactor(store_ids=[store.id for store in stores.items])
+        assets = await get_signed_assets(stores=[item.store for item in details], media_urls=media_urls)
+        return StoresDetailsReponseSchema(
+            total=stores.total,
+            size=stores.size,
+            stores=[store_details_to_schema(details=item, assets=assets[item.store.id]) for item in details],
+        )
+
+    assets = await get_signed_assets(stores=stores.items, media_urls=media_urls)
     return StoresReponseSchema(
         total=stores.total,
         size=stores.size,
-        stores=[
-            StoreResponseSchema(
-                id=store.id,
-                title=store.title,
-                description=store.description,
-                preview_media_type=store.preview_media_type,
-                main_media_type=store.main_media_type,
-                main_page_url=store.main_page_url,
-            )
-            for store in stores.items
-        ],
+        stores=[store_to_schema(store=store, assets=assets[store.id]) for store in stores.items],
     )
@@ -1,8 +1,14 @@
+from enum import StrEnum
 from uuid import UUID
 
 from pydantic import BaseModel
 
 from backend.domain.entities.media import MediaType
+from backend.presentation.api.schemas import MediaAssetSchema
+
+
+class StoreInclude(StrEnum):
+    DETAILS = 'details'
 
 
 class StoreResponseSchema(BaseModel):
@@ -12,12 +18,14 @@ class StoreResponseSchema(BaseModel):
     preview_media_type: MediaType
     main_media_type: MediaType
     main_page_url: str
+    media: list[MediaAssetSchema]
 
 
 class StoresReponseSchema(BaseModel):
     total: int
     size: int
     stores: list[StoreResponseSchema]
+    next_cursor: str | None = None
 
 
 class StoreResourceResponseSchema(BaseModel):
@@ -30,3 +38,10 @@ class StoreDetailsResponseSchema(BaseModel):
     cities: list[str]
     categories: list[str]
     resources: list[StoreResourceResponseSchema]
+
+
+class StoresDetailsReponseSchema(BaseModel):
+    total: int
+    size: int
+    stores: list[StoreDetailsResponseSchema]
+    next_cursor: str | None = None
@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+
+
+class MediaVariantSchema(BaseModel):
+    width: int
+    format: str
+    url: str
+
+
+class MediaAssetSchema(BaseModel):
+    name: str
+    url: str
+    variants: list[MediaVariantSchema]
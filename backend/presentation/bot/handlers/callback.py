@@ -1,16 +1,14 @@
-from uuid import UUID
-
 from aiogram import F, Router
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery
 from dishka.integrations.aiogram import FromDishka
 
 from backend.application import interfaces
+from backend.application.services.media import MediaUrlService
 from backend.application.use_cases.banner import (
     DeleteBannerInteractor,
     GetBannerInteractor,
     GetBannersInteractor,
-    SaveBannerInteractor,
 )
 from backend.application.use_cases.category import (
     DeleteCategoryInteractor,
@@ -24,12 +22,10 @@ from backend.application.use_cases.store import (
     GetAllStoresInteractor,
     GetStoreDetailsInteractor,
     GetStoreInteractor,
-    SaveStoreInteractor,
 )
 from backend.application.use_cases.store_category import AddStoreCategoryInteractor, DeleteStoreCategoryInteractor
 from backend.application.use_cases.store_city import AddStoreCityInteractor, DeleteStoreCityInteractor
 from backend.application.use_cases.store_resource import DeleteStoreResourceInteractor, GetStoreResourcesInteractor
-from backend.config import Config
 from backend.domain import exceptions as domain_exceptions
 from backend.domain.templates.exceptions_text import (
     no_baners_for_edit_error_text,
@@ -47,6 +43,7 @@ from backend.domain.templates.menu_texts import (
     add_banner_menu_text,
     add_store_menu_text,
     banner_details_text,
+    banner_save_pending_text,
     choice_banner_for_edit_menu_text,
     choice_store_for_edit_menu_text,
     get_banner_edit_menu_text,
@@ -59,10 +56,23 @@ from backend.domain.templates.menu_texts import (
     select_action_menu_text,
     store_city_selection_menu_text,
     store_details_menu_text,
-    success_store_save_text,
-    success_banner_save_text
+    store_save_pending_text,
 )
 from backend.infrastructure.services.bot.helpers.items_displayer import ItemsDisplayer
+from backend.infrastructure.services.bot.keyboard.callback_data import (
+    BannerAction,
+    BannerCallback,
+    CategoryAction,
+    CategoryCallback,
+    CityAction,
+    CityCallback,
+    StoreAction,
+    StoreCallback,
+    StoreCategoryCallback,
+    StoreCityCallback,
+    StoreResourceCallback,
+)
+from backend.presentation.bot.jobs import SAVE_BANNER_JOB, SAVE_STORE_JOB
 from backend.presentation.bot.states.user import AddBanner, AddCategory, AddCity, AddStore, ChangeBanner, ChangeStore
 
 router = Router()
@@ -96,11 +106,11 @@ async def get_city_title(
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
 ):
     await call.answer()
-    msg = await call.message.edit_caption(
+    await call.message.edit_caption(
         caption=get_city_title_menu_text(),
         reply_markup=kb_builder.get_cities_return_kb().as_markup(),
     )
-    await state.update_data(msg=msg)
+    await state.update_data(msg_id=call.message.message_id)
     await state.set_state(AddCity.titles)
 
 
@@ -122,16 +132,15 @@ async def display_delete_cities_menu(
         await call.answer(no_cities_for_delete_error_text(), show_alert=True)
 
 
-@router.callback_query(F.data.startswith('drop_city'))
+@router.callback_query(CityCallback.filter(F.action == CityAction.DROP))
 async def process_drop_city(
         call: CallbackQuery,
+        callback_data: CityCallback,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
         interactor: FromDishka[DeleteCityInteractor],
 ):
-    _, city_id = call.data.split(':')
-
     try:
-        cities = await interactor(city_id=city_id)
+        cities = await interactor(city_id=callback_data.city_id)
         await call.answer()
         caption = get_city_for_delete_menu_text()
         keyboard = kb_builder.get_cities_delete_menu_kb(cities=cities)
@@ -161,11 +170,11 @@ async def get_category_title(
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
 ):
     await call.answer()
-    msg = await call.message.edit_caption(
+    await call.message.edit_caption(
         caption=get_category_title_menu_text(),
         reply_markup=kb_builder.get_categories_return_kb().as_markup(),
     )
-    await state.update_data(msg=msg)
+    await state.update_data(msg_id=call.message.message_id)
     await state.set_state(AddCategory.titles)
 
 
@@ -186,16 +195,15 @@ async def display_delete_categories_menu(
         await call.answer(no_categories_for_delete_error_text(), show_alert=True)
 
 
-@router.callback_query(F.data.startswith('drop_category'))
+@router.callback_query(CategoryCallback.filter(F.action == CategoryAction.DROP))
 async def process_drop_category(
         call: CallbackQuery,
+        callback_data: CategoryCallback,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
         interactor: FromDishka[DeleteCategoryInteractor],
 ):
-    _, category_id = call.data.split(':')
-
     try:
-        categories = await interactor(category_id=category_id)
+        categories = await interactor(category_id=callback_data.category_id)
         await call.answer()
         caption = get_city_for_delete_menu_text()
         keyboard = kb_builder.get_categories_delete_menu_kb(categories=categories)
@@ -232,11 +240,11 @@ async def get_store_title(
         await interactor()
 
         await call.answer()
-        msg = await call.message.edit_caption(
+        await call.message.edit_caption(
             caption=add_store_menu_text(),
             reply_markup=kb_builder.get_stores_menu_return_kb().as_markup(),
         )
-        await state.update_data(msg=msg)
+        await state.update_data(msg_id=call.message.message_id)
         await state.set_state(AddStore.title)
 
     except domain_exceptions.CitiesNotFoundError:
@@ -245,19 +253,19 @@ async def get_store_title(
         await call.answer(no_categories_for_add_store_error_text(), show_alert=True)
 
 
-@router.callback_query(F.data.startswith('choice_city'))
+@router.callback_query(CityCallback.filter(F.action == CityAction.CHOOSE))
 async def process_choice_city(
         call: CallbackQuery,
+        callback_data: CityCallback,
         state: FSMContext,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
+        interactor: FromDishka[GetAllCitiesInteractor],
 ):
-    _, city_id = call.data.split(':')
-    city_id = UUID(city_id)
-
     state_data = await state.get_data()
     chosen_cities = state_data.get('chosen_cities', {})
-    cities = state_data['cities']
+    cities = await interactor()
 
+    city_id = callback_data.city_id
     if city_id in chosen_cities.keys():
         del chosen_cities[city_id]
     else:
@@ -298,22 +306,21 @@ async def get_store_categories(
         ),
         reply_markup=kb_builder.get_categories_choice_menu_kb(categories=categories).as_markup(),
     )
-    await state.update_data(cities=None, categories=categories)
 
 
-@router.callback_query(F.data.startswith('choice_category'))
+@router.callback_query(CategoryCallback.filter(F.action == CategoryAction.CHOOSE))
 async def process_choice_category(
         call: CallbackQuery,
+        callback_data: CategoryCallback,
         state: FSMContext,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
+        interactor: FromDishka[GetAllCategoriesInteractor],
 ):
-    _, category_id = call.data.split(':')
-    category_id = UUID(category_id)
-
     state_data = await state.get_data()
     chosen_categories = state_data.get('chosen_categories', {})
-    categories = state_data['categories']
+    categories = await interactor()
 
+    category_id = callback_data.category_id
     if category_id in chosen_categories.keys():
         del chosen_categories[category_id]
     else:
@@ -353,7 +360,6 @@ async def get_store_main_url(
         ),
         reply_markup=kb_builder.get_stores_menu_return_kb().as_markup(),
     )
-    await state.update_data(categories=None)
     await state.set_state(AddStore.main_url)
 
 
@@ -361,29 +367,32 @@ async def get_store_main_url(
 async def process_save_store(
         call: CallbackQuery,
         state: FSMContext,
-        kb_builder: FromDishka[interfaces.KeyboardBuilder],
-        interactor: FromDishka[SaveStoreInteractor],
+        jobs: FromDishka[interfaces.JobQueue],
+        uuid_generator: FromDishka[interfaces.UUIDGenerator],
 ):
     state_data = await state.get_data()
     await state.clear()
 
-    await interactor(
-        title=state_data['title'],
-        description=state_data['description'],
-        cities=state_data['chosen_cities'].keys(),
-        categories=state_data['chosen_categories'].keys(),
-        main_page_url=state_data['main_url'],
-        resources_url=state_data['resources_url'],
-        preview_media_pc=state_data['preview_media_pc'],
-        preview_media_mobile=state_data['preview_media_mobile'],
-        main_media_pc=state_data['main_media_pc'],
-        main_media_mobile=state_data['main_media_mobile'],
-        display_priority=state_data['display_priority'],
-    )
-    await call.answer(success_store_save_text(), show_alert=True)
-    await call.message.edit_caption(
-        caption=select_action_menu_text(),
-        reply_markup=kb_builder.get_stores_menu_kb().as_markup(),
+    await call.answer()
+    await call.message.edit_caption(caption=store_save_pending_text())
+    await jobs.enqueue(
+        name=SAVE_STORE_JOB,
+        payload={
+            'store_id': uuid_generator(),
+            'chat_id': call.message.chat.id,
+            'msg_id': call.message.message_id,
+            'title': state_data['title'],
+            'description': state_data['description'],
+            'cities': list(state_data['chosen_cities']),
+            'categories': list(state_data['chosen_categories']),
+            'main_url': state_data['main_url'],
+            'resources_url': state_data['resources_url'],
+            'preview_media_pc': state_data['preview_media_pc'],
+            'preview_media_mobile': state_data['preview_media_mobile'],
+            'main_media_pc': state_data['main_media_pc'],
+            'main_media_mobile': state_data['main_media_mobile'],
+            'display_priority': state_data['display_priority'],
+        },
     )
 
 
@@ -430,19 +439,22 @@ async def display_paginate_shops(
     )
 
 
-@router.callback_query(F.data.startswith('store_details'))
+@router.callback_query(StoreCallback.filter(F.action == StoreAction.DETAILS))
 async def display_store_details(
         call: CallbackQuery,
+        callback_data: StoreCallback,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
-        config: FromDishka[Config],
+        media_urls: FromDishka[MediaUrlService],
         interactor: FromDishka[GetStoreDetailsInteractor],
 ):
-    _, store_id = call.data.split(':')
     try:
-        details = await interactor(store_id=store_id)
+        details = await interactor(store_id=callback_data.store_id)
         await call.answer()
         await call.message.edit_caption(
-            caption=store_details_menu_text(details=details, minio_url=config.minio.url, bucket=config.minio.bucket),
+            caption=store_details_menu_text(
+                details=details,
+                media_links=await media_urls.get_links(assets=media_urls.get_store_assets(store=details.store)),
+            ),
             reply_markup=kb_builder.get_store_edit_menu_kb(
                 store_id=details.store.id,
                 display_priority=details.store.display_priority,
@@ -452,190 +464,181 @@ async def display_store_details(
         await call.answer(store_not_found_by_id_error_text(), show_alert=True)
 
 
-@router.callback_query(F.data.startswith('store_cities_menu'))
+@router.callback_query(StoreCallback.filter(F.action == StoreAction.CITIES))
 async def display_store_cities(
         call: CallbackQuery,
-        state: FSMContext,
+        callback_data: StoreCallback,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
         interactor: FromDishka[GetStoreCitiesInteractor],
 ):
-    _, store_id = call.data.split(':')
-    cities = await interactor(store_id=store_id)
+    cities = await interactor(store_id=callback_data.store_id)
 
     await call.message.edit_caption(
         caption=store_city_selection_menu_text(),
-        reply_markup=kb_builder.get_store_cities_menu_kb(store_id=store_id, cities=cities).as_markup(),
+        reply_markup=kb_builder.get_store_cities_menu_kb(store_id=callback_data.store_id, cities=cities).as_markup(),
     )
-    await state.update_data(store_id=store_id)
 
 
-@router.callback_query(F.data.startswith('link_city'))
+@router.callback_query(StoreCityCallback.filter(F.link))
 async def add_store_city(
         call: CallbackQuery,
-        state: FSMContext,
+        callback_data: StoreCityCallback,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
         interactor: FromDishka[AddStoreCityInteractor],
 ):
-    _, city_id = call.data.split(':')
-    state_data = await state.get_data()
-    store_id = state_data['store_id']
-
-    cities = await interactor(store_id=store_id, city_id=city_id)
+    cities = await interactor(store_id=callback_data.store_id, city_id=callback_data.city_id)
 
     await call.message.edit_caption(
         caption=store_city_selection_menu_text(),
-        reply_markup=kb_builder.get_store_cities_menu_kb(store_id=store_id, cities=cities).as_markup(),
+        reply_markup=kb_builder.get_store_cities_menu_kb(store_id=callback_data.store_id, cities=cities).as_markup(),
     )
 
 
-@router.callback_query(F.data.startswith('unlink_city'))
+@router.callback_query(StoreCityCallback.filter(~F.link))
 async def delete_store_city(
         call: CallbackQuery,
-        state: FSMContext,
+        callback_data: StoreCityCallback,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
         interactor: FromDishka[DeleteStoreCityInteractor],
 ):
-    _, city_id = call.data.split(':')
-    state_data = await state.get_data()
-    store_id = state_data['store_id']
-
-    cities = await interactor(store_id=store_id, city_id=city_id)
+    cities = await interactor(store_id=callback_data.store_id, city_id=callback_data.city_id)
 
     await call.message.edit_caption(
         caption=store_city_selection_menu_text(),
-        reply_markup=kb_builder.get_store_cities_menu_kb(store_id=store_id, cities=cities).as_markup(),
+        reply_markup=kb_builder.get_store_cities_menu_kb(store_id=callback_data.store_id, cities=cities).as_markup(),
     )
 
 
-@router.callback_query(F.data.startswith('store_categories_menu'))
+@router.callback_query(StoreCallback.filter(F.action == StoreAction.CATEGORIES))
 async def display_store_categories(
         call: CallbackQuery,
-        state: FSMContext,
+        callback_data: StoreCallback,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
         interactor: FromDishka[GetStoreCategoriesInteractor],
 ):
-    _, store_id = call.data.split(':')
-    categories = await interactor(store_id=store_id)
+    categories = await interactor(store_id=callback_data.store_id)
 
     await call.message.edit_caption(
         caption=store_city_selection_menu_text(),
-        reply_markup=kb_builder.get_store_categories_menu_kb(store_id=store_id, categories=categories).as_markup(),
+        reply_markup=kb_builder.get_store_categories_menu_kb(
+            store_id=callback_data.store_id,
+            categories=categories,
+        ).as_markup(),
     )
-    await state.update_data(store_id=store_id)
 
 
-@router.callback_query(F.data.startswith('link_category'))
+@router.callback_query(StoreCategoryCallback.filter(F.link))
 async def add_store_category(
         call: CallbackQuery,
-        state: FSMContext,
+        callback_data: StoreCategoryCallback,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
         interactor: FromDishka[AddStoreCategoryInteractor],
 ):
-    _, category_id = call.data.split(':')
-    state_data = await state.get_data()
-    store_id = state_data['store_id']
-
-    categories = await interactor(store_id=store_id, category_id=category_id)
+    categories = await interactor(store_id=callback_data.store_id, category_id=callback_data.category_id)
 
     await call.message.edit_caption(
         caption=store_city_selection_menu_text(),
-        reply_markup=kb_builder.get_store_categories_menu_kb(store_id=store_id, categories=categories).as_markup(),
+        reply_markup=kb_builder.get_store_categories_menu_kb(
+            store_id=callback_data.store_id,
+            categories=categories,
+        ).as_markup(),
     )
 
 
-@router.callback_query(F.data.startswith('unlink_category'))
+@router.callback_query(StoreCategoryCallback.filter(~F.link))
 async def delete_store_category(
         call: CallbackQuery,
-        state: FSMContext,
+        callback_data: StoreCategoryCallback,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
         interactor: FromDishka[DeleteStoreCategoryInteractor],
 ):
-    _, category_id = call.data.split(':')
-    state_data = await state.get_data()
-    store_id = state_data['store_id']
-
-    categories = await interactor(store_id=store_id, category_id=category_id)
+    categories = await interactor(store_id=callback_data.store_id, category_id=callback_data.category_id)
 
     await call.message.edit_caption(
         caption=store_city_selection_menu_text(),
-        reply_markup=kb_builder.get_store_categories_menu_kb(store_id=store_id, categories=categories).as_markup(),
+        reply_markup=kb_builder.get_store_categories_menu_kb(
+            store_id=callback_data.store_id,
+            categories=categories,
+        ).as_markup(),
     )
 
 
-@router.callback_query(F.data.startswith('change_store_priority'))
+@router.callback_query(StoreCallback.filter(F.action == StoreAction.PRIORITY))
 async def get_new_store_priority(
         call: CallbackQuery,
+        callback_data: StoreCallback,
         state: FSMContext,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
 ):
-    action, store_id = call.data.split(':')
-    msg = await call.message.edit_caption(
-        caption=get_store_edit_menu_text(action=action),
-        reply_markup=kb_builder.get_store_return_kb(store_id=store_id).as_markup(),
+    await call.message.edit_caption(
+        caption=get_store_edit_menu_text(action='change_store_priority'),
+        reply_markup=kb_builder.get_store_return_kb(store_id=callback_data.store_id).as_markup(),
     )
-    await state.update_data(store_id=store_id, msg=msg)
+    await state.update_data(store_id=callback_data.store_id, msg_id=call.message.message_id)
     await state.set_state(ChangeStore.display_priority)
 
 
-@router.callback_query(F.data.startswith('display_store_description'))
+@router.callback_query(StoreCallback.filter(F.action == StoreAction.DESCRIPTION))
 async def get_new_store_description(
         call: CallbackQuery,
+        callback_data: StoreCallback,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
         interactor: FromDishka[GetStoreInteractor],
 ):
-    _, store_id = call.data.split(':')
     try:
-        store = await interactor(store_id=store_id)
+        store = await interactor(store_id=callback_data.store_id)
         await call.message.answer(text=store.description)
     except domain_exceptions.StoreNotFoundByIdError:
         await call.answer(store_not_found_by_id_error_text(), show_alert=True)
 
 
-@router.callback_query(F.data.startswith('change_store_description'))
+@router.callback_query(StoreCallback.filter(F.action == StoreAction.CHANGE_DESCRIPTION))
 async def get_new_store_description(
         call: CallbackQuery,
+        callback_data: StoreCallback,
         state: FSMContext,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
 ):
-    action, store_id = call.data.split(':')
-    msg = await call.message.edit_caption(
-        caption=get_store_edit_menu_text(action=action),
-        reply_markup=kb_builder.get_store_return_kb(store_id=store_id).as_markup(),
+    await call.message.edit_caption(
+        caption=get_store_edit_menu_text(action='change_store_description'),
+        reply_markup=kb_builder.get_store_return_kb(store_id=callback_data.store_id).as_markup(),
     )
-    await state.update_data(store_id=store_id, msg=msg)
+    await state.update_data(store_id=callback_data.store_id, msg_id=call.message.message_id)
     await state.set_state(ChangeStore.description)
 
 
-@router.callback_query(F.data.startswith('change_store_title'))
+@router.callback_query(StoreCallback.filter(F.action == StoreAction.TITLE))
 async def get_new_store_title(
         call: CallbackQuery,
+        callback_data: StoreCallback,
         state: FSMContext,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
 ):
-    action, store_id = call.data.split(':')
-    msg = await call.message.edit_caption(
-        caption=get_store_edit_menu_text(action=action),
-        reply_markup=kb_builder.get_store_return_kb(store_id=store_id).as_markup(),
+    await call.message.edit_caption(
+        caption=get_store_edit_menu_text(action='change_store_title'),
+        reply_markup=kb_builder.get_store_return_kb(store_id=callback_data.store_id).as_markup(),
     )
-    await state.update_data(store_id=store_id, msg=msg)
+    await state.update_data(store_id=callback_data.store_id, msg_id=call.message.message_id)
     await state.set_state(ChangeStore.title)
 
 
-@router.callback_query(F.data.startswith('store_recources_menu'))
+@router.callback_query(StoreCallback.filter(F.action == StoreAction.RESOURCES))
 async def display_store_resources_menu(
         call: CallbackQuery,
+        callback_data: StoreCallback,
         state: FSMContext,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
         interactor: FromDishka[GetStoreResourcesInteractor],
 ):
-    action, store_id = call.data.split(':')
-
-    rosources = await interactor(store_id=store_id)
+    rosources = await interactor(store_id=callback_data.store_id)
     await call.message.edit_caption(
-        caption=get_store_edit_menu_text(action=action),
-        reply_markup=kb_builder.store_resources_menu_kb(store_id=store_id, resources=rosources).as_markup(),
+        caption=get_store_edit_menu_text(action='store_recources_menu'),
+        reply_markup=kb_builder.store_resources_menu_kb(
+            store_id=callback_data.store_id,
+            resources=rosources,
+        ).as_markup(),
     )
-    await state.update_data(store_id=store_id, action=action)
+    await state.update_data(store_id=callback_data.store_id, action='store_recources_menu')
 
 
 @router.callback_query(F.data == 'add_store_resources')
@@ -646,78 +649,74 @@ async def get_new_store_resources(
 ):
     await call.answer()
     state_data = await state.get_data()
-    msg = await call.message.edit_caption(
+    await call.message.edit_caption(
         caption=get_store_edit_menu_text(action=call.data),
         reply_markup=kb_builder.get_store_resources_return_menu_kb(store_id=state_data['store_id']).as_markup(),
     )
-    await state.update_data(msg=msg)
+    await state.update_data(msg_id=call.message.message_id)
     await state.set_state(ChangeStore.resources_url)
 
 
-@router.callback_query(F.data.startswith('drop_resource'))
+@router.callback_query(StoreResourceCallback.filter())
 async def process_resource_drop(
         call: CallbackQuery,
-        state: FSMContext,
+        callback_data: StoreResourceCallback,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
         interactor: FromDishka[DeleteStoreResourceInteractor],
 ):
     await call.answer()
-    _, resource_id = call.data.split(':')
-    rosources = await interactor(resource_id=resource_id)
-    state_data = await state.get_data()
+    rosources = await interactor(resource_id=callback_data.resource_id)
 
     await call.message.edit_caption(
-        caption=get_store_edit_menu_text(action=state_data['action']),
+        caption=get_store_edit_menu_text(action='store_recources_menu'),
         reply_markup=kb_builder.store_resources_menu_kb(
-            store_id=state_data['store_id'],
+            store_id=callback_data.store_id,
             resources=rosources,
         ).as_markup(),
     )
 
 
-@router.callback_query(F.data.startswith('change_store_main_page_url'))
+@router.callback_query(StoreCallback.filter(F.action == StoreAction.MAIN_PAGE_URL))
 async def get_new_store_main_page_url(
         call: CallbackQuery,
+        callback_data: StoreCallback,
         state: FSMContext,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
 ):
-    action, store_id = call.data.split(':')
-    msg = await call.message.edit_caption(
-        caption=get_store_edit_menu_text(action=action),
-        reply_markup=kb_builder.get_store_return_kb(store_id=store_id).as_markup(),
+    await call.message.edit_caption(
+        caption=get_store_edit_menu_text(action='change_store_main_page_url'),
+        reply_markup=kb_builder.get_store_return_kb(store_id=callback_data.store_id).as_markup(),
     )
-    await state.update_data(store_id=store_id, msg=msg)
+    await state.update_data(store_id=callback_data.store_id, msg_id=call.message.message_id)
     await state.set_state(ChangeStore.main_page_url)
 
 
-@router.callback_query(F.data.startswith('change_preview_media_menu'))
+@router.callback_query(StoreCallback.filter(F.action == StoreAction.PREVIEW_MEDIA))
 async def display_preview_media_menu(
         call: CallbackQuery,
+        callback_data: StoreCallback,
         state: FSMContext,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
 ):
-    _, store_id = call.data.split(':')
-
     await call.message.edit_caption(
         caption=select_action_menu_text(),
-        reply_markup=kb_builder.get_change_preview_media_menu_kb(store_id=store_id).as_markup(),
+        reply_markup=kb_builder.get_change_preview_media_menu_kb(store_id=callback_data.store_id).as_markup(),
     )
-    await state.update_data(store_id=store_id)
+    await state.update_data(store_id=callback_data.store_id)
 
 
-@router.callback_query(F.data.startswith('change_main_media_menu'))
+@router.callback_query(StoreCallback.filter(F.action == StoreAction.MAIN_MEDIA))
 async def display_main_media_menu(
         call: CallbackQuery,
+        callback_data: StoreCallback,
         state: FSMContext,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
 ):
-    _, store_id = call.data.split(':')
-
     await call.message.edit_caption(
         caption=select_action_menu_text(),
-        reply_markup=kb_builder.get_change_preview_media_menu_kb(store_id=store_id).as_markup(),
+        reply_markup=kb_builder.get_change_preview_media_menu_kb(store_id=callback_data.store_id).as_markup(),
     )
-    await state.update_data(store_id=store_id)
+    await state.update_data(store_id=callback_data.store_id)
 
 
 @router.callback_query(F.data == 'change_media_preview_pc')
@@ -728,12 +727,12 @@ async def get_new_preview_media_pc(
 ):
     await call.answer()
     state_data = await state.get_data()
-    msg = await call.message.edit_caption(
+    await call.message.edit_caption(
         caption=get_store_edit_menu_text(action=call.data),
         reply_markup=kb_builder.get_store_return_kb(store_id=state_data['store_id']).as_markup(),
     )
 
-    await state.update_data(msg=msg)
+    await state.update_data(msg_id=call.message.message_id)
     await state.set_state(ChangeStore.preview_media_pc)
 
 
@@ -745,12 +744,12 @@ async def get_new_preview_media_mobile(
 ):
     await call.answer()
     state_data = await state.get_data()
-    msg = await call.message.edit_caption(
+    await call.message.edit_caption(
         caption=get_store_edit_menu_text(action=call.data),
         reply_markup=kb_builder.get_store_return_kb(store_id=state_data['store_id']).as_markup(),
     )
 
-    await state.update_data(msg=msg)
+    await state.update_data(msg_id=call.message.message_id)
     await state.set_state(ChangeStore.preview_media_mobile)
 
 
@@ -762,12 +761,12 @@ async def get_new_main_media_pc(
 ):
     await call.answer()
     state_data = await state.get_data()
-    msg = await call.message.edit_caption(
+    await call.message.edit_caption(
         caption=get_store_edit_menu_text(action=call.data),
         reply_markup=kb_builder.get_store_return_kb(store_id=state_data['store_id']).as_markup(),
     )
 
-    await state.update_data(msg=msg)
+    await state.update_data(msg_id=call.message.message_id)
     await state.set_state(ChangeStore.main_media_pc)
 
 
@@ -779,28 +778,28 @@ async def get_new_main_media_mobile(
 ):
     await call.answer()
     state_data = await state.get_data()
-    msg = await call.message.edit_caption(
+    await call.message.edit_caption(
         caption=get_store_edit_menu_text(action=call.data),
         reply_markup=kb_builder.get_store_return_kb(store_id=state_data['store_id']).as_markup(),
     )
 
-    await state.update_data(msg=msg)
+    await state.update_data(msg_id=call.message.message_id)
     await state.set_state(ChangeStore.main_media_mobile)
 
 
-@router.callback_query(F.data.startswith('drop_store'))
+@router.callback_query(StoreCallback.filter(F.action == StoreAction.DROP))
 async def proccess_drop_store(
         call: CallbackQuery,
+        callback_data: StoreCallback,
         state: FSMContext,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
         interactor: FromDishka[DeleteStoreInteractor],
 ):
     await call.answer()
-    _, store_id = call.data.split(':')
     try:
         state_data = await state.get_data()
         page = 1
-        stores = await interactor(store_id=store_id, page=page, page_size=state_data['page_size'])
+        stores = await interactor(store_id=callback_data.store_id, page=page, page_size=state_data['page_size'])
         total_pages = (stores.total + state_data['page_size'] - 1) // state_data['page_size']
 
         caption = choice_store_for_edit_menu_text()
@@ -834,11 +833,11 @@ async def get_banner_target_url(
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
 ):
     await call.answer()
-    msg = await call.message.edit_caption(
+    await call.message.edit_caption(
         caption=add_banner_menu_text(),
         reply_markup=kb_builder.get_banners_return_menu_kb().as_markup(),
     )
-    await state.update_data(msg=msg)
+    await state.update_data(msg_id=call.message.message_id)
     await state.set_state(AddBanner.target_url)
 
 
@@ -846,23 +845,25 @@ async def get_banner_target_url(
 async def process_save_banner(
         call: CallbackQuery,
         state: FSMContext,
-        kb_builder: FromDishka[interfaces.KeyboardBuilder],
-        interactor: FromDishka[SaveBannerInteractor],
+        jobs: FromDishka[interfaces.JobQueue],
+        uuid_generator: FromDishka[interfaces.UUIDGenerator],
 ):
     state_data = await state.get_data()
     await state.clear()
 
-    await interactor(
-        target_url=state_data['target_url'],
-        pc_media=state_data['pc_media'],
-        mobile_media=state_data['mobile_media'],
-        display_priority=state_data['display_priority']
-    )
-
-    await call.answer(success_banner_save_text(), show_alert=True)
-    await call.message.edit_caption(
-        caption=select_action_menu_text(),
-        reply_markup=kb_builder.get_banners_menu_kb().as_markup(),
+    await call.answer()
+    await call.message.edit_caption(caption=banner_save_pending_text())
+    await jobs.enqueue(
+        name=SAVE_BANNER_JOB,
+        payload={
+            'banner_id': uuid_generator(),
+            'chat_id': call.message.chat.id,
+            'msg_id': call.message.message_id,
+            'target_url': state_data['target_url'],
+            'pc_media': state_data['pc_media'],
+            'mobile_media': state_data['mobile_media'],
+            'display_priority': state_data['display_priority'],
+        },
     )
 
 
@@ -883,105 +884,113 @@ async def display_banners_for_edit(
         await call.answer(no_baners_for_edit_error_text(), show_alert=True)
 
 
-@router.callback_query(F.data.startswith('banner_details'))
+@router.callback_query(BannerCallback.filter(F.action == BannerAction.DETAILS))
 async def display_banner_details(
         call: CallbackQuery,
+        callback_data: BannerCallback,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
         interactor: FromDishka[GetBannerInteractor],
-        config: FromDishka[Config],
+        media_urls: FromDishka[MediaUrlService],
 ):
-    _, banner_id = call.data.split(':')
     try:
-        banner = await interactor(banner_id=banner_id)
+        banner = await interactor(banner_id=callback_data.banner_id)
         await call.answer()
         await call.message.edit_caption(
-            caption=banner_details_text(banner=banner, minio_url=config.minio.url, bucket=config.minio.bucket),
-            reply_markup=kb_builder.get_banner_edit_menu_kb(banner_id=banner_id, display_priority=banner.display_priority).as_markup(),
+            caption=banner_details_text(
+                banner=banner,
+                media_links=await media_urls.get_links(assets=media_urls.get_banner_assets(banner=banner)),
+            ),
+            reply_markup=kb_builder.get_banner_edit_menu_kb(
+                banner_id=banner.id,
+                display_priority=banner.display_priority,
+            ).as_markup(),
         )
     except domain_exceptions.BannerNotFoundByIdError:
         pass
 
 
-@router.callback_query(F.data.startswith('change_banner_url'))
+@router.callback_query(BannerCallback.filter(F.action == BannerAction.URL))
 async def get_new_banner_url(
         call: CallbackQuery,
+        callback_data: BannerCallback,
         state: FSMContext,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
 ):
     await call.answer()
 
-    action, banner_id = call.data.split(':')
-    msg = await call.message.edit_caption(
-        caption=get_banner_edit_menu_text(action=action),
-        reply_markup=kb_builder.get_banner_return_kb(banner_id=banner_id).as_markup(),
+    await call.message.edit_caption(
+        caption=get_banner_edit_menu_text(action='change_banner_url'),
+        reply_markup=kb_builder.get_banner_return_kb(banner_id=callback_data.banner_id).as_markup(),
     )
 
-    await state.update_data(msg=msg, banner_id=banner_id)
+    await state.update_data(msg_id=call.message.message_id, banner_id=callback_data.banner_id)
     await state.set_state(ChangeBanner.target_url)
 
 
-@router.callback_query(F.data.startswith('change_banner_pc'))
+@router.callback_query(BannerCallback.filter(F.action == BannerAction.PC))
 async def get_new_pc_banner(
         call: CallbackQuery,
+        callback_data: BannerCallback,
         state: FSMContext,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
 ):
     await call.answer()
 
-    action, banner_id = call.data.split(':')
-    msg = await call.message.edit_caption(
-        caption=get_banner_edit_menu_text(action=action),
-        reply_markup=kb_builder.get_banner_return_kb(banner_id=banner_id).as_markup(),
+    await call.message.edit_caption(
+        caption=get_banner_edit_menu_text(action='change_banner_pc'),
+        reply_markup=kb_builder.get_banner_return_kb(banner_id=callback_data.banner_id).as_markup(),
     )
 
-    await state.update_data(msg=msg, banner_id=banner_id)
+    await state.update_data(msg_id=call.message.message_id, banner_id=callback_data.banner_id)
     await state.set_state(ChangeBanner.pc_media)
 
 
-@router.callback_query(F.data.startswith('change_banner_mobile'))
+@router.callback_query(BannerCallback.filter(F.action == BannerAction.MOBILE))
 async def get_new_mobile_banner(
         call: CallbackQuery,
+        callback_data: BannerCallback,
         state: FSMContext,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
 ):
     await call.answer()
 
-    action, banner_id = call.data.split(':')
-    msg = await call.message.edit_caption(
-        caption=get_banner_edit_menu_text(action=action),
-        reply_markup=kb_builder.get_banner_return_kb(banner_id=banner_id).as_markup(),
+    await call.message.edit_caption(
+        caption=get_banner_edit_menu_text(action='change_banner_mobile'),
+        reply_markup=kb_builder.get_banner_return_kb(banner_id=callback_data.banner_id).as_markup(),
     )
 
-    await state.update_data(msg=msg, banner_id=banner_id)
+    await state.update_data(msg_id=call.message.message_id, banner_id=callback_data.banner_id)
     await state.set_state(ChangeBanner.mobile_media)
 
 
-@router.callback_query(F.data.startswith('change_banner_priority'))
+@router.callback_query(BannerCallback.filter(F.action == BannerAction.PRIORITY))
 async def get_new_display_priority_banner(
         call: CallbackQuery,
+        callback_data: BannerCallback,
         state: FSMContext,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
 ):
     await call.answer()
-    action, banner_id = call.data.split(':')
 
-    msg = await call.message.edit_caption(caption=get_banner_edit_menu_text(action=action),
-                                          reply_markup=kb_builder.get_banner_return_kb(banner_id=banner_id).as_markup(), )
-    await state.update_data(msg=msg, banner_id=banner_id)
+    await call.message.edit_caption(
+        caption=get_banner_edit_menu_text(action='change_banner_priority'),
+        reply_markup=kb_builder.get_banner_return_kb(banner_id=callback_data.banner_id).as_markup(),
+    )
+    await state.update_data(msg_id=call.message.message_id, banner_id=callback_data.banner_id)
     await state.set_state(ChangeBanner.display_priority)
 
 
-@router.callback_query(F.data.startswith('drop_banner'))
+@router.callback_query(BannerCallback.filter(F.action == BannerAction.DROP))
 async def proccess_drop_banner(
         call: CallbackQuery,
+        callback_data: BannerCallback,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
         interactor: FromDishka[DeleteBannerInteractor],
 ):
     await call.answer()
-    _, banner_id = call.data.split(':')
 
     try:
-        banners = await interactor(banner_id=banner_id)
+        banners = await interactor(banner_id=callback_data.banner_id)
         caption = choice_banner_for_edit_menu_text()
         keyboard = kb_builder.get_banners_choice_menu(banners=banners)
     except domain_exceptions.BannersNotFoundError:
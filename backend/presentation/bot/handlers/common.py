@@ -1,11 +1,14 @@
+from functools import partial
+
 from aiogram import Router
 from aiogram.filters.command import CommandStart
-from aiogram.types import FSInputFile, Message
+from aiogram.types import Message
 from dishka.integrations.aiogram import FromDishka
 
 from backend.application import interfaces
 from backend.config import Config
 from backend.domain.templates.menu_texts import main_menu_text
+from backend.infrastructure.services.bot.media.file_id_cache import FileIdCache
 
 router = Router()
 
@@ -15,12 +18,14 @@ async def process_bot_launch(
     message: Message,
     config: FromDishka[Config],
     kb_builder: FromDishka[interfaces.KeyboardBuilder],
+    file_ids: FromDishka[FileIdCache],
 ):
-    await message.answer_photo(
-        photo=FSInputFile(
-            path=config.banner.file_path,
-            filename='banner.jpg',
+    await file_ids.send_photo(
+        send=partial(
+            message.answer_photo,
+            caption=main_menu_text(),
+            reply_markup=kb_builder.get_main_menu_kb().as_markup(),
         ),
-        caption=main_menu_text(),
-        reply_markup=kb_builder.get_main_menu_kb().as_markup(),
+        path=config.banner.file_path,
+        filename='banner.jpg',
     )
@@ -4,36 +4,33 @@ from aiogram.types import Message
 from dishka.integrations.aiogram import FromDishka
 
 from backend.application import interfaces
+from backend.application.services.media import MediaUrlService
 from backend.application.use_cases.banner import (
+    UpdateBannerDisplayPriorityInteractor,
     UpdateBannerUrlInteractor,
-    UpdateMobileBannerInteractor,
-    UpdatePcBannerInteractor,
-    UpdateBannerDisplayPriorityInteractor
 )
 from backend.application.use_cases.category import SaveCategoriesInteractor
 from backend.application.use_cases.city import GetAllCitiesInteractor, SaveCitiesInteractor
 from backend.application.use_cases.store import (
     UpdateStoreDescriptionInteractor,
     UpdateStoreDisplayPriorityInteractor,
-    UpdateStoreMainMediaMobileInteractor,
-    UpdateStoreMainMediaPcInteractor,
     UpdateStoreMainPageUrlInteractor,
-    UpdateStorePrevieMediaMobileInteractor,
-    UpdateStorePrevieMediaPcInteractor,
     UpdateStoreTitleInteractor,
 )
 from backend.application.use_cases.store_resource import AddStoreResourcesInteractor
-from backend.config import Config
+from backend.domain.entities.media import BannerMediaName, StoreMediaName
 from backend.domain.templates.menu_texts import (
     add_banner_menu_text,
     add_store_menu_text,
     banner_details_text,
     get_store_edit_menu_text,
+    media_upload_pending_text,
     select_action_menu_text,
     store_details_menu_text,
 )
 from backend.infrastructure import exceptions as infra_exceptions
 from backend.infrastructure.services.bot.media.media_service import MediaService
+from backend.presentation.bot.jobs import UPDATE_BANNER_MEDIA_JOB, UPDATE_STORE_MEDIA_JOB
 from backend.presentation.bot.states.user import AddBanner, AddCategory, AddCity, AddStore, ChangeBanner, ChangeStore
 
 router = Router()
@@ -51,7 +48,9 @@ async def process_save_cities(
 
     state_data = await state.get_data()
     await state.clear()
-    await state_data['msg'].edit_caption(
+    await message.bot.edit_message_caption(
+        chat_id=message.chat.id,
+        message_id=state_data['msg_id'],
         caption=select_action_menu_text(),
         reply_markup=kb_builder.get_cities_menu_kb().as_markup(),
     )
@@ -69,7 +68,9 @@ async def process_save_categories(
 
     state_data = await state.get_data()
     await state.clear()
-    await state_data['msg'].edit_caption(
+    await message.bot.edit_message_caption(
+        chat_id=message.chat.id,
+        message_id=state_data['msg_id'],
         caption=select_action_menu_text(),
         reply_markup=kb_builder.get_categories_menu_kb().as_markup(),
     )
@@ -85,7 +86,9 @@ async def get_store_description(
     if len(message.text) <= 64:
         state_data = await state.get_data()
 
-        await state_data['msg'].edit_caption(
+        await message.bot.edit_message_caption(
+            chat_id=message.chat.id,
+            message_id=state_data['msg_id'],
             caption=add_store_menu_text(
                 title=message.text,
                 step_iteration=2,
@@ -110,7 +113,9 @@ async def get_store_cities(
 
         cities = await interactor()
 
-        await state_data['msg'].edit_caption(
+        await message.bot.edit_message_caption(
+            chat_id=message.chat.id,
+            message_id=state_data['msg_id'],
             caption=add_store_menu_text(
                 title=state_data['title'],
                 description=message.text,
@@ -119,7 +124,7 @@ async def get_store_cities(
             reply_markup=kb_builder.get_cities_choice_menu_kb(cities=cities).as_markup(),
         )
 
-        await state.update_data(description=message.text, cities=cities)
+        await state.update_data(description=message.text)
 
 
 @router.message(AddStore.main_url)
@@ -131,7 +136,9 @@ async def get_store_recources_url(
     await message.delete()
     if 'http' in message.text and len(message.text) <= 512:
         state_data = await state.get_data()
-        await state_data['msg'].edit_caption(
+        await message.bot.edit_message_caption(
+            chat_id=message.chat.id,
+            message_id=state_data['msg_id'],
             caption=add_store_menu_text(
                 title=state_data['title'],
                 description=state_data['description'],
@@ -165,7 +172,9 @@ async def get_store_previe_media_pc(
             return
 
     state_data = await state.get_data()
-    await state_data['msg'].edit_caption(
+    await message.bot.edit_message_caption(
+        chat_id=message.chat.id,
+        message_id=state_data['msg_id'],
         caption=add_store_menu_text(
             title=state_data['title'],
             description=state_data['description'],
@@ -191,10 +200,12 @@ async def get_store_previe_media_mobile(
     await message.delete()
 
     try:
-        media = await media_service.download_media(message=message)
+        media = media_service.get_source(message=message)
 
         state_data = await state.get_data()
-        await state_data['msg'].edit_caption(
+        await message.bot.edit_message_caption(
+            chat_id=message.chat.id,
+            message_id=state_data['msg_id'],
             caption=add_store_menu_text(
                 title=state_data['title'],
                 description=state_data['description'],
@@ -224,10 +235,12 @@ async def get_store_main_media_pc(
     await message.delete()
 
     try:
-        media = await media_service.download_media(message=message)
+        media = media_service.get_source(message=message)
 
         state_data = await state.get_data()
-        await state_data['msg'].edit_caption(
+        await message.bot.edit_message_caption(
+            chat_id=message.chat.id,
+            message_id=state_data['msg_id'],
             caption=add_store_menu_text(
                 title=state_data['title'],
                 description=state_data['description'],
@@ -258,10 +271,12 @@ async def get_store_main_media_mobile(
     await message.delete()
 
     try:
-        media = await media_service.download_media(message=message)
+        media = media_service.get_source(message=message)
 
         state_data = await state.get_data()
-        await state_data['msg'].edit_caption(
+        await message.bot.edit_message_caption(
+            chat_id=message.chat.id,
+            message_id=state_data['msg_id'],
             caption=add_store_menu_text(
                 title=state_data['title'],
                 description=state_data['description'],
@@ -293,10 +308,12 @@ async def get_save_action(
     await message.delete()
 
     try:
-        media = await media_service.download_media(message=message)
+        media = media_service.get_source(message=message)
 
         state_data = await state.get_data()
-        await state_data['msg'].edit_caption(
+        await message.bot.edit_message_caption(
+            chat_id=message.chat.id,
+            message_id=state_data['msg_id'],
             caption=add_store_menu_text(
                 title=state_data['title'],
                 description=state_data['description'],
@@ -330,7 +347,9 @@ async def get_save_action(
         display_priority = int(message.text)
 
         state_data = await state.get_data()
-        await state_data['msg'].edit_caption(
+        await message.bot.edit_message_caption(
+            chat_id=message.chat.id,
+            message_id=state_data['msg_id'],
             caption=add_store_menu_text(
                 title=state_data['title'],
                 description=state_data['description'],
@@ -356,7 +375,7 @@ async def process_update_store_display_priority(
         state: FSMContext,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
         interactor: FromDishka[UpdateStoreDisplayPriorityInteractor],
-        config: FromDishka[Config],
+        media_urls: FromDishka[MediaUrlService],
 ):
     await message.delete()
     if message.text.isdigit():
@@ -366,8 +385,13 @@ async def process_update_store_display_priority(
         display_priority = int(message.text)
         details = await interactor(store_id=state_data['store_id'], display_priority=display_priority)
 
-        await state_data['msg'].edit_caption(
-            caption=store_details_menu_text(details=details, minio_url=config.minio.url, bucket=config.minio.bucket),
+        await message.bot.edit_message_caption(
+            chat_id=message.chat.id,
+            message_id=state_data['msg_id'],
+            caption=store_details_menu_text(
+                details=details,
+                media_links=await media_urls.get_links(assets=media_urls.get_store_assets(store=details.store)),
+            ),
             reply_markup=kb_builder.get_store_edit_menu_kb(
                 store_id=details.store.id,
                 display_priority=details.store.display_priority,
@@ -381,7 +405,7 @@ async def process_update_store_description(
         state: FSMContext,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
         interactor: FromDishka[UpdateStoreDescriptionInteractor],
-        config: FromDishka[Config],
+        media_urls: FromDishka[MediaUrlService],
 ):
     await message.delete()
     if len(message.text) <= 4096:
@@ -390,8 +414,13 @@ async def process_update_store_description(
 
         details = await interactor(store_id=state_data['store_id'], description=message.text)
 
-        await state_data['msg'].edit_caption(
-            caption=store_details_menu_text(details=details, minio_url=config.minio.url, bucket=config.minio.bucket),
+        await message.bot.edit_message_caption(
+            chat_id=message.chat.id,
+            message_id=state_data['msg_id'],
+            caption=store_details_menu_text(
+                details=details,
+                media_links=await media_urls.get_links(assets=media_urls.get_store_assets(store=details.store)),
+            ),
             reply_markup=kb_builder.get_store_edit_menu_kb(
                 store_id=details.store.id,
                 display_priority=details.store.display_priority,
@@ -405,7 +434,7 @@ async def process_update_story_title(
         state: FSMContext,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
         interactor: FromDishka[UpdateStoreTitleInteractor],
-        config: FromDishka[Config],
+        media_urls: FromDishka[MediaUrlService],
 ):
     await message.delete()
     if len(message.text) <= 64:
@@ -414,8 +443,13 @@ async def process_update_story_title(
 
         details = await interactor(store_id=state_data['store_id'], title=message.text)
 
-        await state_data['msg'].edit_caption(
-            caption=store_details_menu_text(details=details, minio_url=config.minio.url, bucket=config.minio.bucket),
+        await message.bot.edit_message_caption(
+            chat_id=message.chat.id,
+            message_id=state_data['msg_id'],
+            caption=store_details_menu_text(
+                details=details,
+                media_links=await media_urls.get_links(assets=media_urls.get_store_assets(store=details.store)),
+            ),
             reply_markup=kb_builder.get_store_edit_menu_kb(
                 store_id=details.store.id,
                 display_priority=details.store.display_priority,
@@ -429,7 +463,7 @@ async def process_update_store_main_page(
         state: FSMContext,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
         interactor: FromDishka[UpdateStoreMainPageUrlInteractor],
-        config: FromDishka[Config],
+        media_urls: FromDishka[MediaUrlService],
 ):
     await message.delete()
     if 'http' in message.text and len(message.text) <= 512:
@@ -438,8 +472,13 @@ async def process_update_store_main_page(
 
         details = await interactor(store_id=state_data['store_id'], main_page_url=message.text)
 
-        await state_data['msg'].edit_caption(
-            caption=store_details_menu_text(details=details, minio_url=config.minio.url, bucket=config.minio.bucket),
+        await message.bot.edit_message_caption(
+            chat_id=message.chat.id,
+            message_id=state_data['msg_id'],
+            caption=store_details_menu_text(
+                details=details,
+                media_links=await media_urls.get_links(assets=media_urls.get_store_assets(store=details.store)),
+            ),
             reply_markup=kb_builder.get_store_edit_menu_kb(
                 store_id=details.store.id,
                 display_priority=details.store.display_priority,
@@ -469,7 +508,9 @@ async def process_add_store_recources(
 
     rosources = await interactor(resources_url=message.text, store_id=state_data['store_id'])
 
-    await state_data['msg'].edit_caption(
+    await message.bot.edit_message_caption(
+        chat_id=message.chat.id,
+        message_id=state_data['msg_id'],
         caption=get_store_edit_menu_text(action=state_data['action']),
         reply_markup=kb_builder.store_resources_menu_kb(
             store_id=state_data['store_id'],
@@ -482,25 +523,32 @@ async def process_add_store_recources(
 async def process_update_preview_media_pc(
         message: Message,
         state: FSMContext,
-        kb_builder: FromDishka[interfaces.KeyboardBuilder],
         media_service: FromDishka[MediaService],
-        interactor: FromDishka[UpdateStorePrevieMediaPcInteractor],
-        config: FromDishka[Config],
+        jobs: FromDishka[interfaces.JobQueue],
 ):
     await message.delete()
 
     try:
-        media = await media_service.download_media(message=message)
+        source = media_service.get_source(message=message)
         state_data = await state.get_data()
         await state.clear()
 
-        details = await interactor(store_id=state_data['store_id'], media=media)
-        await state_data['msg'].edit_caption(
-            caption=store_details_menu_text(details=details, minio_url=config.minio.url, bucket=config.minio.bucket),
-            reply_markup=kb_builder.get_store_edit_menu_kb(
-                store_id=details.store.id,
-                display_priority=details.store.display_priority,
-            ).as_markup(),
+        await message.bot.edit_message_caption(
+            chat_id=message.chat.id,
+            message_id=state_data['msg_id'],
+            caption=media_upload_pending_text(),
+        )
+        await jobs.enqueue(
+            name=UPDATE_STORE_MEDIA_JOB,
+            payload={
+                'chat_id': message.chat.id,
+                'msg_id': state_data['msg_id'],
+                'store_id': state_data['store_id'],
+                'media_name': StoreMediaName.PC_PREVIEW,
+                'file_id': source.file_id,
+                'source_id': source.source_id,
+                'extension': source.extension,
+            },
         )
     except infra_exceptions.InvalidMediaContentTypeError:
         pass
@@ -510,25 +558,32 @@ async def process_update_preview_media_pc(
 async def process_update_preview_media_mobile(
         message: Message,
         state: FSMContext,
-        kb_builder: FromDishka[interfaces.KeyboardBuilder],
         media_service: FromDishka[MediaService],
-        interactor: FromDishka[UpdateStorePrevieMediaMobileInteractor],
-        config: FromDishka[Config],
+        jobs: FromDishka[interfaces.JobQueue],
 ):
     await message.delete()
 
     try:
-        media = await media_service.download_media(message=message)
+        source = media_service.get_source(message=message)
         state_data = await state.get_data()
         await state.clear()
 
-        details = await interactor(store_id=state_data['store_id'], media=media)
-        await state_data['msg'].edit_caption(
-            caption=store_details_menu_text(details=details, minio_url=config.minio.url, bucket=config.minio.bucket),
-            reply_markup=kb_builder.get_store_edit_menu_kb(
-                store_id=details.store.id,
-                display_priority=details.store.display_priority,
-            ).as_markup(),
+        await message.bot.edit_message_caption(
+            chat_id=message.chat.id,
+            message_id=state_data['msg_id'],
+            caption=media_upload_pending_text(),
+        )
+        await jobs.enqueue(
+            name=UPDATE_STORE_MEDIA_JOB,
+            payload={
+                'chat_id': message.chat.id,
+                'msg_id': state_data['msg_id'],
+                'store_id': state_data['store_id'],
+                'media_name': StoreMediaName.MOBILE_PREVIEW,
+                'file_id': source.file_id,
+                'source_id': source.source_id,
+                'extension': source.extension,
+            },
         )
     except infra_exceptions.InvalidMediaContentTypeError:
         pass
@@ -538,25 +593,32 @@ async def process_update_preview_media_mobile(
 async def process_update_main_media_pc(
         message: Message,
         state: FSMContext,
-        kb_builder: FromDishka[interfaces.KeyboardBuilder],
         media_service: FromDishka[MediaService],
-        interactor: FromDishka[UpdateStoreMainMediaPcInteractor],
-        config: FromDishka[Config],
+        jobs: FromDishka[interfaces.JobQueue],
 ):
     await message.delete()
 
     try:
-        media = await media_service.download_media(message=message)
+        source = media_service.get_source(message=message)
         state_data = await state.get_data()
         await state.clear()
 
-        details = await interactor(store_id=state_data['store_id'], media=media)
-        await state_data['msg'].edit_caption(
-            caption=store_details_menu_text(details=details, minio_url=config.minio.url, bucket=config.minio.bucket),
-            reply_markup=kb_builder.get_store_edit_menu_kb(
-                store_id=details.store.id,
-                display_priority=details.store.display_priority,
-            ).as_markup(),
+        await message.bot.edit_message_caption(
+            chat_id=message.chat.id,
+            message_id=state_data['msg_id'],
+            caption=media_upload_pending_text(),
+        )
+        await jobs.enqueue(
+            name=UPDATE_STORE_MEDIA_JOB,
+            payload={
+                'chat_id': message.chat.id,
+                'msg_id': state_data['msg_id'],
+                'store_id': state_data['store_id'],
+                'media_name': StoreMediaName.PC_MAIN,
+                'file_id': source.file_id,
+                'source_id': source.source_id,
+                'extension': source.extension,
+            },
         )
     except infra_exceptions.InvalidMediaContentTypeError:
         pass
@@ -566,25 +628,32 @@ async def process_update_main_media_pc(
 async def process_update_main_media_pc(
         message: Message,
         state: FSMContext,
-        kb_builder: FromDishka[interfaces.KeyboardBuilder],
         media_service: FromDishka[MediaService],
-        interactor: FromDishka[UpdateStoreMainMediaMobileInteractor],
-        config: FromDishka[Config],
+        jobs: FromDishka[interfaces.JobQueue],
 ):
     await message.delete()
 
     try:
-        media = await media_service.download_media(message=message)
+        source = media_service.get_source(message=message)
         state_data = await state.get_data()
         await state.clear()
 
-        details = await interactor(store_id=state_data['store_id'], media=media)
-        await state_data['msg'].edit_caption(
-            caption=store_details_menu_text(details=details, minio_url=config.minio.url, bucket=config.minio.bucket),
-            reply_markup=kb_builder.get_store_edit_menu_kb(
-                store_id=details.store.id,
-                display_priority=details.store.display_priority,
-            ).as_markup(),
+        await message.bot.edit_message_caption(
+            chat_id=message.chat.id,
+            message_id=state_data['msg_id'],
+            caption=media_upload_pending_text(),
+        )
+        await jobs.enqueue(
+            name=UPDATE_STORE_MEDIA_JOB,
+            payload={
+                'chat_id': message.chat.id,
+                'msg_id': state_data['msg_id'],
+                'store_id': state_data['store_id'],
+                'media_name': StoreMediaName.MOBILE_MAIN,
+                'file_id': source.file_id,
+                'source_id': source.source_id,
+                'extension': source.extension,
+            },
         )
     except infra_exceptions.InvalidMediaContentTypeError:
         pass
@@ -604,7 +673,9 @@ async def get_banner_pc_media(
 
     state_data = await state.get_data()
 
-    await state_data['msg'].edit_caption(
+    await message.bot.edit_message_caption(
+        chat_id=message.chat.id,
+        message_id=state_data['msg_id'],
         caption=add_banner_menu_text(targer_url=url, step_iteration=2),
         reply_markup=kb_builder.get_banners_return_menu_kb().as_markup(),
     )
@@ -623,10 +694,12 @@ async def get_banner_mobile_media(
     await message.delete()
 
     try:
-        media = await media_service.download_media(message=message)
+        media = media_service.get_source(message=message)
         state_data = await state.get_data()
 
-        await state_data['msg'].edit_caption(
+        await message.bot.edit_message_caption(
+            chat_id=message.chat.id,
+            message_id=state_data['msg_id'],
             caption=add_banner_menu_text(targer_url=state_data['target_url'], pc_media=media, step_iteration=3),
             reply_markup=kb_builder.get_banners_return_menu_kb().as_markup(),
         )
@@ -648,10 +721,12 @@ async def get_banner_display_priority(
     await message.delete()
 
     try:
-        media = await media_service.download_media(message=message)
+        media = media_service.get_source(message=message)
         state_data = await state.get_data()
 
-        await state_data['msg'].edit_caption(
+        await message.bot.edit_message_caption(
+            chat_id=message.chat.id,
+            message_id=state_data['msg_id'],
             caption=add_banner_menu_text(
                 targer_url=state_data['target_url'],
                 pc_media=state_data['pc_media'],
@@ -679,7 +754,9 @@ async def get_banner_save_action(
         display_priority = int(message.text)
         state_data = await state.get_data()
 
-        await state_data['msg'].edit_caption(
+        await message.bot.edit_message_caption(
+            chat_id=message.chat.id,
+            message_id=state_data['msg_id'],
             caption=add_banner_menu_text(
                 targer_url=state_data['target_url'],
                 pc_media=state_data['pc_media'],
@@ -699,7 +776,7 @@ async def proccess_update_banner_target_url(
         state: FSMContext,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
         interactor: FromDishka[UpdateBannerUrlInteractor],
-        config: FromDishka[Config],
+        media_urls: FromDishka[MediaUrlService],
 ):
     await message.delete()
     target_url = message.text
@@ -710,8 +787,13 @@ async def proccess_update_banner_target_url(
 
     banner = await interactor(banner_id=state_data['banner_id'], target_url=target_url)
 
-    await state_data['msg'].edit_caption(
-        caption=banner_details_text(banner=banner, minio_url=config.minio.url, bucket=config.minio.bucket),
+    await message.bot.edit_message_caption(
+        chat_id=message.chat.id,
+        message_id=state_data['msg_id'],
+        caption=banner_details_text(
+                banner=banner,
+                media_links=await media_urls.get_links(assets=media_urls.get_banner_assets(banner=banner)),
+            ),
         reply_markup=kb_builder.get_banner_edit_menu_kb(banner_id=state_data['banner_id'],
                                                         display_priority=banner.display_priority).as_markup(),
     )
@@ -721,25 +803,32 @@ async def proccess_update_banner_target_url(
 async def process_update_banner_pc_media(
         message: Message,
         state: FSMContext,
-        kb_builder: FromDishka[interfaces.KeyboardBuilder],
         media_service: FromDishka[MediaService],
-        interactor: FromDishka[UpdatePcBannerInteractor],
-        config: FromDishka[Config],
+        jobs: FromDishka[interfaces.JobQueue],
 ):
     await message.delete()
     try:
-        media = await media_service.download_media(message=message)
+        source = media_service.get_source(message=message)
         state_data = await state.get_data()
         await state.clear()
 
-        banner = await interactor(banner_id=state_data['banner_id'], media=media)
-
-        await state_data['msg'].edit_caption(
-            caption=banner_details_text(banner=banner, minio_url=config.minio.url, bucket=config.minio.bucket),
-            reply_markup=kb_builder.get_banner_edit_menu_kb(banner_id=state_data['banner_id'],
-                                                            display_priority=banner.display_priority).as_markup(),
+        await message.bot.edit_message_caption(
+            chat_id=message.chat.id,
+            message_id=state_data['msg_id'],
+            caption=media_upload_pending_text(),
+        )
+        await jobs.enqueue(
+            name=UPDATE_BANNER_MEDIA_JOB,
+            payload={
+                'chat_id': message.chat.id,
+                'msg_id': state_data['msg_id'],
+                'banner_id': state_data['banner_id'],
+                'media_name': BannerMediaName.PC,
+                'file_id': source.file_id,
+                'source_id': source.source_id,
+                'extension': source.extension,
+            },
         )
-
     except infra_exceptions.InvalidMediaContentTypeError:
         pass
 
@@ -748,25 +837,32 @@ async def process_update_banner_pc_media(
 async def process_update_banner_mobile_media(
         message: Message,
         state: FSMContext,
-        kb_builder: FromDishka[interfaces.KeyboardBuilder],
         media_service: FromDishka[MediaService],
-        interactor: FromDishka[UpdateMobileBannerInteractor],
-        config: FromDishka[Config],
+        jobs: FromDishka[interfaces.JobQueue],
 ):
     await message.delete()
     try:
-        media = await media_service.download_media(message=message)
+        source = media_service.get_source(message=message)
         state_data = await state.get_data()
         await state.clear()
 
-        banner = await interactor(banner_id=state_data['banner_id'], media=media)
-
-        await state_data['msg'].edit_caption(
-            caption=banner_details_text(banner=banner, minio_url=config.minio.url, bucket=config.minio.bucket),
-            reply_markup=kb_builder.get_banner_edit_menu_kb(banner_id=state_data['banner_id'],
-                                                            display_priority=banner.display_priority).as_markup(),
+        await message.bot.edit_message_caption(
+            chat_id=message.chat.id,
+            message_id=state_data['msg_id'],
+            caption=media_upload_pending_text(),
+        )
+        await jobs.enqueue(
+            name=UPDATE_BANNER_MEDIA_JOB,
+            payload={
+                'chat_id': message.chat.id,
+                'msg_id': state_data['msg_id'],
+                'banner_id': state_data['banner_id'],
+                'media_name': BannerMediaName.MOBILE,
+                'file_id': source.file_id,
+                'source_id': source.source_id,
+                'extension': source.extension,
+            },
         )
-
     except infra_exceptions.InvalidMediaContentTypeError:
         pass
 
@@ -777,7 +873,7 @@ async def process_update_banner_priority(
         state: FSMContext,
         kb_builder: FromDishka[interfaces.KeyboardBuilder],
         interactor: FromDishka[UpdateBannerDisplayPriorityInteractor],
-        config: FromDishka[Config]
+        media_urls: FromDishka[MediaUrlService],
 ):
     await message.delete()
     if message.text.isdigit():
@@ -786,8 +882,13 @@ async def process_update_banner_priority(
 
         banner = await interactor(banner_id=state_data['banner_id'], display_priority=display_priority)
 
-        await state_data['msg'].edit_caption(
-            caption=banner_details_text(banner=banner, minio_url=config.minio.url, bucket=config.minio.bucket),
+        await message.bot.edit_message_caption(
+            chat_id=message.chat.id,
+            message_id=state_data['msg_id'],
+            caption=banner_details_text(
+                banner=banner,
+                media_links=await media_urls.get_links(assets=media_urls.get_banner_assets(banner=banner)),
+            ),
             reply_markup=kb_builder.get_banner_edit_menu_kb(banner_id=state_data['banner_id'],
                                                             display_priority=banner.display_priority).as_markup(),
         )
@@ -0,0 +1,213 @@
+from collections.abc import Mapping
+from functools import partial
+from typing import Any
+
+from aiogram import Bot
+from dishka import AsyncContainer
+
+from backend.application import interfaces
+from backend.application.services.media import MediaUrlService
+from backend.application.use_cases.banner import (
+    SaveBannerInteractor,
+    UpdateMobileBannerInteractor,
+    UpdatePcBannerInteractor,
+)
+from backend.application.use_cases.store import (
+    SaveStoreInteractor,
+    UpdateStoreMainMediaMobileInteractor,
+    UpdateStoreMainMediaPcInteractor,
+    UpdateStorePrevieMediaMobileInteractor,
+    UpdateStorePrevieMediaPcInteractor,
+)
+from backend.domain.entities.media import BannerMediaName, MediaSource, MediaType, StoreMediaName
+from backend.domain.templates.exceptions_text import (
+    banner_save_failed_error_text,
+    media_upload_failed_error_text,
+    store_save_failed_error_text,
+)
+from backend.domain.templates.menu_texts import (
+    banner_details_text,
+    store_details_menu_text,
+    success_banner_save_text,
+    success_store_save_text,
+)
+from backend.infrastructure.jobs.redis_stream import JobHandler
+from backend.infrastructure.services.bot.media.media_service import MediaService
+
+SAVE_STORE_JOB = 'save_store'
+SAVE_BANNER_JOB = 'save_banner'
+UPDATE_STORE_MEDIA_JOB = 'update_store_media'
+UPDATE_BANNER_MEDIA_JOB = 'update_banner_media'
+
+STORE_MEDIA_INTERACTORS = {
+    StoreMediaName.PC_PREVIEW: UpdateStorePrevieMediaPcInteractor,
+    StoreMediaName.MOBILE_PREVIEW: UpdateStorePrevieMediaMobileInteractor,
+    StoreMediaName.PC_MAIN: UpdateStoreMainMediaPcInteractor,
+    StoreMediaName.MOBILE_MAIN: UpdateStoreMainMediaMobileInteractor,
+}
+
+STORE_MEDIA_FIELDS = ('preview_media_pc', 'preview_media_mobile', 'main_media_pc', 'main_media_mobile')
+BANNER_MEDIA_FIELDS = ('pc_media', 'mobile_media')
+
+BANNER_MEDIA_INTERACTORS = {
+    BannerMediaName.PC: UpdatePcBannerInteractor,
+    BannerMediaName.MOBILE: UpdateMobileBannerInteractor,
+}
+
+
+def media_source_from_payload(payload: Mapping[str, Any]) -> MediaSource:
+    return MediaSource(
+        file_id=payload['file_id'],
+        source_id=payload['source_id'],
+        extension=MediaType(payload['extension']),
+    )
+
+
+async def process_save_store_job(container: AsyncContainer, payload: Mapping[str, Any]) -> None:
+    async with container() as request_container:
+        bot = await request_container.get(Bot)
+        kb_builder = await request_container.get(interfaces.KeyboardBuilder)
+        media_service = await request_container.get(MediaService)
+        interactor = await request_container.get(SaveStoreInteractor)
+
+        try:
+            media = {field: await media_service.upload(bot=bot, source=payload[field]) for field in STORE_MEDIA_FIELDS}
+            await interactor(
+                store_id=payload['store_id'],
+                title=payload['title'],
+                description=payload['description'],
+                cities=payload['cities'],
+                categories=payload['categories'],
+                main_page_url=payload['main_url'],
+                resources_url=payload['resources_url'],
+                preview_media_pc=media['preview_media_pc'],
+                preview_media_mobile=media['preview_media_mobile'],
+                main_media_pc=media['main_media_pc'],
+                main_media_mobile=media['main_media_mobile'],
+                display_priority=payload['display_priority'],
+            )
+        except Exception:
+            await bot.edit_message_caption(
+                chat_id=payload['chat_id'],
+                message_id=payload['msg_id'],
+                caption=store_save_failed_error_text(),
+                reply_markup=kb_builder.get_stores_menu_kb().as_markup(),
+            )
+            raise
+
+        await bot.edit_message_caption(
+            chat_id=payload['chat_id'],
+            message_id=payload['msg_id'],
+            caption=success_store_save_text(),
+            reply_markup=kb_builder.get_stores_menu_kb().as_markup(),
+        )
+
+
+async def process_save_banner_job(container: AsyncContainer, payload: Mapping[str, Any]) -> None:
+    async with container() as request_container:
+        bot = await request_container.get(Bot)
+        kb_builder = await request_container.get(interfaces.KeyboardBuilder)
+        media_service = await request_container.get(MediaService)
+        interactor = await request_container.get(SaveBannerInteractor)
+
+        try:
+            media = {field: await media_service.upload(bot=bot, source=payload[field]) for field in BANNER_MEDIA_FIELDS}
+            await interactor(
+                banner_id=payload['banner_id'],
+                target_url=payload['target_url'],
+                pc_media=media['pc_media'],
+                mobile_media=media['mobile_media'],
+                display_priority=payload['display_priority'],
+            )
+        except Exception:
+            await bot.edit_message_caption(
+                chat_id=payload['chat_id'],
+                message_id=payload['msg_id'],
+                caption=banner_save_failed_error_text(),
+                reply_markup=kb_builder.get_banners_menu_kb().as_markup(),
+            )
+            raise
+
+        await bot.edit_message_caption(
+            chat_id=payload['chat_id'],
+            message_id=payload['msg_id'],
+            caption=success_banner_save_text(),
+            reply_markup=kb_builder.get_banners_menu_kb().as_markup(),
+        )
+
+
+async def process_update_store_media_job(container: AsyncContainer, payload: Mapping[str, Any]) -> None:
+    async with container() as request_container:
+        bot = await request_container.get(Bot)
+        kb_builder = await request_container.get(interfaces.KeyboardBuilder)
+        media_service = await request_container.get(MediaService)
+        media_urls = await request_container.get(MediaUrlService)
+        interactor = await request_container.get(STORE_MEDIA_INTERACTORS[StoreMediaName(payload['media_name'])])
+
+        try:
+            media = await media_service.upload(bot=bot, source=media_source_from_payload(payload))
+            details = await interactor(store_id=payload['store_id'], media=media)
+        except Exception:
+            await bot.edit_message_caption(
+                chat_id=payload['chat_id'],
+                message_id=payload['msg_id'],
+                caption=media_upload_failed_error_text(),
+                reply_markup=kb_builder.get_stores_menu_kb().as_markup(),
+            )
+            raise
+
+        await bot.edit_message_caption(
+            chat_id=payload['chat_id'],
+            message_id=payload['msg_id'],
+            caption=store_details_menu_text(
+                details=details,
+                media_links=await media_urls.get_links(assets=media_urls.get_store_assets(store=details.store)),
+            ),
+            reply_markup=kb_builder.get_store_edit_menu_kb(
+                store_id=details.store.id,
+                display_priority=details.store.display_priority,
+            ).as_markup(),
+        )
+
+
+async def process_update_banner_media_job(container: AsyncContainer, payload: Mapping[str, Any]) -> None:
+    async with container() as request_container:
+        bot = await request_container.get(Bot)
+        kb_builder = await request_container.get(interfaces.KeyboardBuilder)
+        media_service = await request_container.get(MediaService)
+        media_urls = await request_container.get(MediaUrlService)
+        interactor = await request_container.get(BANNER_MEDIA_INTERACTORS[BannerMediaName(payload['media_name'])])
+
+        try:
+            media = await media_service.upload(bot=bot, source=media_source_from_payload(payload))
+            banner = await interactor(banner_id=payload['banner_id'], media=media)
+        except Exception:
+            await bot.edit_message_caption(
+                chat_id=payload['chat_id'],
+                message_id=payload['msg_id'],
+                caption=media_upload_failed_error_text(),
+                reply_markup=kb_builder.get_banners_menu_kb().as_markup(),
+            )
+            raise
+
+        await bot.edit_message_caption(
+            chat_id=payload['chat_id'],
+            message_id=payload['msg_id'],
+            caption=banner_details_text(
+                banner=banner,
+                media_links=await media_urls.get_links(assets=media_urls.get_banner_assets(banner=banner)),
+            ),
+            reply_markup=kb_builder.get_banner_edit_menu_kb(
+                banner_id=banner.id,
+                display_priority=banner.display_priority,
+            ).as_markup(),
+        )
+
+
+def get_job_handlers(container: AsyncContainer) -> dict[str, JobHandler]:
+    return {
+        SAVE_STORE_JOB: partial(process_save_store_job, container),
+        SAVE_BANNER_JOB: partial(process_save_banner_job, container),
+        UPDATE_STORE_MEDIA_JOB: partial(process_update_store_media_job, container),
+        UPDATE_BANNER_MEDIA_JOB: partial(process_update_banner_media_job, container),
+    }
@@ -7,4 +7,5 @@ EXCEPTIONS_MAPPING = {
     domain_exceptions.BannersNotFoundError: exception_handlers.banners_not_found_exception_handler,
     domain_exceptions.CitiesNotFoundError: exception_handlers.cities_not_found_exception_handler,
     domain_exceptions.CategoriesNotFoundError: exception_handlers.categories_not_found_exception_handler,
+    domain_exceptions.InvalidPaginationCursorError: exception_handlers.invalid_pagination_cursor_exception_handler,
 }
@@ -0,0 +1,166 @@
+"""Compare the store details query before and after the per-relation subquery rewrite.
+
+Seeds a synthetic store with the requested fan-out inside a transaction that is rolled back afterwards,
+then reports the peak intermediate row count from ``EXPLAIN ANALYZE`` and the query latency for both variants.
+
+    python -m benchmarks.store_details --cities 20 --categories 15 --resources 10
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from collections.abc import Iterator
+from uuid import UUID, uuid4
+
+from psycopg import AsyncConnection
+
+from backend.config import PgConfig
+from backend.infrastructure.repository.store import STORE_DETAILS_QUERY
+
+LEGACY_STORE_DETAILS_QUERY = (
+    'SELECT '
+    '    s.id AS store_id, '
+    '    s.title AS store_title, '
+    '    s.description, '
+    '    s.preview_media_type, '
+    '    s.main_media_type, '
+    '    s.main_page_url, '
+    '    s.display_priority, '
+    '    COALESCE( '
+    '        json_agg( '
+    "            DISTINCT jsonb_build_object('id', c.id, 'title', c.title) "
+    '        ) FILTER (WHERE c.id IS NOT NULL), '
+    "        '[]' "
+    '    ) AS cities, '
+    '    COALESCE( '
+    '        json_agg( '
+    "            DISTINCT jsonb_build_object('id', cat.id, 'title', cat.title) "
+    '        ) FILTER (WHERE cat.id IS NOT NULL), '
+    "        '[]' "
+    '    ) AS categories, '
+    '    COALESCE( '
+    '        json_agg( '
+    '            DISTINCT '
+    "jsonb_build_object('id', sr.id, 'title', sr.title, 'target_url', sr.target_url, 'store_id', sr.store_id) "
+    '        ) FILTER (WHERE sr.id IS NOT NULL), '
+    "        '[]' "
+    '    ) AS resources '
+    'FROM stores AS s '
+    'LEFT JOIN stores_cities AS sc ON s.id = sc.store_id '
+    'LEFT JOIN cities AS c ON sc.city_id = c.id '
+    'LEFT JOIN stores_categories AS sc2 ON s.id = sc2.store_id '
+    'LEFT JOIN categories AS cat ON sc2.category_id = cat.id '
+    'LEFT JOIN store_resources AS sr ON sr.store_id = s.id '
+    'WHERE s.id = %s '
+    'GROUP BY s.id'
+)
+
+QUERIES = {
+    'left join': LEGACY_STORE_DETAILS_QUERY,
+    'subqueries': f'{STORE_DETAILS_QUERY} WHERE s.id = %s',
+}
+
+
+async def seed_store(conn: AsyncConnection, cities: int, categories: int, resources: int) -> UUID:
+    store_id = uuid4()
+    city_ids = [uuid4() for _ in range(cities)]
+    category_ids = [uuid4() for _ in range(categories)]
+
+    async with conn.cursor() as cursor:
+        await cursor.execute(
+            'INSERT INTO stores '
+            '(id, title, description, preview_media_type, main_media_type, main_page_url, display_priority) '
+            "VALUES (%s, %s, %s, 'png', 'png', %s, 0)",
+            (store_id, f'bench-{store_id.hex[:8]}', 'benchmark store', 'https://example.com'),
+        )
+        await cursor.executemany(
+            'INSERT INTO cities (id, title) VALUES (%s, %s)',
+            [(city_id, f'bench-city-{city_id.hex[:12]}') for city_id in city_ids],
+        )
+        await cursor.executemany(
+            'INSERT INTO categories (id, title) VALUES (%s, %s)',
+            [(category_id, f'bench-category-{category_id.hex[:12]}') for category_id in category_ids],
+        )
+        await cursor.executemany(
+            'INSERT INTO stores_cities (id, store_id, city_id) VALUES (%s, %s, %s)',
+            [(uuid4(), store_id, city_id) for city_id in city_ids],
+        )
+        await cursor.executemany(
+            'INSERT INTO stores_categories (id, store_id, category_id) VALUES (%s, %s, %s)',
+            [(uuid4(), store_id, category_id) for category_id in category_ids],
+        )
+        await cursor.executemany(
+            'INSERT INTO store_resources (id, title, target_url, store_id) VALUES (%s, %s, %s, %s)',
+            [(uuid4(), f'resource-{i}', f'https://example.com/{i}', store_id) for i in range(resources)],
+        )
+        await cursor.execute('ANALYZE stores, cities, categories, stores_cities, stores_categories, store_resources')
+
+    return store_id
+
+
+def walk_plan(node: dict) -> Iterator[dict]:
+    yield node
+    for child in node.get('Plans', ()):
+        yield from walk_plan(child)
+
+
+async def explain(conn: AsyncConnection, query: str, store_id: UUID) -> tuple[int, float]:
+    async with conn.cursor() as cursor:
+        await cursor.execute(f'EXPLAIN (ANALYZE, FORMAT JSON) {query}', (store_id,))
+        (result,) = await cursor.fetchone()
+
+    plan = (json.loads(result) if isinstance(result, str) else result)[0]
+    peak_rows = max(node['Actual Rows'] * node['Actual Loops'] for node in walk_plan(plan['Plan']))
+    return peak_rows, plan['Execution Time']
+
+
+async def measure(conn: AsyncConnection, query: str, store_id: UUID, runs: int) -> list[float]:
+    timings = []
+    async with conn.cursor() as cursor:
+        for _ in range(runs):
+            started = time.perf_counter()
+            await cursor.execute(query, (store_id,))
+            await cursor.fetchone()
+            timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+async def main(args: argparse.Namespace) -> None:
+    async with await AsyncConnection.connect(PgConfig().create_connection_string()) as conn:
+        store_id = await seed_store(
+            conn=conn,
+            cities=args.cities,
+            categories=args.categories,
+            resources=args.resources,
+        )
+
+        sys.stdout.write(
+            f'fan-out: {args.cities} cities x {args.categories} categories x {args.resources} resources, '
+            f'{args.runs} runs\n\n',
+        )
+        sys.stdout.write(f'{"variant":<12} {"peak rows":>10} {"plan ms":>9} {"p50 ms":>8} {"p95 ms":>8}\n')
+
+        for name, query in QUERIES.items():
+            peak_rows, plan_ms = await explain(conn=conn, query=query, store_id=store_id)
+            timings = await measure(conn=conn, query=query, store_id=store_id, runs=args.runs)
+            p50 = statistics.median(timings)
+            p95 = statistics.quantiles(timings, n=20)[-1] if len(timings) > 1 else p50
+            sys.stdout.write(f'{name:<12} {peak_rows:>10} {plan_ms:>9.3f} {p50:>8.3f} {p95:>8.3f}\n')
+
+        await conn.rollback()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--cities', type=int, default=20)
+    parser.add_argument('--categories', type=int, default=15)
+    parser.add_argument('--resources', type=int, default=10)
+    parser.add_argument('--runs', type=int, default=200)
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,6 @@
+-- +migrate Up
+create index ix_stores_display_priority_id on stores (display_priority desc, id desc);
+
+
+-- +migrate Down
+drop index if exists ix_stores_display_priority_id;
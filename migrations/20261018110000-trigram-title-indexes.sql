@@ -0,0 +1,10 @@
+-- +migrate Up
+create extension if not exists pg_trgm;
+
+create index ix_stores_title_trgm on stores using gin (title gin_trgm_ops);
+create index ix_cities_title_trgm on cities using gin (title gin_trgm_ops);
+
+
+-- +migrate Down
+drop index if exists ix_cities_title_trgm;
+drop index if exists ix_stores_title_trgm;
@@ -0,0 +1,30 @@
+-- +migrate Up
+delete from stores_cities a
+    using stores_cities b
+where a.store_id = b.store_id
+  and a.city_id = b.city_id
+  and a.id > b.id;
+
+delete from stores_categories a
+    using stores_categories b
+where a.store_id = b.store_id
+  and a.category_id = b.category_id
+  and a.id > b.id;
+
+create unique index ux_stores_cities_store_city on stores_cities (store_id, city_id);
+create index ix_stores_cities_city_store on stores_cities (city_id, store_id);
+
+create unique index ux_stores_categories_store_category on stores_categories (store_id, category_id);
+create index ix_stores_categories_category_store on stores_categories (category_id, store_id);
+
+create index ix_store_resources_store_id on store_resources (store_id);
+
+
+-- +migrate Down
+drop index if exists ix_store_resources_store_id;
+
+drop index if exists ix_stores_categories_category_store;
+drop index if exists ux_stores_categories_store_category;
+
+drop index if exists ix_stores_cities_city_store;
+drop index if exists ux_stores_cities_store_city;
@@ -0,0 +1,32 @@
+-- +migrate Up
+create table media_objects
+(
+    digest       char(64) primary key,
+    extension    media_type  not null,
+    size         bigint      not null,
+    derivatives  text[]      not null default '{}',
+    last_used_at timestamptz not null default now()
+);
+
+create table media_sources
+(
+    source_id text primary key,
+    digest    char(64) not null references media_objects (digest) on delete cascade
+);
+
+create table media_references
+(
+    owner_id   uuid        not null,
+    media_name varchar(32) not null,
+    digest     char(64)    not null references media_objects (digest),
+    primary key (owner_id, media_name)
+);
+
+create index ix_media_references_digest on media_references (digest);
+create index ix_media_objects_last_used_at on media_objects (last_used_at);
+
+
+-- +migrate Down
+drop table if exists media_references;
+drop table if exists media_sources;
+drop table if exists media_objects;
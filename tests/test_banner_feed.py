@@ -0,0 +1,58 @@
+import asyncio
+import json
+from collections.abc import Collection, Mapping
+from uuid import uuid4
+
+from backend.application.services.media import MediaUrlService
+from backend.domain.entities.banner import Banner
+from backend.domain.entities.cache import CacheStats
+from backend.domain.entities.media import MediaType
+from backend.infrastructure.mapper.banner import BannerMapper
+from backend.presentation.api.routers.banners.schemas import BannerReponseSchema, BannersReponseSchema
+
+
+class StaticSigner:
+    def get_window(self) -> int:
+        return 0
+
+    async def sign_many(self, file_names: Collection[str]) -> Mapping[str, str]:
+        return {file_name: f'https://cdn.example/{file_name}?signature=1' for file_name in file_names}
+
+    def get_stats(self) -> CacheStats:
+        return CacheStats(name='signer', hits=0, misses=0)
+
+
+def test_signed_feed_matches_public_schema():
+    media_urls = MediaUrlService(signer=StaticSigner())
+    mapper = BannerMapper(media_urls=media_urls)
+    banners = [
+        Banner(
+            id=uuid4(),
+            media_type=MediaType.PNG,
+            target_url='https://example.com',
+            display_priority=1,
+            media_files={'pc-banner': 'abc.png'},
+            media_derivatives={'pc-banner': ['640w.webp', '320w.avif', '320w.webp']},
+        ),
+        Banner(id=uuid4(), media_type=MediaType.GIF, target_url='https://example.org', display_priority=0),
+    ]
+    feed = f'{{"banners": [{", ".join(mapper.entity_to_json(banner) for banner in banners)}]}}'.encode()
+
+    signed = asyncio.run(media_urls.sign_banners_feed(feed=feed))
+
+    feed_schema = BannersReponseSchema.model_validate_json(signed)
+    pc_media, mobile_media = feed_schema.banners[0].media
+    assert [(variant.width, variant.format) for variant in pc_media.variants] == [
+        (320, 'avif'),
+        (320, 'webp'),
+        (640, 'webp'),
+    ]
+    assert mobile_media.variants == []
+    assert all(item.variants == [] for item in feed_schema.banners[1].media)
+    for banner in json.loads(signed)['banners']:
+        assert set(banner) == set(BannerReponseSchema.model_fields)
+        for item in banner['media']:
+            assert 'file_name' not in item
+            assert item['url'].startswith('https://cdn.example/')
+            for variant in item['variants']:
+                assert set(variant) == {'width', 'format', 'url'}
@@ -0,0 +1,59 @@
+import asyncio
+from collections.abc import Mapping
+from types import SimpleNamespace
+from typing import Any
+
+from backend.config import JobsConfig
+from backend.infrastructure import serialization
+from backend.infrastructure.jobs.redis_stream import RedisJobWorker
+
+
+class RecordingClient:
+    def __init__(self):
+        self.acked: list[bytes] = []
+        self.claimed: list[list[bytes]] = []
+        self.renewals = 0
+
+    def register_script(self, _: str) -> 'RecordingClient':
+        return self
+
+    async def __call__(self, **_) -> list[int]:
+        self.renewals += 1
+        return [0]
+
+    async def xack(self, *args) -> None:
+        self.acked.append(args[-1])
+
+    async def xclaim(self, *_, **kwargs) -> list[bytes]:
+        self.claimed.append(sorted(kwargs['message_ids']))
+        return kwargs['message_ids']
+
+
+def make_entry(entry_id: bytes, chat_id: int, step: int) -> tuple[str, bytes, dict[bytes, bytes]]:
+    return 'jobs:0', entry_id, {
+        b'name': b'job',
+        b'payload': serialization.dumps({'chat_id': chat_id, 'step': step}).encode(),
+        b'key': str(chat_id).encode(),
+    }
+
+
+def test_batch_keeps_chat_order_and_extends_claims():
+    client = RecordingClient()
+    worker = RedisJobWorker(client=client, config=SimpleNamespace(jobs=JobsConfig(claim_idle=0.03)))
+    events = []
+
+    async def handler(payload: Mapping[str, Any]) -> None:
+        events.append(('start', payload['chat_id'], payload['step']))
+        await asyncio.sleep(0.03 if payload['step'] == 1 else 0.001)
+        events.append(('end', payload['chat_id'], payload['step']))
+
+    entries = [make_entry(b'1-0', 1, 1), make_entry(b'2-0', 2, 1), make_entry(b'3-0', 1, 2)]
+    asyncio.run(worker._handle_batch({'job': handler}, entries))
+
+    chat_one = [event for event in events if event[1] == 1]
+    assert chat_one == [('start', 1, 1), ('end', 1, 1), ('start', 1, 2), ('end', 1, 2)]
+    assert events[:2] == [('start', 1, 1), ('start', 2, 1)]
+    assert sorted(client.acked) == [b'1-0', b'2-0', b'3-0']
+    assert client.claimed
+    assert client.renewals
+    assert all(b'1-0' in claimed or b'3-0' in claimed for claimed in client.claimed)
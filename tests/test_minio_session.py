@@ -0,0 +1,64 @@
+import asyncio
+import io
+
+import aiohttp
+from aiohttp import web
+from miniopy_async.commonconfig import CopySource
+
+from backend.infrastructure.services.s3.minio import PooledMinio
+
+COPY_RESULT = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<CopyObjectResult><ETag>"copied"</ETag><LastModified>2024-01-01T00:00:00.000Z</LastModified></CopyObjectResult>'
+)
+
+
+async def run_uploads() -> tuple[list[str], list[str]]:
+    served_requests = []
+
+    async def handle(request: web.Request) -> web.Response:
+        await request.read()
+        served_requests.append(request.method)
+        if 'x-amz-copy-source' in request.headers:
+            return web.Response(text=COPY_RESULT, content_type='application/xml', headers={'ETag': '"copied"'})
+        return web.Response(headers={'ETag': '"written"'})
+
+    app = web.Application()
+    app.router.add_route('*', '/{tail:.*}', handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    pooled_requests = []
+
+    async def on_request_start(*args) -> None:
+        pooled_requests.append(args[-1].method)
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    session = aiohttp.ClientSession(trace_configs=[trace_config])
+    client = PooledMinio(
+        endpoint=f'127.0.0.1:{port}',
+        access_key='access',
+        secret_key='secret',
+        secure=False,
+        region='us-east-1',
+        session=session,
+    )
+    try:
+        await client.put_object('bucket', 'object.png', io.BytesIO(b'data'), length=4)
+        await client.copy_object('bucket', 'copy.png', CopySource('bucket', 'object.png'))
+    finally:
+        await session.close()
+        await runner.cleanup()
+
+    return pooled_requests, served_requests
+
+
+def test_put_and_copy_use_pooled_session():
+    pooled_requests, served_requests = asyncio.run(run_uploads())
+
+    assert served_requests == ['PUT', 'HEAD', 'PUT']
+    assert pooled_requests == served_requests